@@ -0,0 +1,57 @@
+import time
+from typing import Any, Dict, Optional
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a failing dependency for a cool-down period.
+
+    After failure_threshold consecutive failures the breaker opens and allow()
+    returns False, so callers skip the dependency instead of waiting for a
+    timeout. Once the cool-down has passed a single call is let through as a
+    probe: its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, cool_down: float):
+        self.failure_threshold = failure_threshold
+        self.cool_down = cool_down
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.cool_down:
+            return "half_open"
+
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+
+        if state == "half_open":
+            # re-arm so only this caller probes until it reports back
+            self.opened_at = time.monotonic()
+
+        return state != "open"
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+        }
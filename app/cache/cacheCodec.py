@@ -0,0 +1,247 @@
+import orjson
+from uuid import UUID
+from enum import Enum
+from decimal import Decimal
+from datetime import date, datetime, time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy import inspect
+
+from app.db.dbDeclarative import Base
+from app.modules.common.models.model_meta import model_meta_registry
+
+# type tags written per column in the payload header
+TAG_UUID = "u"
+TAG_DECIMAL = "n"
+TAG_DATETIME = "dt"
+TAG_DATE = "d"
+TAG_TIME = "t"
+TAG_ENUM = "e"
+
+Decoder = Optional[Callable[[Any], Any]]
+
+
+class EntityCodec:
+    """
+    Encodes a loaded ORM object graph for the cache and rebuilds it on a hit.
+
+    The graph is stored as a flat object table so shared and cyclic references
+    (User -> Role -> User) survive. Only loaded columns and relationships are
+    written. Rebuilt objects are detached (they carry their identity key), so
+    they serialize like the originals and can be merged into a session, but
+    never trigger lazy loads.
+
+    The payload is encoded in one orjson pass:
+
+        {"shapes": [[model, [columns], [type tags], [relationships]], ...],
+         "objects": [[shape, [column values], [relationship refs]], ...],
+         "root": ref | [refs] | null}
+
+    Each distinct (model, loaded attributes) shape is written once, so objects
+    are plain value arrays. The type tags say how to restore values that JSON
+    has no type for (UUID, Decimal, dates and times, enums); the decoders for a
+    shape are compiled once from the tags and the mapper.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, Type[Any]] = {}
+        self._column_tags: Dict[Type[Any], Dict[str, str]] = {}
+        self._shape_decoders: Dict[Tuple[Any, ...], List[Decoder]] = {}
+
+    def get_model(self, name: str) -> Type[Any]:
+        if name not in self._models:
+            self._models = {
+                mapper.class_.__name__: mapper.class_
+                for mapper in Base.registry.mappers
+            }
+
+        return self._models[name]
+
+    def encode_value(self, value: Any) -> Any:
+        # orjson natively handles UUID, datetime, date, time and Enum
+        if isinstance(value, Decimal):
+            return str(value)
+
+        raise TypeError(f"Cannot cache value of type {type(value)}")
+
+    def encode(self, data: Dict[str, Any]) -> str:
+        # stored as str: the redis client is configured with decode_responses
+        return orjson.dumps(data, default=self.encode_value).decode()
+
+    def decode(self, payload: Union[str, bytes]) -> Dict[str, Any]:
+        return orjson.loads(payload)
+
+    def get_column_tags(self, model: Type[Any]) -> Dict[str, str]:
+        """Type tag of every column of model that needs one to be decoded."""
+        if model not in self._column_tags:
+            tags = {}
+
+            for attr in inspect(model).column_attrs:
+                try:
+                    python_type = attr.columns[0].type.python_type
+                except NotImplementedError:
+                    continue
+
+                if issubclass(python_type, Enum):
+                    tags[attr.key] = TAG_ENUM
+                elif issubclass(python_type, datetime):
+                    tags[attr.key] = TAG_DATETIME
+                elif issubclass(python_type, date):
+                    tags[attr.key] = TAG_DATE
+                elif issubclass(python_type, time):
+                    tags[attr.key] = TAG_TIME
+                elif issubclass(python_type, UUID):
+                    tags[attr.key] = TAG_UUID
+                elif issubclass(python_type, Decimal):
+                    tags[attr.key] = TAG_DECIMAL
+
+            self._column_tags[model] = tags
+
+        return self._column_tags[model]
+
+    def get_decoder(self, model: Type[Any], column: str, tag: str) -> Decoder:
+        if tag == TAG_UUID:
+            return UUID
+        if tag == TAG_DECIMAL:
+            return Decimal
+        if tag == TAG_DATETIME:
+            return datetime.fromisoformat
+        if tag == TAG_DATE:
+            return date.fromisoformat
+        if tag == TAG_TIME:
+            return time.fromisoformat
+        if tag == TAG_ENUM:
+            return inspect(model).column_attrs[column].columns[0].type.python_type
+
+        return None
+
+    def get_shape_decoders(
+        self, model: Type[Any], columns: List[str], tags: List[str]
+    ) -> List[Decoder]:
+        shape = (model, tuple(columns), tuple(tags))
+
+        if shape not in self._shape_decoders:
+            self._shape_decoders[shape] = [
+                self.get_decoder(model, column, tag)
+                for column, tag in zip(columns, tags)
+            ]
+
+        return self._shape_decoders[shape]
+
+    def dumps(self, value: Union[Any, List[Any], None]) -> str:
+        shapes: List[List[Any]] = []
+        shape_index: Dict[Tuple[Any, ...], int] = {}
+        objects: List[List[Any]] = []
+        refs: Dict[int, int] = {}
+
+        def ref(obj: Any) -> int:
+            if id(obj) in refs:
+                return refs[id(obj)]
+
+            refs[id(obj)] = len(objects)
+            entry: List[Any] = [0, None, None]
+            objects.append(entry)
+
+            model = type(obj)
+            loaded = inspect(obj).dict
+            meta = model_meta_registry.get(model)
+            columns = [key for key in meta.column_keys if key in loaded]
+            relationships = [key for key in meta.relationship_keys if key in loaded]
+
+            signature = (model, tuple(columns), tuple(relationships))
+            if signature not in shape_index:
+                column_tags = self.get_column_tags(model)
+                shape_index[signature] = len(shapes)
+                shapes.append(
+                    [
+                        model.__name__,
+                        columns,
+                        [column_tags.get(key, "") for key in columns],
+                        relationships,
+                    ]
+                )
+
+            entry[0] = shape_index[signature]
+            entry[1] = [loaded[key] for key in columns]
+            entry[2] = [
+                None
+                if loaded[key] is None
+                else [ref(item) for item in loaded[key]]
+                if isinstance(loaded[key], (list, set, tuple))
+                else ref(loaded[key])
+                for key in relationships
+            ]
+
+            return refs[id(obj)]
+
+        if value is None:
+            root = None
+        elif isinstance(value, (list, tuple)):
+            root = [ref(obj) for obj in value]
+        else:
+            root = ref(value)
+
+        return self.encode({"shapes": shapes, "objects": objects, "root": root})
+
+    def loads(self, payload: Union[str, bytes]) -> Optional[Union[Any, List[Any]]]:
+        data = self.decode(payload)
+        shapes = [
+            (
+                self.get_model(name),
+                columns,
+                self.get_shape_decoders(self.get_model(name), columns, tags),
+                relationships,
+            )
+            for name, columns, tags, relationships in data["shapes"]
+        ]
+        instances = []
+
+        for shape, values, _ in data["objects"]:
+            model, columns, decoders, _ = shapes[shape]
+            instance = inspect(model).class_manager.new_instance()
+
+            # a fresh instance has no history: populate its dict the way the
+            # ORM loader does instead of committing attribute by attribute
+            instance.__dict__.update(
+                (
+                    key,
+                    decoder(value)
+                    if decoder is not None and value is not None
+                    else value,
+                )
+                for key, decoder, value in zip(columns, decoders, values)
+            )
+            instances.append(instance)
+
+        for instance, (shape, _, related) in zip(instances, data["objects"]):
+            model, _, _, relationships = shapes[shape]
+
+            for key, value in zip(relationships, related):
+                if isinstance(value, list):
+                    # collections need their instrumented adapter
+                    set_committed_value(
+                        instance, key, [instances[index] for index in value]
+                    )
+                else:
+                    instance.__dict__[key] = (
+                        instances[value] if value is not None else None
+                    )
+
+            for key in model_meta_registry.get(model).collection_keys:
+                if key in relationships:
+                    getattr(instance, key).set_parent(instance)
+
+            make_transient_to_detached(instance)
+
+        root = data["root"]
+        if root is None:
+            return None
+        if isinstance(root, list):
+            return [instances[index] for index in root]
+
+        return instances[root]
+
+
+# create entity codec
+entity_codec = EntityCodec()
@@ -0,0 +1,130 @@
+import time
+from collections import Counter
+from typing import Any, Dict, List
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, with_parent
+from sqlalchemy.orm.attributes import set_committed_value
+
+# core
+from app.core.config import settings
+
+# cache
+from app.cache.cacheCodec import EntityCodec, entity_codec
+from app.cache.cacheTier import TwoTierCache, model_cache
+
+# models
+from app.modules.common.models.model_meta import model_meta_registry
+from app.modules.common.models.model_base_collection import (
+    STAGED_COLLECTIONS,
+    BaseModelCollection,
+)
+
+
+class CollectionCache:
+    """
+    Read-through cache of relationship collections (User.roles,
+    Questionnaire.questions, ...), one entry per (parent table, parent primary
+    key, relationship) holding the children's columns.
+
+    Entries are shared: they live in Redis only when it is reachable, and are
+    deleted by key once a write that changed the collection has committed (see
+    BaseModelCollection.stage_invalidation), so every process stops serving
+    them at once. Each entry also records the generation of the child model,
+    so writes to the children themselves retire it as well.
+    """
+
+    def __init__(self, cache: TwoTierCache, codec: EntityCodec, expiry: int):
+        self.cache = cache
+        self.codec = codec
+        self.expiry = expiry
+        self.stats: Counter = Counter()
+
+    async def load(
+        self,
+        db_session: AsyncSession,
+        parent: Any,
+        relationship: str,
+        cached: bool = True,
+    ) -> List[Any]:
+        """
+        Load parent's relationship and set it on parent.
+
+        Args:
+            db_session (AsyncSession): Session used on a miss.
+            parent (Any): A persistent or detached ORM object.
+            relationship (str): Name of a list relationship on parent.
+            cached (bool): Whether the cache may be used (False on write sessions).
+
+        Returns:
+            List[Any]: The children, with their own relationships left empty (as
+            include= loads them).
+        """
+        prop = inspect(type(parent)).relationships[relationship]
+        key = BaseModelCollection.cache_key(parent, relationship)
+        cached = cached and bool(self.expiry) and key is not None
+        items = None
+
+        if cached:
+            (generation,) = await self.cache.get_generations(
+                [prop.mapper.class_.__name__]
+            )
+            entry = await self.cache.get(key, shared=True)
+
+            if entry is not None:
+                version, _, payload = entry.value.partition("|")
+                # entries are kept past their expiry (see TwoTierCache.set)
+                if version == str(generation) and entry.expires > time.time():
+                    self.stats["hits"] += 1
+                    items = self.codec.loads(payload)
+                else:
+                    self.stats["stale"] += 1
+
+        if items is None:
+            started = time.perf_counter()
+            query = (
+                select(prop.mapper.class_)
+                .where(with_parent(parent, prop))
+                .options(noload("*"))
+            )
+            if prop.order_by:
+                query = query.order_by(*prop.order_by)
+            items = list((await db_session.execute(query)).scalars().all())
+
+            if cached:
+                self.stats["misses"] += 1
+                await self.cache.set(
+                    key,
+                    f"{generation}|{self.codec.dumps(items)}",
+                    self.expiry,
+                    delta=time.perf_counter() - started,
+                    shared=True,
+                )
+
+        set_committed_value(parent, relationship, items)
+        if relationship in model_meta_registry.get(type(parent)).collection_keys:
+            getattr(parent, relationship).set_parent(parent)
+
+        return items
+
+    def pop_staged(self, db_session: AsyncSession) -> List[str]:
+        """Keys of the collections changed by the session's committed writes."""
+        keys = sorted(db_session.info.pop(STAGED_COLLECTIONS, ()))
+        self.stats["invalidations"] += len(keys)
+
+        return keys
+
+    def get_stats(self) -> Dict[str, Any]:
+        # stale entries are counted as misses too
+        lookups = self.stats["hits"] + self.stats["misses"]
+
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 4) if lookups else None,
+        }
+
+
+# create collection cache
+collection_cache = CollectionCache(
+    model_cache, entity_codec, expiry=settings.CACHE_COLLECTION_TTL
+)
@@ -1,25 +1,71 @@
 import json
+import time
+import asyncio
+import hashlib
 from uuid import UUID
-from sqlalchemy import Enum
-from decimal import Decimal
-from datetime import datetime
 from pydantic import BaseModel
-from sqlalchemy.inspection import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import inspect
 from sqlalchemy.orm import InstrumentedAttribute
-from sqlalchemy.ext.declarative import DeclarativeMeta
-from typing import Any, Dict, Optional, Union, Type, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union, Type
 
 # db
+from app.db.dbModule import WriteSession
 from app.db.dbCrud import DBOperations, DBModelType
 
+# models
+from app.modules.common.models.model_base import STAGED_MODELS
+
 # core
 from app.core.config import settings
-from app.core.lifespan import cache_manager
-from app.core.serializer import JSONSerializer
+from app.core.errors import RecordNotFoundException
+
+# cache
+from app.cache.cacheFlight import SingleFlight, cache_flight
+from app.cache.cacheCollection import CollectionCache, collection_cache
+from app.cache.cacheCodec import EntityCodec, entity_codec
+from app.cache.cacheTier import CacheEntry, TwoTierCache, model_cache
+
+# marks a payload that was not built by this caller (nothing to reuse but the payload)
+NOT_LOADED = object()
 
 
 class DBOperationsWithCache(DBOperations):
+    """
+    DBOperations with a read-through cache for get, get_all and query.
+
+    Caching is opt-in: it is only active when the DAO declares a cache_expiry
+    (seconds). Only reads on read sessions (see DBModule.get_read_db) are
+    served from the cache, so writes, and reads inside a client's
+    read-your-writes window, always see the database.
+
+    Every key embeds the generations of the DAO's cache_tags: its own model, the
+    models it loads by default and, following detail_mappings, the models its
+    nested writes touch. A write bumps the generation of the written model only
+    (see after_write), which retires every cached item, page and query result
+    that depends on it without scanning keys.
+
+    Rebuilds are single-flight: concurrent misses on one key in a process share
+    one database read, and a short Redis lock lease lets one process per
+    cluster rebuild while the others serve the stale entry or wait for the new
+    one. Entries are also refreshed shortly before they expire, by one reader
+    picked at random (see CacheEntry.should_refresh), so hot keys rarely expire
+    at all.
+
+    With negative_cache_expiry set, lookups that found nothing (get by primary
+    key, or a single-row query on one of negative_cache_keys) are remembered
+    for that many seconds, on read and write sessions alike, and answered
+    without a query. Writes delete the negative entries of the rows they touch,
+    so a created record is found right away.
+
+    Collections changed by a write (see BaseModelCollection) are dropped from
+    the collection cache in the same round trip; get_collection reads them
+    through it, and cached detail reads load the list relationships named by
+    include= that way.
+    """
+
+    lock_poll_interval: float = 0.05
+
     def __init__(
         self,
         model: Type[DBModelType],
@@ -27,7 +73,8 @@ class DBOperationsWithCache(DBOperations):
         model_entity_params: Optional[Dict[str, Any]] = {},
         excludes: Optional[List[str]] = [],
         model_registry: Optional[Dict[str, Type[BaseModel]]] = None,
-        cache_expiry: Optional[int] = 300,
+        cache_expiry: Optional[int] = None,
+        negative_cache_expiry: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -39,287 +86,355 @@ class DBOperationsWithCache(DBOperations):
             *args,
             **kwargs,
         )
-        self.cache_crud = cache_manager
         self.model_registry = model_registry or {}
         self.cache_expiry = cache_expiry
-
-    def handle_special_types(self, value):
-        """Helper function to handle special non-serializable types."""
-        if isinstance(value, UUID):
-            return str(value)
-        elif isinstance(value, datetime):
-            return value.isoformat()
-        elif isinstance(value, Decimal):
-            return float(value)
-        elif isinstance(value, Enum):
-            return str(value.name)
-        elif isinstance(value, list):
-            return [self.handle_special_types(v) for v in value]
-        elif isinstance(value.__class__, DeclarativeMeta):
-            return self.serialize(value)
-        else:
-            try:
-                json.dumps(value)
-                return value
-            except TypeError:
-                return str(value)
-
-    def serialize(self, obj):
-        """Custom function to serialize SQLAlchemy models and handle complex data types."""
-        if isinstance(obj.__class__, DeclarativeMeta):
-            obj_dict = {}
-            for c in inspect(obj).mapper.column_attrs:
-                value = getattr(obj, c.key)
-                obj_dict[c.key] = self.handle_special_types(value)
-            return json.dumps(obj_dict)
-        elif isinstance(obj, list):
-            return json.dumps([self.serialize(item) for item in obj])
-        else:
-            return json.dumps(self.handle_special_types(obj))
-
-    def unserialize(self, data, model_class=None):
-        """Custom function to unserialize data back to SQLAlchemy model instances or Python dictionaries."""
-        data_dict = json.loads(data)
-
-        if model_class and isinstance(data_dict, dict):
-            for key, value in data_dict.items():
-                if isinstance(value, str):
-                    try:
-                        data_dict[key] = datetime.fromisoformat(value)
-                    except ValueError:
-                        pass
-
-            return model_class(**data_dict)
-        elif model_class and isinstance(data_dict, list):
-            return [model_class(**item) for item in data_dict]
-
-        return data_dict
-
-    async def get(
-        self,
-        db_session: AsyncSession,
-        id: Union[UUID, int, str],
-        skip: int = 0,
-        limit: int = 100,
-    ) -> Optional[DBModelType]:
-        cache_key = f"{settings.APP_NAME}:{self.model.__name__}:{id}"
-        cached_data = None
-        self.cache_crud = await cache_manager.cache_module.redis
-
-        if self.cache_crud:
-            cached_object = await self.cache_crud.get(cache_key)
-            cached_data = (
-                JSONSerializer.deserialize(cached_object) if cached_object else None
+        self.negative_cache_expiry = negative_cache_expiry
+        self.negative_cache_keys: List[str] = kwargs.get("negative_cache_keys") or []
+        self.cache: TwoTierCache = model_cache
+        self.codec: EntityCodec = entity_codec
+        self.flight: SingleFlight = cache_flight
+        self.collections: CollectionCache = collection_cache
+        self._cache_tags: Optional[List[str]] = None
+
+    @property
+    def cache_tags(self) -> List[str]:
+        """Models whose writes invalidate this DAO's cached reads."""
+        if self._cache_tags is None:
+            tags = {self.model.__name__}
+            tags.update(
+                rel.mapper.class_.__name__ for rel in inspect(self.model).relationships
             )
 
-        if cached_data:
-            print(f"Cache hit for {cache_key}")
-            return (
-                [self.unserialize(obj) for obj in cached_data]
-                if isinstance(cached_data, list)
-                else self.unserialize(cached_data)
-            )
+            pending = list((self.detail_mappings or {}).values())
+            seen = set()
+            while pending:
+                dao = pending.pop()
+                if id(dao) in seen:
+                    continue
 
-        print(f"Cache miss for {cache_key}")
-        db_obj = await super().get(db_session, id, skip, limit)
+                seen.add(id(dao))
+                tags.add(dao.model.__name__)
+                pending.extend((getattr(dao, "detail_mappings", None) or {}).values())
 
-        if self.cache_crud and db_obj:
-            serialized_data = self.serialize(db_obj)
-            await self.cache_crud.set(
-                cache_key,
-                JSONSerializer.serialize(serialized_data),
-                ex=self.cache_expiry,
-            )
+            self._cache_tags = sorted(tags)
 
-        return db_obj
+        return self._cache_tags
 
-    async def get_all(
-        self, db_session: AsyncSession, offset: int = 0, limit: int = 100
-    ) -> List[DBModelType]:
-        cache_key = f"{settings.APP_NAME}:{self.model.__name__}:all:{offset}:{limit}"
-        cached_data = None
-        self.cache_crud = await cache_manager.cache_module.redis
-
-        if self.cache_crud:
-            cached_object = await self.cache_crud.get(cache_key)
-            cached_data = (
-                JSONSerializer.deserialize(cached_object) if cached_object else None
-            )
-
-        if cached_data:
-            print(f"Cache hit for {cache_key}")
-            return (
-                [self.unserialize(obj) for obj in cached_data]
-                if isinstance(cached_data, list)
-                else self.unserialize(cached_data)
-            )
+    def use_cache(self, db_session: AsyncSession) -> bool:
+        return bool(self.cache_expiry) and not isinstance(
+            db_session.sync_session, WriteSession
+        )
 
-        print(f"Cache miss for {cache_key}")
-        db_objs = await super().get_all(db_session, offset, limit)
+    async def cache_key(self, operation: str, *parts: Any) -> str:
+        return (await self.cache_keys(operation, [parts]))[0]
+
+    async def cache_version(self) -> str:
+        """The generations of the DAO's cache_tags; changes on every write to them."""
+        generations = await self.cache.get_generations(self.cache_tags)
+
+        return ".".join(str(generation) for generation in generations)
+
+    async def cache_keys(
+        self, operation: str, parts_list: List[Tuple[Any, ...]]
+    ) -> List[str]:
+        """Keys for many reads of one operation, reading the generations once."""
+        version = await self.cache_version()
+        prefix = f"{settings.APP_NAME}:{self.model.__name__}:{operation}:{version}"
+
+        return [
+            f"{prefix}:"
+            + hashlib.sha1(
+                json.dumps(parts, default=str, sort_keys=True).encode()
+            ).hexdigest()
+            for parts in parts_list
+        ]
+
+    async def read_through(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        entry = await self.cache.get(key)
+        if entry is not None:
+            if not entry.should_refresh(settings.CACHE_EARLY_REFRESH_BETA):
+                return self.codec.loads(entry.value)
+
+            self.cache.stats[
+                "early_refreshes" if entry.expires > time.time() else "expired"
+            ] += 1
+
+        (payload, result), shared = await self.flight.do(
+            key, lambda: self.rebuild(key, loader, entry)
+        )
 
-        if self.cache_crud and db_objs:
-            serialized_data = [self.serialize(obj) for obj in db_objs]
+        # loaded objects belong to the builder's session, everyone else decodes
+        if shared or result is NOT_LOADED:
+            return self.codec.loads(payload)
 
-            await self.cache_crud.set(
-                cache_key,
-                JSONSerializer.serialize(serialized_data),
-                ex=self.cache_expiry,
-            )
-
-        return db_objs
+        return result
 
-    async def create(
+    async def rebuild(
         self,
-        db_session: AsyncSession,
-        obj_in: Union[Dict[str, Any], BaseModel, Any],
-    ) -> DBModelType:
-        self.cache_crud = await cache_manager.cache_module.redis
-        print("About to create")
-        db_obj = await super().create(db_session, obj_in)
-        print("Created")
-        if self.cache_crud:
-            cache_key = f"{settings.APP_NAME}:{self.model.__name__}:{getattr(db_obj, self.primary_key)}"
-            print("About to serialize", cache_key)
-            serialized_data = self.serialize(db_obj)
-            print("About to cache")
-            await self.cache_crud.set(
-                cache_key,
-                JSONSerializer.serialize(serialized_data),
-                ex=self.cache_expiry,
-            )
-
-        return db_obj
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        stale: Optional[CacheEntry] = None,
+    ) -> Tuple[str, Any]:
+        """
+        Load and cache key unless another process holds its rebuild lock, in
+        which case the stale entry is served or, without one, its result is
+        awaited for up to the lock lease.
 
-    async def update(
-        self, db_session: AsyncSession, db_obj: DBModelType, obj_in: Dict[str, Any]
-    ) -> DBModelType:
-        self.cache_crud = await cache_manager.cache_module.redis
-        db_obj = await super().update(db_session, db_obj, obj_in)
-
-        if self.cache_crud:
-            cache_key = f"{settings.APP_NAME}:{self.model.__name__}:{getattr(db_obj, self.primary_key)}"
-            print("About to serialize", cache_key)
-            serialized_data = self.serialize(db_obj)
-            print("About to cache")
-            await self.cache_crud.set(
-                cache_key,
-                JSONSerializer.serialize(serialized_data),
-                ex=self.cache_expiry,
-            )
+        Returns:
+            The payload, and the loaded result or NOT_LOADED.
+        """
+        token = await self.cache.acquire_lock(key)
+
+        if token is None:
+            if stale is not None:
+                self.cache.stats["stale_served"] += 1
+                return stale.value, NOT_LOADED
+
+            deadline = time.monotonic() + settings.CACHE_LOCK_LEASE_MS / 1000
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.lock_poll_interval)
+
+                entry = await self.cache.get(key)
+                if entry is not None:
+                    return entry.value, NOT_LOADED
+
+        try:
+            started = time.perf_counter()
+            result = await loader()
+            payload = self.codec.dumps(result)
+
+            if result is not None:
+                await self.cache.set(
+                    key,
+                    payload,
+                    self.cache_expiry,
+                    delta=time.perf_counter() - started,
+                )
+        finally:
+            if token is not None:
+                await self.cache.release_lock(key, token)
+
+        return payload, result
+
+    def missing_key(self, field: str, value: Any) -> str:
+        # hashed: lookups by email should not leave addresses in key names
+        digest = hashlib.sha1(str(value).encode()).hexdigest()
+        return f"{settings.APP_NAME}:{self.model.__name__}:missing:{field}:{digest}"
+
+    def negative_lookup_key(
+        self, db_session: AsyncSession, field: str, value: Any
+    ) -> Optional[str]:
+        """The negative entry key for a lookup, or None if it is not cached."""
+        if (
+            not self.negative_cache_expiry
+            or value is None
+            or field not in (self.primary_key, *self.negative_cache_keys)
+            # rows staged in an open unit of work are not visible to the entry
+            or self.in_unit_of_work(db_session)
+        ):
+            return None
+
+        return self.missing_key(field, value)
+
+    async def after_write(self, db_session: AsyncSession, db_objs: List[DBModelType]):
+        # applied by after_commit, i.e. after the outermost write has committed,
+        # so no reader can cache pre-commit rows under the new generation
+        db_session.info.setdefault("cache_writes", []).append((self, db_objs))
+
+        if not self.in_unit_of_work(db_session):
+            await self.run_after_commit(db_session)
+
+    async def after_commit(self, db_session: AsyncSession):
+        writes = db_session.info.pop("cache_writes", [])
+        models = db_session.info.pop(STAGED_MODELS, set())
+        collection_keys = self.collections.pop_staged(db_session)
+        if not writes and not models and not collection_keys:
+            return
+
+        # bumped even when the DAO does not cache: other DAOs may depend on it
+        await self.cache.invalidate(
+            tags=sorted(models | {dao.model.__name__ for dao, _ in writes}),
+            keys=[
+                dao.missing_key(field, getattr(db_obj, field))
+                for dao, db_objs in writes
+                if dao.negative_cache_expiry
+                for db_obj in db_objs
+                if db_obj is not None
+                for field in (dao.primary_key, *dao.negative_cache_keys)
+            ]
+            + collection_keys,
+        )
 
-        return db_obj
+    async def get_collection(
+        self, db_session: AsyncSession, db_obj: DBModelType, relationship: str
+    ) -> List[Any]:
+        """
+        Load a list relationship of db_obj (e.g. one left out by include=)
+        through the collection cache; write sessions always read the database.
+        """
+        return await self.collections.load(
+            db_session,
+            db_obj,
+            relationship,
+            cached=not isinstance(db_session.sync_session, WriteSession),
+        )
 
-    async def delete(
-        self, db_session: AsyncSession, db_obj: DBModelType
-    ) -> DBModelType:
-        self.cache_crud = await cache_manager.cache_module.redis
+    def split_collection_includes(
+        self, include: Optional[List[str]]
+    ) -> Tuple[Optional[List[str]], List[str]]:
+        """
+        Split include= paths into those loaded by the query and the list
+        relationships loaded through the collection cache: top-level ones that
+        no nested path loads through (the cache holds the children's columns).
+        """
+        if not include or not self.collections.expiry:
+            return include, []
 
-        if self.cache_crud:
-            cache_key = f"{settings.APP_NAME}:{self.model.__name__}:{getattr(db_obj, self.primary_key)}"
-            await self.cache_crud.delete(cache_key)
+        list_keys = self.model_meta.list_relationship_keys
+        nested = {path.split(".", 1)[0] for path in include if "." in path}
+        collections = [
+            path for path in include if path in list_keys and path not in nested
+        ]
 
-        return await super().delete(db_session, db_obj)
+        return [path for path in include if path not in collections], collections
 
-    async def create_or_update(
+    async def get_with_collections(
         self,
         db_session: AsyncSession,
-        obj_in: Union[Dict[str, Any], DBModelType],
-        filters: Optional[Dict[str, Any]] = None,
-        update_existing: bool = True,
-    ) -> DBModelType:
-        db_obj = await super().create_or_update(
-            db_session, obj_in, filters, update_existing
-        )
+        id: Union[UUID, str, int],
+        skip: int = 0,
+        limit: int = 100,
+        include: Optional[List[str]] = None,
+    ) -> Optional[DBModelType]:
+        """DBOperations.get, with the included collections read via get_collection."""
+        include, collections = self.split_collection_includes(include)
+        db_obj = await super().get(db_session, id, skip, limit, include)
 
-        if self.cache_crud:
-            cache_key = f"{settings.APP_NAME}:{self.model.__name__}:{getattr(db_obj, self.primary_key)}"
-            serialized_data = JSONSerializer.serialize(db_obj)
-            await self.cache_crud.set(cache_key, serialized_data, ex=self.cache_expiry)
+        for relationship in collections:
+            await self.get_collection(db_session, db_obj, relationship)
 
         return db_obj
 
-    async def query(
+    async def get(
         self,
         db_session: AsyncSession,
-        filters: Dict[str, Any],
-        single: bool = False,
-        options: Optional[List[InstrumentedAttribute]] = None,
-        order_by: Optional[List[InstrumentedAttribute]] = None,
-    ) -> Union[List[DBModelType], Optional[DBModelType]]:
-        cache_key = f"{settings.APP_NAME}:{self.model.__name__}:query:{str(filters)}:{single}:{str(options)}:{str(order_by)}"
-        self.cache_crud = await cache_manager.cache_module.redis
-
-        if self.cache_crud:
-            cached_object = await self.cache_crud.get(cache_key)
-            cached_data = (
-                JSONSerializer.deserialize(cached_object) if cached_object else None
-            )
-
-        if cached_data:
-            print(f"Cache hit for {cache_key}")
-            return (
-                [self.unserialize(obj) for obj in cached_data]
-                if isinstance(cached_data, list)
-                else self.unserialize(cached_data)
+        id: Union[UUID, str, int],
+        skip: int = 0,
+        limit: int = 100,
+        include: Optional[List[str]] = None,
+    ) -> Optional[DBModelType]:
+        missing_key = self.negative_lookup_key(db_session, self.primary_key, str(id))
+        if missing_key and await self.cache.is_missing(missing_key):
+            raise RecordNotFoundException(model=self.model.__name__, id=id)
+
+        try:
+            if not self.use_cache(db_session):
+                return await super().get(db_session, id, skip, limit, include)
+
+            # collections outlive the item's entry: a write to the item alone
+            # retires it, but its rebuild reads them from the collection cache
+            return await self.read_through(
+                await self.cache_key("get", str(id), skip, limit, include),
+                lambda: self.get_with_collections(db_session, id, skip, limit, include),
             )
+        except RecordNotFoundException:
+            if missing_key:
+                await self.cache.mark_missing(missing_key, self.negative_cache_expiry)
+            raise
 
-        print(f"Cache miss for {cache_key}")
-        db_obj = await super().query(db_session, filters, single, options, order_by)
+    async def get_many(
+        self,
+        db_session: AsyncSession,
+        ids: List[Union[UUID, str, int]],
+        include: Optional[List[str]] = None,
+    ) -> List[Optional[DBModelType]]:
+        """
+        Cached get for many ids: one cache round trip for every key, one query
+        for the misses and one pipelined write to backfill them. Entries are
+        shared with get, and past their expiry they count as misses.
+        """
+        if not self.use_cache(db_session):
+            return await super().get_many(db_session, ids, include)
 
-        if self.cache_crud and db_obj:
-            serialized_data = self.serialize(db_obj)
-            await self.cache_crud.set(
-                cache_key,
-                JSONSerializer.serialize(serialized_data),
-                ex=self.cache_expiry,
+        unique_ids = list(dict.fromkeys(str(id) for id in ids))
+        keys = await self.cache_keys(
+            "get", [(id, 0, 100, include) for id in unique_ids]
+        )
+        entries = await self.cache.get_many(keys)
+
+        now = time.time()
+        results: Dict[str, Optional[DBModelType]] = {
+            id: self.codec.loads(entry.value)
+            for id, entry in zip(unique_ids, entries)
+            if entry is not None and entry.expires > now
+        }
+        missing = [id for id in unique_ids if id not in results]
+
+        if missing:
+            started = time.perf_counter()
+            loaded = await super().get_many(db_session, missing, include)
+            delta = (time.perf_counter() - started) / len(missing)
+            key_by_id = dict(zip(unique_ids, keys))
+
+            await self.cache.set_many(
+                [
+                    (key_by_id[id], self.codec.dumps(db_obj), delta)
+                    for id, db_obj in zip(missing, loaded)
+                    if db_obj is not None
+                ],
+                self.cache_expiry,
             )
+            results.update(zip(missing, loaded))
 
-        return db_obj
+        return [results[str(id)] for id in ids]
 
-    async def query_on_joins(
+    async def get_all(
+        self,
+        db_session: AsyncSession,
+        offset: int = 0,
+        limit: int = 100,
+        include: Optional[List[str]] = None,
+    ) -> List[DBModelType]:
+        if not self.use_cache(db_session):
+            return await super().get_all(db_session, offset, limit, include)
+
+        return await self.read_through(
+            await self.cache_key("all", offset, limit, include),
+            lambda: super(DBOperationsWithCache, self).get_all(
+                db_session, offset, limit, include
+            ),
+        )
+
+    async def query(
         self,
         db_session: AsyncSession,
         filters: Dict[str, Any],
         single: bool = False,
         options: Optional[List[InstrumentedAttribute]] = None,
         order_by: Optional[List[InstrumentedAttribute]] = None,
-        join_conditions: Optional[List] = None,
-        skip: int = 0,
-        limit: int = 100,
     ) -> Union[List[DBModelType], Optional[DBModelType]]:
-        """
-        Executes a query with join conditions using the cache-aware CRUD operations.
-        """
-        cache_key = (
-            f"{settings.APP_NAME}:{self.model.__name__}:joins:{filters}:{skip}:{limit}"
-        )
-        if self.cache_crud:
-            cached_data = await self.cache_crud.get(cache_key)
-            if cached_data:
-                print(f"Cache hit for {cache_key}")
-                return JSONSerializer.deserialize(cached_data, self.model_registry)
-
-        # Perform the query if no cache hit
-        result = await super().query_on_joins(
-            db_session, filters, single, options, order_by, join_conditions, skip, limit
+        missing_key = (
+            self.negative_lookup_key(db_session, *next(iter(filters.items())))
+            if single and len(filters) == 1
+            else None
         )
+        if missing_key and await self.cache.is_missing(missing_key):
+            return None
 
-        # Cache the result
-        if self.cache_crud and result:
-            serialized_data = JSONSerializer.serialize(result)
-            await self.cache_crud.set(
-                cache_key, serialized_data, expire=self.cache_expiry
+        # loader options have no stable representation to key on
+        if options or not self.use_cache(db_session):
+            result = await super().query(db_session, filters, single, options, order_by)
+        else:
+            result = await self.read_through(
+                await self.cache_key(
+                    "query", filters, single, [str(column) for column in order_by or []]
+                ),
+                lambda: super(DBOperationsWithCache, self).query(
+                    db_session, filters, single, options, order_by
+                ),
             )
 
-        return result
+        if missing_key and result is None:
+            await self.cache.mark_missing(missing_key, self.negative_cache_expiry)
 
-    # Add the query_on_create method
-    async def query_on_create(
-        self,
-        db_session: AsyncSession,
-        filters: Dict[str, Any],
-        single: bool = False,
-        options: Optional[List[InstrumentedAttribute]] = None,
-        create_if_not_exist: bool = False,
-    ) -> Optional[DBModelType]:
-        pass
+        return result
@@ -0,0 +1,49 @@
+import asyncio
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key within this process.
+
+    The first caller runs the function, callers arriving while it is in flight
+    await the same result instead of running it again. If the first call
+    fails or is cancelled, the waiting callers run the function themselves.
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.stats: Counter = Counter()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Returns:
+            The result and whether it was shared from another caller's call.
+        """
+        while key in self._calls:
+            self.stats["coalesced"] += 1
+            future = self._calls[key]
+            succeeded, result = await asyncio.shield(future)
+
+            if succeeded:
+                return result, True
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        outcome: Tuple[bool, Any] = (False, None)
+
+        try:
+            result = await fn()
+            outcome = (True, result)
+            return result, False
+        finally:
+            del self._calls[key]
+            future.set_result(outcome)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "in_flight": len(self._calls)}
+
+
+# create cache single flight
+cache_flight = SingleFlight()
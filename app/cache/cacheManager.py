@@ -1,11 +1,26 @@
-import threading
+import time
 import asyncio
+import logging
+import threading
+from typing import Any, Dict
 
 from app.cache.cacheModule import CacheModule
+from app.cache.cacheBreaker import CircuitBreaker
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class CacheManager:
+    """
+    Process wide owner of the Redis client.
+
+    The connection pool is created and closed by the app lifespan (connect /
+    disconnect). Cache calls go through get_redis, which returns None while
+    the circuit breaker is open, so a dead or slow Redis costs callers nothing
+    but a fallback to the database until the cool-down has passed.
+    """
+
     _instance = None
     _lock = threading.Lock()
 
@@ -15,36 +30,79 @@ class CacheManager:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls, *args, **kwargs)
                     cls._instance._cache_module = None
+                    cls._instance.breaker = CircuitBreaker(
+                        failure_threshold=settings.CACHE_BREAKER_THRESHOLD,
+                        cool_down=settings.CACHE_BREAKER_COOL_DOWN,
+                    )
         return cls._instance
 
     @property
     def cache_module(self):
-        if self._cache_module is None:
-            asyncio.run(self._initialize_cache_module())
         return self._cache_module
 
+    def get_redis(self):
+        """Return the redis client, or None if not connected or the breaker is open."""
+        if self._cache_module is None or not self.breaker.allow():
+            return None
+
+        return self._cache_module.redis
+
+    def record_success(self):
+        self.breaker.record_success()
+
+    def record_failure(self):
+        self.breaker.record_failure()
+
     def _get_cache_credentials_from_env(self):
         return {
             "host": settings.CACHE_HOST,
             "port": settings.CACHE_PORT,
             "user": settings.CACHE_USER,
             "password": settings.CACHE_PASSWORD,
+            "ssl": settings.CACHE_SSL,
+            "max_connections": settings.CACHE_MAX_CONNECTIONS,
+            "socket_timeout": settings.CACHE_SOCKET_TIMEOUT,
+            "socket_connect_timeout": settings.CACHE_CONNECT_TIMEOUT,
+            "health_check_interval": settings.CACHE_HEALTH_CHECK_INTERVAL,
         }
 
-    async def _initialize_cache_module(self):
+    async def connect(self):
         if self._cache_module is None:
             credentials = self._get_cache_credentials_from_env()
             try:
-                self._cache_module = CacheModule(**credentials)
-                print(f"Cache has been set {self._cache_module}")
-                await self._cache_module.connect()  # Establish a connection
+                cache_module = CacheModule(**credentials)
+                await cache_module.connect()
+                self._cache_module = cache_module
             except Exception as e:
                 raise RuntimeError(f"Failed to initialize CacheModule: {e}")
 
+    async def disconnect(self):
+        if self._cache_module is not None:
+            await self._cache_module.disconnect()
+            self._cache_module = None
+
+    async def health(self) -> Dict[str, Any]:
+        """Ping Redis (bypassing the breaker) and report the outcome to it."""
+        status: Dict[str, Any] = {"connected": self._cache_module is not None}
+
+        if self._cache_module is not None:
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    self._cache_module.ping(), timeout=settings.CACHE_SOCKET_TIMEOUT
+                )
+                self.record_success()
+                status["ok"] = True
+            except Exception as e:
+                self.record_failure()
+                status.update(ok=False, error=str(e) or type(e).__name__)
+            status["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        else:
+            status["ok"] = False
+
+        return {**status, "breaker": self.breaker.get_stats()}
+
     @classmethod
     def get_instance(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        # __new__ already takes the (non re-entrant) lock
+        return cls._instance or cls()
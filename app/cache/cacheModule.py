@@ -10,35 +10,57 @@ class CacheModule:
         port: int,
         user: str,
         password: Optional[str] = None,
+        ssl: bool = True,
+        max_connections: int = 50,
+        socket_timeout: float = 0.5,
+        socket_connect_timeout: float = 0.5,
+        health_check_interval: int = 30,
         **kwargs,
     ):
         self.host = host
         self.port = port
         self.password = password
         self.user = user
+        self.ssl = ssl
+        self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.health_check_interval = health_check_interval
         self.redis = None
 
     async def connect(self):
-        print("Trying to connect to Redis")
-
-        self.redis = redis.Redis(
+        """Create the client and its connection pool; connections open lazily."""
+        pool_kwargs = (
+            {"connection_class": redis.SSLConnection, "ssl_cert_reqs": None}
+            if self.ssl
+            else {}
+        )
+        pool = redis.ConnectionPool(
             host=self.host,
             port=self.port,
             username=self.user,
             password=self.password,
-            ssl=True,
-            ssl_cert_reqs=None,
+            max_connections=self.max_connections,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            health_check_interval=self.health_check_interval,
             decode_responses=True,
+            **pool_kwargs,
         )
 
+        self.redis = redis.Redis(connection_pool=pool)
+
     async def disconnect(self):
         if self.redis:
-            await self.redis.close()
-            await (
-                self.redis.connection_pool.disconnect()
-            )  # Disconnect the connection pool
+            await self.redis.aclose()
+            await self.redis.connection_pool.disconnect()
             self.redis = None
 
+    async def ping(self) -> bool:
+        if not self.redis:
+            raise ConnectionError("CacheModule is not connected.")
+        return await self.redis.ping()
+
     async def set(self, key: str, value: Any, expire: Optional[int] = None):
         if not self.redis:
             raise ConnectionError("CacheModule is not connected.")
@@ -63,7 +85,3 @@ class CacheModule:
         if not self.redis:
             raise ConnectionError("CacheModule is not connected.")
         await self.redis.flushdb()
-
-    def __del__(self):
-        if self.redis:
-            self.redis.close()
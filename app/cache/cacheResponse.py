@@ -0,0 +1,177 @@
+import gzip
+import time
+import base64
+import hashlib
+import inspect
+import functools
+import orjson
+from collections import Counter
+from fastapi import Request, Response, status
+from typing import Any, Callable, Dict, Optional
+
+# db
+from app.db.dbModule import read_from_primary
+
+# core
+from app.core.config import settings
+from app.core.response import DAOJSONResponse
+
+# cache
+from app.cache.cacheTier import TwoTierCache, model_cache
+
+# headers set by endpoints that describe the body and travel with it
+CACHED_HEADERS = ("etag", "last-modified", "cache-control")
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Whether an If-None-Match header (weakly) matches etag."""
+    if not if_none_match or not etag:
+        return False
+
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip() == "*" or tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+class ResponseCache:
+    """
+    Caches the encoded body of read endpoints, so a hit skips the queries, the
+    ORM hydration, the schema conversion and the JSON encoding altogether.
+
+    Entries are keyed by the path, the query string and the auth scope (a hash
+    of the Authorization header, so per-user responses are never shared), and
+    versioned by the generations of the DAO's cache_tags: any write through a
+    DAO to a model the response is built from retires them, as it does the
+    DAO's own cached reads. Bodies of at least GZIP_MINIMUM_SIZE bytes are
+    also stored gzipped and served as is to clients that accept gzip.
+
+    Clients inside their read-your-writes window (see ReadYourWritesMiddleware)
+    bypass the cache, like the DAOs' cached reads do.
+    """
+
+    def __init__(self, cache: TwoTierCache):
+        self.cache = cache
+        self.stats: Counter = Counter()
+
+    def cached(self, dao: Any, expiry: Optional[int] = None) -> Callable:
+        """
+        Decorate a FastAPI endpoint (below the route decorator) to cache its
+        responses for expiry seconds (CACHE_RESPONSE_TTL by default).
+
+        Responses the endpoint returns itself (errors, 304s) are not cached.
+        """
+        expiry = expiry or settings.CACHE_RESPONSE_TTL
+
+        def decorator(endpoint: Callable) -> Callable:
+            signature = inspect.signature(endpoint)
+            parameters = list(signature.parameters.values())
+
+            # FastAPI injects one Request and one Response (whose headers the
+            # endpoint sets) per route: reuse the endpoint's, or ask for them
+            names = {}
+            for annotation, name in ((Request, "request"), (Response, "response")):
+                declared = [p.name for p in parameters if p.annotation is annotation]
+                names[annotation] = declared[0] if declared else f"cache_{name}"
+                if not declared:
+                    parameters.append(
+                        inspect.Parameter(
+                            names[annotation],
+                            inspect.Parameter.KEYWORD_ONLY,
+                            annotation=annotation,
+                        )
+                    )
+
+            def pop(kwargs: Dict[str, Any], annotation: type) -> Any:
+                name = names[annotation]
+                return (
+                    kwargs[name] if name in signature.parameters else kwargs.pop(name)
+                )
+
+            @functools.wraps(endpoint)
+            async def wrapper(**kwargs):
+                request, response = pop(kwargs, Request), pop(kwargs, Response)
+
+                # clients inside their read-your-writes window must see the primary
+                if read_from_primary.get():
+                    self.stats["bypassed"] += 1
+                    return await endpoint(**kwargs)
+
+                key = await self.cache_key(dao, request)
+
+                # entries are kept past their expiry (see TwoTierCache.set)
+                entry = await self.cache.get(key)
+                if entry is not None and entry.expires > time.time():
+                    self.stats["hits"] += 1
+                    return self.build_response(request, orjson.loads(entry.value))
+
+                self.stats["misses"] += 1
+                result = await endpoint(**kwargs)
+                if isinstance(result, Response):
+                    return result
+
+                cached = self.encode(result, response)
+                await self.cache.set(key, orjson.dumps(cached).decode(), expiry)
+
+                return self.build_response(request, cached)
+
+            wrapper.__signature__ = signature.replace(parameters=parameters)
+
+            return wrapper
+
+        return decorator
+
+    async def cache_key(self, dao: Any, request: Request) -> str:
+        scope = request.headers.get("authorization", "")
+        digest = hashlib.sha1(
+            f"{request.url.path}?{request.url.query}|{scope}".encode()
+        ).hexdigest()
+
+        return f"{settings.APP_NAME}:response:{await dao.cache_version()}:{digest}"
+
+    def encode(self, result: Any, response: Response) -> Dict[str, Any]:
+        """The body as FastAPI would render it, its gzip and the endpoint's headers."""
+        body = DAOJSONResponse(content=result).body
+
+        return {
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key in CACHED_HEADERS
+            },
+            "body": body.decode(),
+            "gzip": base64.b64encode(gzip.compress(body)).decode()
+            if len(body) >= settings.GZIP_MINIMUM_SIZE
+            else None,
+        }
+
+    def build_response(self, request: Request, cached: Dict[str, Any]) -> Response:
+        headers = {**cached["headers"], "Vary": "Accept-Encoding"}
+
+        if etag_matches(request.headers.get("if-none-match"), headers.get("etag")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        if cached["gzip"] and "gzip" in request.headers.get("accept-encoding", ""):
+            self.stats["gzip_served"] += 1
+            return Response(
+                content=base64.b64decode(cached["gzip"]),
+                media_type="application/json",
+                headers={**headers, "Content-Encoding": "gzip"},
+            )
+
+        return Response(
+            content=cached["body"], media_type="application/json", headers=headers
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+
+        return {
+            **self.stats,
+            "hit_ratio": round(self.stats["hits"] / lookups, 4) if lookups else None,
+        }
+
+
+# create response cache
+response_cache = ResponseCache(model_cache)
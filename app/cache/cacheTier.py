@@ -0,0 +1,402 @@
+import math
+import time
+import uuid
+import random
+import logging
+from threading import Lock
+from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.cache.cacheManager import CacheManager
+
+logger = logging.getLogger(__name__)
+
+# delete the lock only if it still holds our token (the lease may have expired)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached payload with its logical expiry and the time it took to build."""
+
+    value: str
+    expires: float
+    delta: float = 0.0
+
+    def encode(self) -> str:
+        return f"{self.expires:.3f}|{self.delta:.6f}|{self.value}"
+
+    @classmethod
+    def decode(cls, raw: str) -> "CacheEntry":
+        expires, delta, value = raw.split("|", 2)
+        return cls(value=value, expires=float(expires), delta=float(delta))
+
+    def should_refresh(self, beta: float) -> bool:
+        """
+        Probabilistic early expiration (XFetch): the closer to expiry and the
+        slower the entry is to rebuild, the likelier a reader is picked to
+        refresh it. Always true once the entry is past its logical expiry.
+        """
+        jitter = -self.delta * beta * math.log(1.0 - random.random())
+        return time.time() + jitter >= self.expires
+
+
+class LocalCache:
+    """Bounded in-process LRU with a per entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        ttl = min(ttl or self.ttl, self.ttl)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TwoTierCache:
+    """
+    In-process LocalCache in front of Redis.
+
+    Reads try the local tier, then Redis (backfilling the local tier), writes go
+    to both. Redis being unconfigured or failing is treated as a miss, so
+    callers fall back to the database. Failures feed the CacheManager circuit
+    breaker, which short-circuits Redis calls for a cool-down period after
+    repeated failures.
+
+    Entries outlive their logical expiry by CACHE_STALE_TTL seconds so that,
+    while one reader rebuilds an expired entry, the others can be served the
+    stale one instead of all hitting the database (see DBOperationsWithCache).
+
+    Generation counters (one Redis integer per tag) namespace the keys of
+    everything cached under a tag: bumping the counter orphans all of those
+    entries at once, and they age out through their TTL. Processes read the
+    counters at most once per local TTL, so bumps made elsewhere become visible
+    within the same window as the local tier itself.
+    """
+
+    def __init__(self, local: LocalCache):
+        self.local = local
+        self.stats: Counter = Counter()
+        self._generations: Dict[str, Tuple[float, int]] = {}
+
+    @property
+    def redis(self):
+        """The redis client, or None if unconfigured or short-circuited."""
+        manager = CacheManager.get_instance()
+        redis = manager.get_redis()
+
+        if redis is None and manager.cache_module is not None:
+            self.stats["short_circuited"] += 1
+
+        return redis
+
+    def redis_succeeded(self):
+        CacheManager.get_instance().record_success()
+
+    def redis_failed(self, action: str, target: Any, e: Exception):
+        self.stats["redis_errors"] += 1
+        CacheManager.get_instance().record_failure()
+        logger.warning(f"Cache {action} failed for {target}: {e}")
+
+    async def get(self, key: str, shared: bool = False) -> Optional[CacheEntry]:
+        """
+        Read key from the local tier, then Redis. Shared entries skip the local
+        tier while Redis is reachable, so deleting one is seen by every process
+        at once.
+        """
+        redis = self.redis if shared else None
+
+        entry = self.local.get(key) if redis is None else None
+        if entry is not None:
+            self.stats["local_hits"] += 1
+            return entry
+
+        if not shared:
+            redis = self.redis
+        if redis is not None:
+            try:
+                raw = await redis.get(key)
+                self.redis_succeeded()
+                entry = CacheEntry.decode(raw) if raw is not None else None
+            except Exception as e:
+                self.redis_failed("get", key, e)
+
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["redis_hits"] += 1
+        if not shared:
+            self.local.set(key, entry)
+        return entry
+
+    async def set(
+        self, key: str, value: str, ttl: int, delta: float = 0.0, shared: bool = False
+    ):
+        """Store value for ttl seconds; delta is how long it took to build."""
+        entry = CacheEntry(value=value, expires=time.time() + ttl, delta=delta)
+
+        redis = self.redis
+        if not shared or redis is None:
+            self.local.set(key, entry, ttl + settings.CACHE_STALE_TTL)
+        if redis is not None:
+            try:
+                await redis.set(key, entry.encode(), ex=ttl + settings.CACHE_STALE_TTL)
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("set", key, e)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[CacheEntry]]:
+        """get for many keys: the local tier first, then one MGET for the rest."""
+        entries = [self.local.get(key) for key in keys]
+        missing = [index for index, entry in enumerate(entries) if entry is None]
+        self.stats["local_hits"] += len(keys) - len(missing)
+
+        redis = self.redis
+        if missing and redis is not None:
+            try:
+                values = await redis.mget([keys[index] for index in missing])
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("mget", f"{len(missing)} keys", e)
+                values = [None] * len(missing)
+
+            for index, raw in zip(missing, values):
+                if raw is not None:
+                    entries[index] = CacheEntry.decode(raw)
+                    self.local.set(keys[index], entries[index])
+                    self.stats["redis_hits"] += 1
+
+        self.stats["misses"] += sum(entry is None for entry in entries)
+        return entries
+
+    async def set_many(self, items: List[Tuple[str, str, float]], ttl: int):
+        """set for many (key, value, delta) items with one pipelined round trip."""
+        if not items:
+            return
+
+        expires = time.time() + ttl
+        entries = [
+            (key, CacheEntry(value=value, expires=expires, delta=delta))
+            for key, value, delta in items
+        ]
+        for key, entry in entries:
+            self.local.set(key, entry, ttl + settings.CACHE_STALE_TTL)
+
+        redis = self.redis
+        if redis is not None:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for key, entry in entries:
+                        pipe.set(key, entry.encode(), ex=ttl + settings.CACHE_STALE_TTL)
+                    await pipe.execute()
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("set", f"{len(entries)} keys", e)
+
+    async def delete(self, *keys: str):
+        if not keys:
+            return
+
+        self.local.delete(*keys)
+
+        redis = self.redis
+        if redis is not None:
+            try:
+                await redis.delete(*keys)
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("delete", keys, e)
+
+    async def acquire_lock(self, key: str) -> Optional[str]:
+        """
+        Take the cluster wide rebuild lock of key for CACHE_LOCK_LEASE_MS.
+
+        Returns a token to release it with, or None if another process holds
+        it. Without a reachable Redis the lock is always granted: in-process
+        coalescing is then all there is to do.
+        """
+        token = uuid.uuid4().hex
+
+        redis = self.redis
+        if redis is None:
+            return token
+
+        try:
+            acquired = await redis.set(
+                f"{key}:lock", token, nx=True, px=settings.CACHE_LOCK_LEASE_MS
+            )
+            self.redis_succeeded()
+        except Exception as e:
+            self.redis_failed("lock", key, e)
+            return token
+
+        if not acquired:
+            self.stats["lock_contended"] += 1
+            return None
+
+        return token
+
+    async def release_lock(self, key: str, token: str):
+        redis = self.redis
+        if redis is not None:
+            try:
+                await redis.eval(RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", token)
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("unlock", key, e)
+
+    def generation_key(self, tag: str) -> str:
+        return f"{settings.APP_NAME}:gen:{tag}"
+
+    async def get_generations(self, tags: Sequence[str]) -> List[int]:
+        """Current generation of each tag, read from Redis with one MGET at most."""
+        now = time.monotonic()
+        missing = [
+            tag
+            for tag in tags
+            if tag not in self._generations or self._generations[tag][0] < now
+        ]
+
+        redis = self.redis
+        if missing and redis is not None:
+            try:
+                values = await redis.mget([self.generation_key(tag) for tag in missing])
+                self.redis_succeeded()
+                for tag, value in zip(missing, values):
+                    self._generations[tag] = (now + self.local.ttl, int(value or 0))
+            except Exception as e:
+                self.redis_failed("generation read", missing, e)
+
+        return [self._generations.get(tag, (0, 0))[1] for tag in tags]
+
+    async def invalidate(self, tags: Sequence[str], keys: Sequence[str] = ()):
+        """
+        Invalidate everything cached under tags (one INCR per tag) and drop
+        keys (negative entries, collections), in one pipelined round trip.
+        """
+        if not tags and not keys:
+            return
+
+        self.stats["generation_bumps"] += len(tags)
+        expires = time.monotonic() + self.local.ttl
+        self.local.delete(*keys)
+
+        redis = self.redis
+        if redis is not None:
+            try:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for tag in tags:
+                        pipe.incr(self.generation_key(tag))
+                    if keys:
+                        pipe.delete(*keys)
+                    values = await pipe.execute()
+                self.redis_succeeded()
+
+                for tag, value in zip(tags, values):
+                    self._generations[tag] = (expires, int(value))
+                return
+            except Exception as e:
+                self.redis_failed("invalidation", tags, e)
+
+        # no redis: the counters only need to be consistent within this process
+        for tag in tags:
+            generation = self._generations.get(tag, (0, 0))[1] + 1
+            self._generations[tag] = (expires, generation)
+
+    async def is_missing(self, key: str) -> bool:
+        """
+        Whether key holds a negative entry ("no such record").
+
+        Negative entries live in Redis only when it is configured, so deleting
+        one on create is seen by every process at once.
+        """
+        self.stats["negative_lookups"] += 1
+
+        redis = self.redis
+        if redis is None:
+            missing = self.local.get(key) is not None
+        else:
+            try:
+                missing = bool(await redis.exists(key))
+                self.redis_succeeded()
+            except Exception as e:
+                self.redis_failed("negative lookup", key, e)
+                return False
+
+        if missing:
+            self.stats["negative_hits"] += 1
+
+        return missing
+
+    async def mark_missing(self, key: str, ttl: int):
+        self.stats["negative_stored"] += 1
+
+        redis = self.redis
+        if redis is None:
+            self.local.set(key, True, ttl)
+            return
+
+        try:
+            await redis.set(key, 1, ex=ttl)
+            self.redis_succeeded()
+        except Exception as e:
+            self.redis_failed("negative store", key, e)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "local_entries": len(self.local),
+            "negative_hit_ratio": round(
+                self.stats["negative_hits"] / self.stats["negative_lookups"], 4
+            )
+            if self.stats["negative_lookups"]
+            else None,
+            "generations": {tag: entry[1] for tag, entry in self._generations.items()},
+        }
+
+
+# create model cache
+model_cache = TwoTierCache(
+    LocalCache(maxsize=settings.CACHE_LOCAL_MAXSIZE, ttl=settings.CACHE_LOCAL_TTL)
+)
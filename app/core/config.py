@@ -1,5 +1,6 @@
 import os
-import cloudinary
+import time
+from functools import lru_cache
 from pydantic import ConfigDict
 from pydantic_settings import BaseSettings
 
@@ -8,6 +9,13 @@ class Settings(BaseSettings):
     APP_NAME: str
     APP_URL: str
     LOG_LEVEL: str
+    GZIP_MINIMUM_SIZE: int = 1000
+
+    # skip schema sync / database creation and build heavy objects lazily
+    FAST_STARTUP: bool = False
+    STARTUP_TIMEOUT: int = 300
+    # identifies a deploy for leader-elected startup tasks (e.g. a commit id)
+    STARTUP_ID: str = ""
 
     DB_USER: str
     DB_PASSWORD: str
@@ -16,6 +24,20 @@ class Settings(BaseSettings):
     DB_DATABASE: str
     DB_ENGINE: str
     DB_DATABASE_DEFAULT: str
+    DB_READ_HOSTS: str = ""
+    DB_READ_YOUR_WRITES_WINDOW: int = 5
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_QUERY_COUNT_THRESHOLD: int = 25
+    DB_REPEATED_QUERY_THRESHOLD: int = 5
+    DB_SLOW_QUERY_MS: int = 200
+    DB_SLOW_QUERY_EXPLAIN_RATE: float = 0.1
+    # EXPLAIN ANALYZE runs the slow statement a second time
+    DB_SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
 
     GOOGLE_SIGNIN_CLIENT_ID: str
     GOOGLE_SIGNIN_CLIENT_SECRET: str
@@ -45,6 +67,21 @@ class Settings(BaseSettings):
     CACHE_USER: str
 
     REDIS_URL: str
+    CACHE_SSL: bool = True
+    CACHE_MAX_CONNECTIONS: int = 50
+    CACHE_SOCKET_TIMEOUT: float = 0.5
+    CACHE_CONNECT_TIMEOUT: float = 0.5
+    CACHE_HEALTH_CHECK_INTERVAL: int = 30
+    CACHE_BREAKER_THRESHOLD: int = 5
+    CACHE_BREAKER_COOL_DOWN: int = 30
+    CACHE_LOCAL_MAXSIZE: int = 2048
+    CACHE_LOCAL_TTL: int = 5
+    CACHE_STALE_TTL: int = 30
+    CACHE_NEGATIVE_TTL: int = 30
+    CACHE_COLLECTION_TTL: int = 300
+    CACHE_RESPONSE_TTL: int = 60
+    CACHE_LOCK_LEASE_MS: int = 2000
+    CACHE_EARLY_REFRESH_BETA: float = 1.0
 
     WHATSAPP_KEY: str
 
@@ -55,11 +92,21 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-cloudinary.config(
-    cloud_name=settings.CLOUDINARY_CLOUD_NAME,
-    api_key=settings.CLOUDINARY_API_KEY,
-    api_secret=settings.CLOUDINARY_API_SECRET,
-)
+# reference point for the startup time breakdown logged by the lifespan
+started_at = time.perf_counter()
+
+
+@lru_cache(maxsize=None)
+def configure_cloudinary():
+    """Configure the cloudinary client once, on first upload rather than at import."""
+    import cloudinary
+
+    cloudinary.config(
+        cloud_name=settings.CLOUDINARY_CLOUD_NAME,
+        api_key=settings.CLOUDINARY_API_KEY,
+        api_secret=settings.CLOUDINARY_API_SECRET,
+    )
+
 
 # Templates
 # Get the directory of the current script
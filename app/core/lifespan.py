@@ -1,10 +1,13 @@
+import time
 from fastapi import FastAPI
-from dogpile.cache import make_region
 from contextlib import asynccontextmanager
 
-from app.core.config import settings
+from app.core.config import settings, started_at
 from app.core.logger import AppLogger
+from app.core.response import response_schema_registry
 from app.db.dbManager import DBManager
+from app.db.dbStartup import StartupCoordinator
+from app.modules.common.models.model_meta import model_meta_registry
 
 # cache
 from app.cache.cacheManager import CacheManager
@@ -20,15 +23,10 @@ logger = AppLogger().get_logger()
 # get DB Info
 db_manager = DBManager()
 get_db = db_manager.db_module.get_db
+get_read_db = db_manager.db_module.get_read_db
 
 cache_manager = CacheManager()
-
-# create cache
-cache_region = make_region().configure(
-    "dogpile.cache.dbm",
-    expiration_time=300,
-    arguments={"filename": f"{settings.CACHE_PATH}cachefile.dbm"},
-)
+startup_coordinator = StartupCoordinator(db_manager.db_module)
 
 
 @asynccontextmanager
@@ -41,13 +39,58 @@ async def lifespan(app: FastAPI):
         app_logger = AppLogger()
         logger = app_logger.get_logger()
 
-    # instantiate db
-    await db_manager.db_module.create_all_tables()
+    timings = {"imports_and_routes": time.perf_counter() - started_at}
+
+    def timed(step: str, started: float):
+        timings[step] = time.perf_counter() - started
+
+    # instantiate db (schema sync is left to migrations in fast startup mode);
+    # with several workers only the elected leader runs these
+    if not settings.FAST_STARTUP:
+        startup_coordinator.add_leader_task(
+            "create_database",
+            db_manager.db_module.create_postgres_database_if_not_exist,
+        )
+        startup_coordinator.add_leader_task(
+            "create_all_tables", db_manager.db_module.create_all_tables
+        )
+
+    started = time.perf_counter()
+    task_timings = await startup_coordinator.run()
+    timed("startup_wait", started)
+    timings["startup_wait"] -= sum(task_timings.values())
+    timings.update(task_timings)
+
+    # precompute per-model mapper metadata for the CRUD hot path
+    started = time.perf_counter()
+    model_count = model_meta_registry.build_all()
+    timed("model_metadata", started)
+
+    # map every model to its response schema ahead of the first request
+    started = time.perf_counter()
+    schema_count = response_schema_registry.build_all()
+    timed("response_schemas", started)
 
     # cache
-    cache_manager.get_instance()
-    await cache_manager._initialize_cache_module()
+    started = time.perf_counter()
+    await cache_manager.connect()
+    cache_health = await cache_manager.health()
+    if not cache_health["ok"]:
+        logger.warning(
+            f"Cache unreachable at startup, serving from the database: "
+            f"{cache_health.get('error')}"
+        )
+    timed("cache", started)
+
+    logger.info(
+        f"Startup took {sum(timings.values()) * 1000:.1f}ms "
+        f"(fast_startup={settings.FAST_STARTUP}, models={model_count}, "
+        f"response_schemas={schema_count}, "
+        f"leader={startup_coordinator.is_leader}): "
+        + ", ".join(f"{step}={took * 1000:.1f}ms" for step, took in timings.items())
+    )
 
     yield
 
     logger.info("Shutting down")
+    await cache_manager.disconnect()
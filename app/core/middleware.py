@@ -1,3 +1,4 @@
+import json
 import time
 from fastapi.responses import JSONResponse
 from fastapi import FastAPI, Response, Request
@@ -7,7 +8,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from app.core.config import settings
 from app.core.lifespan import logger, get_db
+from app.db.dbModule import read_from_primary, request_commits
+from app.db.dbInstrumentation import QueryStats, query_stats
 from app.core.response import DAOResponse
 from app.core.errors import CustomException
 
@@ -44,8 +48,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         process_time = time.time() - start_time
         response_body = b"".join([section async for section in response.body_iterator])
 
-        # prepare and log response
-        response_log = f'"{request.method} {request.url.path} HTTP/{request.scope["http_version"]}" {response.status_code} {response_body.decode("utf-8")}'
+        # prepare and log response (pre-compressed bodies are logged by size)
+        content_encoding = response.headers.get("content-encoding")
+        logged_body = (
+            f"<{len(response_body)} bytes, {content_encoding}>"
+            if content_encoding
+            else response_body.decode("utf-8")
+        )
+        response_log = f'"{request.method} {request.url.path} HTTP/{request.scope["http_version"]}" {response.status_code} {logged_body}'
         logger.info(f"Response: {response_log} (took {process_time:.2f} secs)")
 
         return Response(
@@ -56,7 +66,88 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         )
 
 
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Pin a client's reads to the primary for a short window after it commits.
+
+    The window is carried in a cookie so it survives across requests (and
+    workers) while replicas catch up.
+    """
+
+    cookie_name: str = "db_read_primary_until"
+
+    async def dispatch(self, request: Request, call_next):
+        window = settings.DB_READ_YOUR_WRITES_WINDOW
+
+        try:
+            pinned_until = float(request.cookies.get(self.cookie_name, 0))
+        except ValueError:
+            pinned_until = 0
+
+        state = {"committed": False}
+        primary_token = read_from_primary.set(pinned_until > time.time())
+        commits_token = request_commits.set(state)
+
+        try:
+            response = await call_next(request)
+        finally:
+            read_from_primary.reset(primary_token)
+            request_commits.reset(commits_token)
+
+        if state["committed"] and window > 0:
+            response.set_cookie(
+                self.cookie_name,
+                str(time.time() + window),
+                max_age=window,
+                httponly=True,
+            )
+
+        return response
+
+
+class QueryCounterMiddleware(BaseHTTPMiddleware):
+    """
+    Count the SQL statements a request issues and the time spent running them.
+
+    Adds X-DB-Queries / X-DB-Time-ms headers and logs a structured warning when
+    the request crosses DB_QUERY_COUNT_THRESHOLD statements or repeats one
+    statement shape DB_REPEATED_QUERY_THRESHOLD times (a likely N+1).
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        stats = QueryStats(route=f"{request.method} {request.url.path}")
+        token = query_stats.set(stats)
+
+        try:
+            response = await call_next(request)
+        finally:
+            query_stats.reset(token)
+
+        response.headers["X-DB-Queries"] = str(stats.count)
+        response.headers["X-DB-Time-ms"] = str(stats.time_ms)
+
+        repeated = stats.repeated(settings.DB_REPEATED_QUERY_THRESHOLD)
+        if stats.count > settings.DB_QUERY_COUNT_THRESHOLD or repeated:
+            logger.warning(
+                json.dumps(
+                    {
+                        "event": "db_query_threshold_exceeded",
+                        "method": request.method,
+                        "path": request.url.path,
+                        "status_code": response.status_code,
+                        "queries": stats.count,
+                        "db_time_ms": stats.time_ms,
+                        "likely_n_plus_one": repeated,
+                    }
+                )
+            )
+
+        return response
+
+
 def configure_middleware(app: FastAPI):
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.add_middleware(QueryCounterMiddleware)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(
         CORSMiddleware,
@@ -64,9 +155,9 @@ def configure_middleware(app: FastAPI):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["Content-Disposition"],
+        expose_headers=["Content-Disposition", "X-DB-Queries", "X-DB-Time-ms"],
     )
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
 
     # custom handler to wrap around http response codes
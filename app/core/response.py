@@ -1,11 +1,125 @@
-from typing import Any, Dict, Type, TypeVar, Generic, Optional
-from pydantic import BaseModel, ConfigDict, ValidationError, model_serializer
+import orjson
+import inspect
+import logging
+import functools
+from threading import Lock
+from dataclasses import dataclass
 from importlib import import_module
+from typing import Any, Dict, List, Type, TypeVar, Generic, Optional
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    TypeAdapter,
+    ValidationError,
+    model_serializer,
+)
+from fastapi.routing import APIRoute
+from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
+from pydantic_core import to_jsonable_python
+from fastapi.utils import is_body_allowed_for_status_code
 
+from app.db.dbDeclarative import Base
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
 
+@dataclass(frozen=True)
+class ResponseSchema:
+    """A mapped class's *Response schema and how to convert instances to it."""
+
+    schema: Type[BaseModel]
+    # schemas overriding model_validate (most build a dict by hand) must be
+    # called per item; the rest validate whole lists in one pydantic-core call
+    custom_validate: bool
+    list_adapter: Optional[TypeAdapter]
+
+    def validate(self, data: Any) -> Any:
+        return self.schema.model_validate(data)
+
+    def validate_list(self, data: List[Any]) -> List[Any]:
+        if self.list_adapter is None:
+            return [self.schema.model_validate(item) for item in data]
+
+        return self.list_adapter.validate_python(data, from_attributes=True)
+
+
+class ResponseSchemaRegistry:
+    """
+    Maps each mapped class to its *Response schema, by convention:
+    app.modules.X.models.y.Name -> app.modules.X.schema.y_schema.NameResponse.
+
+    Built once at startup; classes without a schema are remembered as such, so
+    a response never imports modules or walks schemas on the request path.
+    """
+
+    def __init__(self):
+        self._schemas: Dict[Type[Any], Optional[ResponseSchema]] = {}
+        self._lock = Lock()
+
+    def get(self, model: Type[Any]) -> Optional[ResponseSchema]:
+        """Return the class's ResponseSchema (None if it has none), resolving it once."""
+        try:
+            return self._schemas[model]
+        except KeyError:
+            pass
+
+        with self._lock:
+            if model not in self._schemas:
+                self._schemas[model] = self._build(model)
+
+        return self._schemas[model]
+
+    def build_all(self) -> int:
+        """Resolve the schema of every mapped class (called at startup)."""
+        for mapper in Base.registry.mappers:
+            self.get(mapper.class_)
+
+        return sum(entry is not None for entry in self._schemas.values())
+
+    def _build(self, model: Type[Any]) -> Optional[ResponseSchema]:
+        schema = self._resolve(model) if hasattr(model, "__mapper__") else None
+        if schema is None:
+            return None
+
+        custom_validate = (
+            schema.model_validate.__func__ is not BaseModel.model_validate.__func__
+        )
+
+        return ResponseSchema(
+            schema=schema,
+            custom_validate=custom_validate,
+            list_adapter=None if custom_validate else TypeAdapter(List[schema]),
+        )
+
+    def _resolve(self, model: Type[Any]) -> Optional[Type[BaseModel]]:
+        module_name = model.__module__.replace(".models.", ".schema.")
+        if not module_name.endswith("_schema"):
+            module_name += "_schema"
+        schema_name = f"{model.__name__}Response"
+
+        try:
+            schema = getattr(import_module(module_name), schema_name)
+        except (ModuleNotFoundError, AttributeError) as e:
+            logger.debug(f"No response schema for {model.__name__}: {e}")
+            return None
+        except Exception as e:
+            # a schema module that fails to import must not take startup down
+            logger.warning(f"Could not load {module_name}.{schema_name}: {e}")
+            return None
+
+        if not (isinstance(schema, type) and issubclass(schema, BaseModel)):
+            return None
+
+        return schema
+
+
+# create response schema registry
+response_schema_registry = ResponseSchemaRegistry()
+
+
 class DAOResponse(BaseModel, Generic[T]):
     success: bool = False
     error: Optional[str] = None
@@ -34,33 +148,10 @@ class DAOResponse(BaseModel, Generic[T]):
             self.set_validation_errors(validation_error)
 
     def resolve_pydantic_schema(self, sa_instance: Any) -> Type[BaseModel]:
-        """Dynamically resolve the Pydantic schema for a SQLAlchemy model instance."""
-        response_mapping_cache: Dict[Type[Any], Type[BaseModel]] = {}
-        sa_class = type(sa_instance)
-
-        # Check if we already resolved this type
-        if sa_class in response_mapping_cache:
-            return response_mapping_cache[sa_class]
-
-        # Derive the schema name and module path based on the model name
-        sa_module_name = sa_class.__module__.replace(".models.", ".schema.")
-        sa_class_name = sa_class.__name__
-        schema_class_name = (
-            f"{sa_class_name}Response"  # Deriving schema name conventionally
-        )
+        """Resolve the Pydantic schema for a SQLAlchemy model instance."""
+        entry = response_schema_registry.get(type(sa_instance))
 
-        if not sa_module_name.endswith("_schema"):
-            sa_module_name += "_schema"  # Adding "_schema" to the module name
-
-        try:
-            print(f"Trying to import: {sa_module_name}.{schema_class_name}")
-            schema_module = import_module(sa_module_name)
-            schema_class = getattr(schema_module, schema_class_name)
-            response_mapping_cache[sa_class] = schema_class
-            return schema_class
-        except (ImportError, AttributeError) as e:
-            print(f"Could not resolve Pydantic schema for {sa_class}: {e}")
-            return None
+        return entry.schema if entry else None
 
     def _convert_data(self, data: Any) -> Any:
         """Convert the data to the appropriate response object based on its type."""
@@ -68,20 +159,13 @@ class DAOResponse(BaseModel, Generic[T]):
             return data
 
         # Determine if the data is a list or a single instance
-        sa_instance = data[0] if isinstance(data, list) else data
-
-        # Dynamically resolve the Pydantic schema
-        response_class = self.resolve_pydantic_schema(sa_instance)
-        print(f"response_class {response_class} {type(response_class)}")
+        is_list = isinstance(data, list)
+        entry = response_schema_registry.get(type(data[0] if is_list else data))
 
-        if not response_class:
+        if not entry:
             return data  # Fallback if no schema can be resolved
 
-        return (
-            [response_class.model_validate(item) for item in data]
-            if isinstance(data, list)
-            else response_class.model_validate(data)
-        )
+        return entry.validate_list(data) if is_list else entry.validate(data)
 
     def set_validation_errors(self, validation_error: ValidationError):
         error_messages = []
@@ -94,9 +178,14 @@ class DAOResponse(BaseModel, Generic[T]):
     def set_meta(self, meta):
         self.meta = meta
 
-    @model_serializer(when_used="json")
-    def dump_model(self) -> Dict[str, Any]:
-        result = super().model_dump()
+    def content(self) -> Dict[str, Any]:
+        """The response body before JSON encoding, without an empty meta."""
+        result = {
+            "success": self.success,
+            "error": self.error,
+            "data": self.data,
+            "meta": self.meta,
+        }
 
         if not self.meta:
             result.pop("meta", None)
@@ -105,6 +194,10 @@ class DAOResponse(BaseModel, Generic[T]):
 
         return result
 
+    @model_serializer(when_used="json")
+    def dump_model(self) -> Dict[str, Any]:
+        return self.content()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "success": self.success,
@@ -120,3 +213,74 @@ class DAOResponse(BaseModel, Generic[T]):
     @classmethod
     def model_validate(cls: Type[T], obj: Any) -> T:
         return cls.model_validate(obj)
+
+
+class DAOJSONResponse(JSONResponse):
+    """
+    JSON response encoded in a single orjson pass.
+
+    A DAOResponse is rendered straight from its fields. orjson encodes dicts,
+    lists, UUIDs, datetimes and enums natively and hands anything else (nested
+    pydantic models, Decimal, ...) to pydantic's JSON conversion, so bodies
+    match those of FastAPI's serialize and jsonable_encoder passes. ORM objects
+    without a response schema are left as is by DAOResponse and, as FastAPI
+    does, encoded by jsonable_encoder (their loaded attributes).
+    """
+
+    @staticmethod
+    def default(value: Any) -> Any:
+        if isinstance(value, Base):
+            return jsonable_encoder(value)
+
+        return to_jsonable_python(value)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, DAOResponse):
+            content = content.content()
+
+        return orjson.dumps(
+            content,
+            default=self.default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+
+
+class DAOAPIRoute(APIRoute):
+    """
+    Route returning the DAOResponse of its endpoint as a DAOJSONResponse.
+
+    FastAPI would otherwise validate the returned DAOResponse against the
+    response model, dump it and run it through jsonable_encoder before the
+    response class encodes it. The status code and headers set on the
+    endpoint's Response parameter are kept, as FastAPI does.
+    """
+
+    def get_route_handler(self):
+        if inspect.iscoroutinefunction(self.dependant.call):
+            self.dependant.call = self.encode_responses(self.dependant.call)
+
+        return super().get_route_handler()
+
+    def encode_responses(self, call):
+        response_param = self.dependant.response_param_name
+
+        @functools.wraps(call)
+        async def endpoint(**values):
+            result = await call(**values)
+            if not isinstance(result, DAOResponse):
+                return result
+
+            sub_response = values.get(response_param) if response_param else None
+            status_code = (
+                sub_response and sub_response.status_code
+            ) or self.status_code
+
+            response = DAOJSONResponse(content=result, status_code=status_code or 200)
+            if not is_body_allowed_for_status_code(response.status_code):
+                response.body = b""
+            if sub_response is not None:
+                response.headers.raw.extend(sub_response.headers.raw)
+
+            return response
+
+        return endpoint
@@ -8,6 +8,7 @@ from app.modules.forms.router.answer_router import AnswerRouter
 from app.modules.forms.router.question_router import QuestionRouter
 from app.modules.forms.router.questionnaire_router import QuestionnaireRouter
 from app.modules.auth.router.attendance_log_router import AttendanceLogRouter
+from app.modules.common.router.internal_router import InternalRouter
 
 router = APIRouter()
 
@@ -42,3 +43,6 @@ def configure_routes(app: FastAPI):
 
     # Create an instance of AttendanceRouter
     app.include_router(AttendanceLogRouter().router)
+
+    # Create an instance of InternalRouter
+    app.include_router(InternalRouter().router)
@@ -1,14 +1,32 @@
+import json
+import base64
+import logging
 from uuid import UUID
-from importlib import import_module
+from datetime import datetime
+from contextlib import asynccontextmanager
 from sqlalchemy.future import select
-from sqlalchemy import and_, between, func, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy.orm import selectinload, InstrumentedAttribute
-from typing import List, Type, TypeVar, Dict, Any, Union, Optional
+from sqlalchemy import and_, between, event, func, tuple_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload, noload, InstrumentedAttribute
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 # core
 from app.core.errors import (
+    CustomException,
     IntegrityError,
     RecordNotFoundException,
     ForeignKeyError,
@@ -22,11 +40,18 @@ from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
 from app.modules.common.models.model_base import (
     BaseModelCollection,
     BaseModel,
+    register_inserted_model,
     registry,
 )
+from app.modules.common.models.model_meta import ModelMeta, model_meta_registry
 
 DBModelType = TypeVar("DBModelType")
 
+logger = logging.getLogger(__name__)
+
+# mapper events that flushing runs and native upserts skip
+WRITE_EVENTS = ("before_insert", "after_insert", "before_update", "after_update")
+
 
 class BaseMixin:
     primary_key: str
@@ -47,43 +72,24 @@ class BaseMixin:
         self.args = args
         self.kwargs = kwargs
         self.primary_key = kwargs.get("primary_key")
+        self.natural_key = kwargs.get("natural_key") or []
+        self.include_graph = kwargs.get("include_graph") or []
+
+    @property
+    def model_meta(self) -> ModelMeta:
+        return model_meta_registry.get(self.model)
 
     def get_model_fields(self) -> List[str]:
-        mapper = inspect(self.model)
-        return [column.key for column in mapper.attrs if hasattr(column, "columns")]
+        return list(self.model_meta.column_keys)
 
     def get_entity_type(self, db_obj: DBModelType) -> EntityTypeEnum:
-        if isinstance(
-            db_obj, getattr(import_module("app.modules.auth.models.user"), "User")
-        ):
-            return EntityTypeEnum.user
-        if isinstance(
-            db_obj, getattr(import_module("app.modules.auth.models.role"), "Role")
-        ):
-            return EntityTypeEnum.role
-        elif isinstance(
-            db_obj,
-            getattr(
-                import_module("app.modules.properties.models.property"), "Property"
-            ),
-        ):
-            return EntityTypeEnum.property
-        elif isinstance(
-            db_obj,
-            getattr(
-                import_module("app.modules.properties.models.rental_history"),
-                "PastRentalHistory",
-            ),
-        ):
-            return EntityTypeEnum.pastrentalhistory
-        elif isinstance(
-            db_obj,
-            getattr(import_module("app.modules.billing.models.account"), "Account"),
-        ):
-            return EntityTypeEnum.account
-        else:
+        entity_type = model_meta_registry.get(type(db_obj)).entity_type
+
+        if entity_type is None:
             raise ValueError(f"Unknown entity type for object {db_obj}")
 
+        return entity_type
+
     def filter_input_fields(
         self, obj_in: Union[Dict[str, Any] | PydanticBaseModel | Any]
     ) -> Dict[str, Any]:
@@ -93,7 +99,7 @@ class BaseMixin:
             elif not isinstance(obj_in, dict):
                 raise ValueError("Input must be a dictionary or a BaseModel instance.")
 
-            valid_fields = self.get_model_fields()
+            valid_fields = self.model_meta.column_key_set
 
             return {
                 k: v for k, v in obj_in.items() if k in valid_fields and v is not None
@@ -101,6 +107,61 @@ class BaseMixin:
         except Exception as e:
             raise Exception(e)
 
+    def parse_includes(self, include: Optional[Union[str, List[str]]]) -> List[str]:
+        """
+        Parse and validate the relationships requested through `include=`.
+
+        Args:
+            include (Optional[Union[str, List[str]]]): Comma separated string or list of
+                dotted relationship paths, e.g. "roles,roles.permissions".
+
+        Returns:
+            List[str]: The requested paths, all of which are declared in `include_graph`.
+        """
+        if not include:
+            return []
+
+        paths = include.split(",") if isinstance(include, str) else include
+        paths = [path.strip() for path in paths if path and path.strip()]
+        not_allowed = [path for path in paths if path not in self.include_graph]
+
+        if not_allowed:
+            raise CustomException(
+                f"Cannot include {', '.join(not_allowed)} on {self.model.__name__}. "
+                f"Allowed values: {', '.join(self.include_graph) or 'none'}"
+            )
+
+        return paths
+
+    def get_loader_options(self, include: Optional[List[str]] = None) -> List[Any]:
+        """
+        Build the relationship loader options for a read query.
+
+        When `include` is None every relationship on the mapper is selectin loaded.
+        Otherwise only the requested paths are selectin loaded and every other
+        relationship (including those on the loaded children) is not loaded.
+        """
+        if include is None:
+            return list(self.model_meta.loader_options)
+
+        query_options = [noload("*")]
+
+        for path in include:
+            model, loader = self.model, None
+
+            for attr in path.split("."):
+                relationship_attr = getattr(model, attr)
+                loader = (
+                    selectinload(relationship_attr)
+                    if loader is None
+                    else loader.selectinload(relationship_attr)
+                )
+                model = relationship_attr.property.mapper.class_
+
+            query_options.append(loader.noload("*"))
+
+        return query_options
+
     def validate_primary_key(
         self, uuid_to_test: Union[str, UUID], version: int = 4
     ) -> Union[str, UUID]:
@@ -111,9 +172,62 @@ class BaseMixin:
 
         return uuid_obj
 
+    async def after_write(self, db_session: AsyncSession, db_objs: List[DBModelType]):
+        """
+        Hook run after objects of this model are created, updated or deleted.
+
+        Inside a unit of work it runs before the commit; see after_commit.
+        """
+
+    async def after_commit(self, db_session: AsyncSession):
+        """Hook run once the outermost unit of work has committed."""
+
+    async def run_after_commit(self, db_session: AsyncSession):
+        """Run after_commit; the write is already committed, so errors are logged."""
+        try:
+            await self.after_commit(db_session)
+        except Exception as e:
+            logger.exception(f"after_commit failed for {self.model.__name__}: {e}")
+
+    def in_unit_of_work(self, db_session: AsyncSession) -> bool:
+        return bool(db_session.info.get("unit_of_work"))
+
+    @asynccontextmanager
+    async def unit_of_work(self, db_session: AsyncSession) -> AsyncIterator[bool]:
+        """
+        Stage every write made inside the block and commit once when the
+        outermost block exits; any error rolls the whole block back.
+
+        Nested blocks (e.g. child DAOs called from create_or_update_relationships)
+        join the outer one, and commit_and_refresh only returns the object while a
+        unit of work is open.
+
+        Yields:
+            True for the outermost block, whose caller should refresh its object.
+        """
+        if self.in_unit_of_work(db_session):
+            yield False
+            return
+
+        db_session.info["unit_of_work"] = True
+        try:
+            yield True
+            db_session.info.pop("unit_of_work", None)
+            await db_session.commit()
+        except Exception:
+            db_session.info.pop("unit_of_work", None)
+            await db_session.rollback()
+            raise
+
+        await self.run_after_commit(db_session)
+
     async def commit_and_refresh(
         self, db_session: AsyncSession, obj: DBModelType
     ) -> DBModelType:
+        # staged: the outermost unit of work commits and refreshes once
+        if self.in_unit_of_work(db_session):
+            return obj
+
         try:
             await db_session.commit()
             await db_session.refresh(obj)
@@ -176,6 +290,12 @@ class BaseMixin:
         db_obj: Union[DBModelType, BaseModel],
         obj_data: Union[Dict[str, Any], PydanticBaseModel],
     ):
+        """
+        Create or update the detail_mappings children of db_obj and link them.
+
+        Nothing is committed here: create/update run this inside unit_of_work,
+        which commits the parent and every child together.
+        """
         try:
             # Get config registry
             config = registry.get_config()
@@ -220,7 +340,13 @@ class BaseMixin:
 
                 # Initialize variables and process items in detail_obj_list
                 new_items = []
-                model_attr = getattr(db_obj, mapped_obj_key, None)
+
+                # nothing is refreshed mid unit of work, so load the collection async
+                model_attr = (
+                    await getattr(db_obj.awaitable_attrs, mapped_obj_key)
+                    if hasattr(type(db_obj), mapped_obj_key)
+                    else None
+                )
 
                 print(
                     f"\n\tDetermine any already linked relationship items from DB {model_attr}"
@@ -239,12 +365,6 @@ class BaseMixin:
                         f"\t\tDone creating mapped object item for model {self.model.__name__}"
                     )
 
-                    # Single flush and refresh after each item
-                    await db_session.flush()
-                    mapped_obj_created_item = await self.commit_and_refresh(
-                        db_session=db_session, obj=mapped_obj_created_item
-                    )
-
                     # Entity config parameters
                     if isinstance(mapped_obj_created_item, BaseModel):
                         entity_config = obj_config or config.get(
@@ -321,13 +441,6 @@ class BaseMixin:
                     else:
                         raise ValueError("Not all items are valid ORM instances")
 
-                # Single flush and refresh after each mapping
-                await db_session.flush()
-                await db_session.refresh(db_obj)
-                db_obj = await self.commit_and_refresh(
-                    db_session=db_session, obj=db_obj
-                )
-
         except Exception as e:
             raise Exception(f"Error in create_or_update_relationships: {str(e)}")
 
@@ -552,24 +665,33 @@ class CreateMixin(BaseMixin):
         obj_in: Union[Dict[str, Any] | PydanticBaseModel | Any],
     ) -> DBModelType:
         try:
-            db_obj = self.model(**self.filter_input_fields(obj_in))
-            db_session.add(db_obj)
-            await self.commit_and_refresh(db_session=db_session, obj=db_obj)
-
-            obj_data = (
-                obj_in.model_dump()
-                if isinstance(obj_in, PydanticBaseModel)
-                or isinstance(obj_in, BaseModel)
-                and not isinstance(obj_in, dict)
-                else obj_in
-            )
+            async with self.unit_of_work(db_session) as outermost:
+                db_obj = self.model(**self.filter_input_fields(obj_in))
+                db_session.add(db_obj)
+
+                obj_data = (
+                    obj_in.model_dump()
+                    if isinstance(obj_in, PydanticBaseModel)
+                    or isinstance(obj_in, BaseModel)
+                    and not isinstance(obj_in, dict)
+                    else obj_in
+                )
+
+                if self.detail_mappings:
+                    print(f"\tin self.detail_mappings {self.detail_mappings}\n")
+
+                    # children need the parent's generated keys
+                    await db_session.flush()
+                    await self.create_or_update_relationships(
+                        db_session, db_obj, obj_data
+                    )
+
+                await self.after_write(db_session, [db_obj])
 
-            if self.detail_mappings:
-                print(f"\tin self.detail_mappings {self.detail_mappings}\n")
-                await self.create_or_update_relationships(db_session, db_obj, obj_data)
+            if outermost:
+                await db_session.refresh(db_obj)
 
-            await db_session.flush()
-            return await self.commit_and_refresh(db_session=db_session, obj=db_obj)
+            return db_obj
 
         except IntegrityError as e:
             await db_session.rollback()
@@ -578,6 +700,115 @@ class CreateMixin(BaseMixin):
             await db_session.rollback()
             raise Exception(str(e))
 
+    @property
+    def can_bulk_create(self) -> bool:
+        """Bulk writes bypass create, so they are only offered when it is not overridden."""
+        return type(self).create is CreateMixin.create
+
+    def build_bulk_object(
+        self, obj_in: Union[Dict[str, Any] | PydanticBaseModel]
+    ) -> DBModelType:
+        """
+        Turn one bulk input into a new model instance.
+
+        The model is instantiated so constructors and @validates hooks run as on
+        create; nested relationship payloads are rejected since bulk rows are
+        column data only.
+        """
+        obj_data = (
+            obj_in.model_dump() if isinstance(obj_in, PydanticBaseModel) else obj_in
+        )
+        nested_keys = [key for key in self.detail_mappings or {} if obj_data.get(key)]
+
+        if nested_keys:
+            raise ValueError(
+                f"Relationship data is not supported in bulk create: {', '.join(nested_keys)}"
+            )
+
+        return self.model(**self.filter_input_fields(obj_data))
+
+    def build_bulk_row(
+        self, obj_in: Union[Dict[str, Any] | PydanticBaseModel]
+    ) -> Dict[str, Any]:
+        """Turn one bulk input into an insertable row (see build_bulk_object)."""
+        db_obj = self.build_bulk_object(obj_in)
+        columns = self.model_meta.column_key_set
+
+        return {key: value for key, value in vars(db_obj).items() if key in columns}
+
+    async def load_bulk_objects(
+        self, db_session: AsyncSession, db_objs: List[DBModelType]
+    ):
+        """
+        Load the columns (server and database defaults) and relationships that
+        flushing new objects leaves unloaded, in one query for all of them.
+        """
+        primary_key = getattr(self.model, self.primary_key)
+        ids = [getattr(db_obj, self.primary_key) for db_obj in db_objs]
+
+        await db_session.execute(
+            select(self.model)
+            .where(primary_key.in_(ids))
+            .execution_options(populate_existing=True)
+        )
+
+    async def bulk_create(
+        self,
+        db_session: AsyncSession,
+        objs: List[Union[Dict[str, Any] | PydanticBaseModel]],
+        chunk_size: int = 500,
+    ) -> Tuple[List[DBModelType], List[Dict[str, Any]]]:
+        """
+        Create many objects, flushing them through the unit of work one chunk at
+        a time.
+
+        The flush runs the mapper events (before_insert, after_insert, ...) that
+        create relies on, and SQLAlchemy still batches each chunk into multi-row
+        INSERT ... RETURNING statements (insertmanyvalues) where the dialect
+        supports them.
+
+        All chunks are written in a single transaction. If any row cannot be built
+        nothing is written; a database error rolls back every chunk.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            objs (list): Objects to create.
+            chunk_size (int): Maximum number of rows flushed at once.
+
+        Returns:
+            Tuple of the created objects (in input order) and the per-row errors
+            as {"index", "error"} dicts (with "count" for a failed chunk).
+        """
+        db_objs, errors = [], []
+        for index, obj_in in enumerate(objs):
+            try:
+                db_objs.append(self.build_bulk_object(obj_in))
+            except Exception as e:
+                errors.append({"index": index, "error": str(e)})
+
+        if errors or not db_objs:
+            return [], errors
+
+        try:
+            for start in range(0, len(db_objs), chunk_size):
+                chunk = db_objs[start : start + chunk_size]
+
+                try:
+                    db_session.add_all(chunk)
+                    await db_session.flush()
+                    await self.load_bulk_objects(db_session, chunk)
+                except Exception as e:
+                    await db_session.rollback()
+                    return [], [{"index": start, "count": len(chunk), "error": str(e)}]
+
+            await db_session.commit()
+            await self.after_write(db_session, db_objs)
+            return db_objs, []
+
+        except Exception as e:
+            await db_session.rollback()
+            raise Exception(f"Error bulk creating data: {str(e)}")
+
 
 class ReadMixin(BaseMixin):
     async def get(
@@ -586,12 +817,9 @@ class ReadMixin(BaseMixin):
         id: Union[UUID, str, int],
         skip: int = 0,
         limit: int = 100,
+        include: Optional[List[str]] = None,
     ) -> Optional[DBModelType]:
-        mapper = inspect(self.model)
-        relationships = [relationship.key for relationship in mapper.relationships]
-        query_options = [
-            selectinload(getattr(self.model, attr)) for attr in relationships
-        ]
+        query_options = self.get_loader_options(include)
 
         # find model object based on primary key
         filter = {f"{self.primary_key}": self.validate_primary_key(id)}
@@ -612,14 +840,48 @@ class ReadMixin(BaseMixin):
 
         return result
 
+    async def get_many(
+        self,
+        db_session: AsyncSession,
+        ids: List[Union[UUID, str, int]],
+        include: Optional[List[str]] = None,
+    ) -> List[Optional[DBModelType]]:
+        """
+        Fetch many objects by primary key with one `WHERE pk IN (...)` query.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            ids (list): Primary keys; duplicates are only queried once.
+            include (Optional[List[str]]): Relationship paths to load.
+
+        Returns:
+            The objects in the order of ids, None where no row exists.
+        """
+        keys = {str(id): self.validate_primary_key(str(id)) for id in ids}
+        if not keys:
+            return []
+
+        query = (
+            select(self.model)
+            .filter(getattr(self.model, self.primary_key).in_(list(keys.values())))
+            .options(*self.get_loader_options(include))
+        )
+        executed_query = await db_session.execute(query)
+        found = {
+            str(getattr(db_obj, self.primary_key)): db_obj
+            for db_obj in executed_query.scalars().all()
+        }
+
+        return [found.get(str(id)) for id in ids]
+
     async def get_all(
-        self, db_session: AsyncSession, offset: int = 0, limit: int = 100
+        self,
+        db_session: AsyncSession,
+        offset: int = 0,
+        limit: int = 100,
+        include: Optional[List[str]] = None,
     ) -> List[DBModelType]:
-        mapper = inspect(self.model)
-        relationships = [relationship.key for relationship in mapper.relationships]
-        query_options = [
-            selectinload(getattr(self.model, attr)) for attr in relationships
-        ]
+        query_options = self.get_loader_options(include)
 
         query = select(self.model).options(*query_options).offset(offset).limit(limit)
         executed_query = await db_session.execute(query)
@@ -627,6 +889,82 @@ class ReadMixin(BaseMixin):
 
         return result
 
+    def encode_cursor(self, db_obj: DBModelType) -> str:
+        """Encode the (created_at, primary key) position of an object as an opaque cursor."""
+        position = [
+            db_obj.created_at.isoformat(),
+            str(getattr(db_obj, self.primary_key)),
+        ]
+
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, cursor: str) -> Tuple[datetime, Any]:
+        """Decode a cursor produced by `encode_cursor` back into (created_at, primary key)."""
+        try:
+            created_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            pk_type = getattr(self.model, self.primary_key).type.python_type
+
+            return datetime.fromisoformat(created_at), pk_type(pk)
+        except Exception:
+            raise CustomException(f"Invalid cursor: {cursor}")
+
+    async def get_all_keyset(
+        self,
+        db_session: AsyncSession,
+        limit: int = 100,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        include: Optional[List[str]] = None,
+    ) -> Tuple[List[DBModelType], Dict[str, Optional[str]]]:
+        """
+        Fetch a page ordered by (created_at, primary key) starting from a cursor.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            limit (int): Page size.
+            after (Optional[str]): Return the rows that come after this cursor.
+            before (Optional[str]): Return the rows that come before this cursor.
+            include (Optional[List[str]]): Relationship paths to load.
+
+        Returns:
+            Tuple[List[DBModelType], Dict[str, Optional[str]]]: The rows and the
+            `next` / `previous` cursors (None when there is no such page).
+        """
+        if after and before:
+            raise CustomException("Only one of after or before can be provided")
+
+        created_at = self.model.created_at
+        pk = getattr(self.model, self.primary_key)
+        query = select(self.model).options(*self.get_loader_options(include))
+
+        if before:
+            query = query.filter(
+                tuple_(created_at, pk) < self.decode_cursor(before)
+            ).order_by(created_at.desc(), pk.desc())
+        else:
+            if after:
+                query = query.filter(tuple_(created_at, pk) > self.decode_cursor(after))
+            query = query.order_by(created_at.asc(), pk.asc())
+
+        # fetch one extra row to know whether another page exists
+        executed_query = await db_session.execute(query.limit(limit + 1))
+        result = list(executed_query.scalars().all())
+        has_more = len(result) > limit
+        result = result[:limit]
+
+        if before:
+            result.reverse()
+
+        has_next = bool(before) or has_more
+        has_previous = has_more if before else bool(after)
+
+        return result, {
+            "next": self.encode_cursor(result[-1]) if result and has_next else None,
+            "previous": self.encode_cursor(result[0])
+            if result and has_previous
+            else None,
+        }
+
     async def query_on_joins(
         self,
         db_session: AsyncSession,
@@ -747,6 +1085,56 @@ class ReadMixin(BaseMixin):
 
         return count
 
+    async def query_version(
+        self,
+        db_session: AsyncSession,
+        id: Optional[Union[UUID, str, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Optional[Tuple[Optional[datetime], int, List[str]]]:
+        """
+        The newest updated_at, the row count and the primary keys of the rows a
+        read serves: the row with primary key id, the get_all page at
+        offset/limit, or the whole table. Changes whenever one of them does.
+
+        A page is read as primary keys and updated_at only (not the full table
+        scan of max(updated_at)); its count is the table's, as the page's total
+        is, so rows added or deleted elsewhere change it too.
+
+        Returns:
+            Optional[Tuple[Optional[datetime], int, List[str]]]: None if the model
+            has no updated_at column.
+        """
+        updated_at = getattr(self.model, "updated_at", None)
+        if updated_at is None:
+            return None
+
+        if id is None and limit is None:
+            query = select(func.max(updated_at), func.count()).select_from(self.model)
+            last_modified, count = (await db_session.execute(query)).one()
+
+            return last_modified, count, []
+
+        primary_key = getattr(self.model, self.primary_key)
+        query = select(primary_key, updated_at)
+        if id is not None:
+            query = query.where(primary_key == self.validate_primary_key(id))
+        else:
+            query = query.offset(offset).limit(limit)
+
+        rows = (await db_session.execute(query)).all()
+        if id is not None:
+            count = len(rows)
+        else:
+            count_query = select(func.count()).select_from(self.model)
+            count = (await db_session.execute(count_query)).scalar_one()
+
+        last_modified = max(
+            (row[1] for row in rows if row[1] is not None), default=None
+        )
+
+        return last_modified, count, [str(row[0]) for row in rows]
+
     async def query_on_create(
         self,
         db_session: AsyncSession,
@@ -781,22 +1169,30 @@ class UpdateMixin(BaseMixin):
             if obj_in_fields is None:
                 raise ValueError("Input fields cannot be None")
 
-            for field, value in obj_in_fields.items():
-                if hasattr(db_obj, field):
-                    setattr(db_obj, field, value)
-            db_session.add(db_obj)
+            async with self.unit_of_work(db_session) as outermost:
+                for field, value in obj_in_fields.items():
+                    if hasattr(db_obj, field):
+                        setattr(db_obj, field, value)
+                db_session.add(db_obj)
 
-            obj_data = (
-                obj_in.model_dump()
-                if isinstance(obj_in, PydanticBaseModel)
-                or isinstance(obj_in, BaseModel)
-                else obj_in
-            )
-            if self.detail_mappings:
-                print(f"\tin update self.detail_mappings {self.detail_mappings}\n")
-                await self.create_or_update_relationships(db_session, db_obj, obj_data)
+                obj_data = (
+                    obj_in.model_dump()
+                    if isinstance(obj_in, PydanticBaseModel)
+                    or isinstance(obj_in, BaseModel)
+                    else obj_in
+                )
+                if self.detail_mappings:
+                    print(f"\tin update self.detail_mappings {self.detail_mappings}\n")
+                    await self.create_or_update_relationships(
+                        db_session, db_obj, obj_data
+                    )
 
-            return await self.commit_and_refresh(db_session=db_session, obj=db_obj)
+                await self.after_write(db_session, [db_obj])
+
+            if outermost:
+                await db_session.refresh(db_obj)
+
+            return db_obj
 
         except Exception as e:
             await db_session.rollback()
@@ -809,6 +1205,7 @@ class DeleteMixin(BaseMixin):
     ) -> DBModelType:
         await db_session.delete(db_obj)
         await db_session.commit()
+        await self.after_write(db_session, [db_obj])
 
 
 class DBOperations(CreateMixin, ReadMixin, UpdateMixin, DeleteMixin):
@@ -835,6 +1232,178 @@ class DBOperations(CreateMixin, ReadMixin, UpdateMixin, DeleteMixin):
             **kwargs,
         )
 
+    def get_conflict_keys(self, row: Dict[str, Any]) -> List[str]:
+        """Columns an upsert of row is keyed on: the primary key if given, else the natural key."""
+        if row.get(self.primary_key) is None and self.natural_key:
+            if all(row.get(key) is not None for key in self.natural_key):
+                return list(self.natural_key)
+
+        return [self.primary_key]
+
+    def has_write_listeners(self) -> bool:
+        """Whether the model has insert/update mapper listeners besides the registry's."""
+        dispatch = self.model.__mapper__.dispatch
+        listeners = sum(len(getattr(dispatch, name)) for name in WRITE_EVENTS)
+
+        return listeners > event.contains(
+            self.model, "before_insert", register_inserted_model
+        )
+
+    def can_upsert(self, obj_in: Union[Dict[str, Any], PydanticBaseModel]) -> bool:
+        """
+        Native upserts bypass create/update and the mapper events, so they are only
+        used when the DAO overrides neither, the model has no insert/update
+        listeners and the input carries no nested relationship data.
+        """
+        obj_data = (
+            obj_in.model_dump() if isinstance(obj_in, PydanticBaseModel) else obj_in
+        )
+
+        return (
+            isinstance(obj_data, dict)
+            and self.can_bulk_create
+            and type(self).update is UpdateMixin.update
+            and not self.has_write_listeners()
+            and not any(obj_data.get(key) for key in self.detail_mappings or {})
+        )
+
+    def build_upsert_statement(
+        self, db_session: AsyncSession, keys: List[str], conflict_keys: List[str]
+    ):
+        """Build the dialect's INSERT ... ON CONFLICT / ON DUPLICATE KEY statement."""
+        dialect_name = db_session.get_bind().dialect.name
+        update_keys = [
+            key for key in keys if key not in conflict_keys and key != "created_at"
+        ] or conflict_keys
+
+        if dialect_name == "mysql":
+            stmt = mysql_insert(self.model)
+            return stmt.on_duplicate_key_update(
+                {
+                    **{key: stmt.inserted[key] for key in update_keys},
+                    **self.get_onupdate_values(keys),
+                }
+            )
+
+        insert_func = postgres_insert if dialect_name == "postgresql" else sqlite_insert
+        stmt = insert_func(self.model)
+
+        return stmt.on_conflict_do_update(
+            index_elements=conflict_keys,
+            set_={
+                **{key: stmt.excluded[key] for key in update_keys},
+                **self.get_onupdate_values(keys),
+            },
+        )
+
+    def get_onupdate_values(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Values of the columns with an onupdate default (e.g. updated_at) that
+        the rows do not set. ON CONFLICT / ON DUPLICATE KEY updates do not fire
+        onupdate defaults, so the upsert has to set them itself.
+        """
+        values = {}
+        for column in self.model.__table__.columns:
+            onupdate = column.onupdate
+            if onupdate is None or column.key in keys or onupdate.is_sequence:
+                continue
+
+            # zero-argument callables are wrapped by SQLAlchemy to take a context
+            values[column.key] = (
+                onupdate.arg(None) if onupdate.is_callable else onupdate.arg
+            )
+
+        return values
+
+    async def bulk_upsert(
+        self,
+        db_session: AsyncSession,
+        objs: List[Union[Dict[str, Any], PydanticBaseModel]],
+        chunk_size: int = 500,
+        commit: bool = True,
+    ) -> List[DBModelType]:
+        """
+        Insert or update many rows with one native upsert statement per chunk.
+
+        Rows are keyed on the primary key when present, otherwise on the DAO's
+        natural_key. Rows with the same columns and conflict keys share a statement.
+
+        Args:
+            db_session (AsyncSession): The database session.
+            objs (list): Objects to insert or update (column data only).
+            chunk_size (int): Maximum number of rows per statement.
+            commit (bool): Commit once all chunks are written.
+
+        Returns:
+            The upserted objects in input order.
+        """
+        rows = [self.build_bulk_row(obj_in) for obj_in in objs]
+        dialect = db_session.get_bind().dialect
+
+        # group rows that can share one statement, remembering their input position
+        groups: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[int]] = {}
+        for index, row in enumerate(rows):
+            conflict_keys = tuple(self.get_conflict_keys(row))
+            groups.setdefault((tuple(row.keys()), conflict_keys), []).append(index)
+
+        results: List[Optional[DBModelType]] = [None] * len(rows)
+
+        try:
+            for (keys, conflict_keys), indexes in groups.items():
+                stmt = self.build_upsert_statement(
+                    db_session, list(keys), list(conflict_keys)
+                )
+
+                for start in range(0, len(indexes), chunk_size):
+                    chunk_indexes = indexes[start : start + chunk_size]
+                    chunk = [rows[index] for index in chunk_indexes]
+
+                    if dialect.insert_executemany_returning_sort_by_parameter_order:
+                        upserted = await db_session.scalars(
+                            stmt.returning(
+                                self.model, sort_by_parameter_order=True
+                            ).execution_options(populate_existing=True),
+                            chunk,
+                        )
+                        upserted = upserted.all()
+                    else:
+                        # no RETURNING (e.g. MySQL): read the rows back by their keys
+                        await db_session.execute(stmt, chunk)
+                        upserted = [
+                            await self.query(
+                                db_session=db_session,
+                                filters={key: row[key] for key in conflict_keys},
+                                single=True,
+                            )
+                            for row in chunk
+                        ]
+
+                    for index, db_obj in zip(chunk_indexes, upserted):
+                        results[index] = db_obj
+
+            if commit and not self.in_unit_of_work(db_session):
+                await db_session.commit()
+
+            await self.after_write(db_session, results)
+            return results
+
+        except Exception as e:
+            await db_session.rollback()
+            raise Exception(f"Error upserting data: {str(e)}")
+
+    async def upsert(
+        self,
+        db_session: AsyncSession,
+        obj_in: Union[Dict[str, Any], PydanticBaseModel],
+        commit: bool = True,
+    ) -> DBModelType:
+        """Insert or update a single row with one native upsert statement."""
+        upserted = await self.bulk_upsert(
+            db_session=db_session, objs=[obj_in], commit=commit
+        )
+
+        return upserted[0]
+
     async def create_or_update(
         self,
         db_session: AsyncSession,
@@ -843,6 +1412,9 @@ class DBOperations(CreateMixin, ReadMixin, UpdateMixin, DeleteMixin):
         update_existing: bool = True,
     ) -> DBModelType:
         try:
+            if not filters and update_existing and self.can_upsert(obj_in):
+                return await self.upsert(db_session=db_session, obj_in=obj_in)
+
             existing_obj = None
             primary_key_value = obj_in.get(self.primary_key)
             print(f"\tcreate_or_update: {self.primary_key} :::: {primary_key_value}")
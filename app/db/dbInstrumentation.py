@@ -0,0 +1,89 @@
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.dbSlowQuery import slow_query_log
+
+# collapses expanded IN lists / VALUES tuples so they share one statement shape
+_PLACEHOLDER = r"(?:\?|%s|%\(\w+\)s|\$\d+|:\w+)(?:::\w+)?"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryStats:
+    """Statements issued (and time spent in the database) while serving one request."""
+
+    def __init__(self, route: Optional[str] = None):
+        self.route = route
+        self.count: int = 0
+        self.time_total: float = 0.0
+        self.shapes: Counter = Counter()
+
+    @staticmethod
+    def normalize(statement: str) -> str:
+        statement = _WHITESPACE.sub(" ", statement).strip()
+        return _PLACEHOLDER_LIST.sub("(?)", statement)
+
+    def record(self, statement: str, elapsed: float):
+        self.count += 1
+        self.time_total += elapsed
+        self.shapes[self.normalize(statement)] += 1
+
+    @property
+    def time_ms(self) -> float:
+        return round(self.time_total * 1000, 3)
+
+    def repeated(self, threshold: int) -> List[Dict[str, Any]]:
+        """Statement shapes issued at least `threshold` times (likely N+1 queries)."""
+        return [
+            {"statement": statement, "count": count}
+            for statement, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+# request scoped statistics (see QueryCounterMiddleware)
+query_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start_time"] = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = conn.info.pop("query_start_time", None)
+    if start_time is None:
+        return
+
+    elapsed = time.perf_counter() - start_time
+    stats = query_stats.get()
+
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if slow_query_log.is_slow(elapsed):
+        slow_query_log.record(
+            conn,
+            statement,
+            parameters,
+            executemany,
+            elapsed,
+            normalized=QueryStats.normalize(statement),
+            route=stats.route if stats is not None else None,
+        )
+
+
+def instrument_engine(engine: AsyncEngine | Engine):
+    """Attach the statement counter and slow query log to an engine (idempotent)."""
+    sync_engine: Engine = getattr(engine, "sync_engine", engine)
+
+    if event.contains(sync_engine, "after_cursor_execute", after_cursor_execute):
+        return
+
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
@@ -30,6 +30,11 @@ class DBManager:
             "port": settings.DB_PORT,
             "db": settings.DB_DATABASE,
             "engine": settings.DB_ENGINE,
+            "read_hosts": [
+                host.strip()
+                for host in settings.DB_READ_HOSTS.split(",")
+                if host.strip()
+            ],
         }
 
     def _initialize_db_module(self):
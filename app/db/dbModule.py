@@ -1,20 +1,44 @@
+from itertools import cycle
+from threading import Lock
 from urllib.parse import quote
-from sqlalchemy import create_engine, text
+from contextvars import ContextVar
+from sqlalchemy.pool import NullPool
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Any, TypeVar, AsyncIterator
+from sqlalchemy import event, text
+from typing import Any, Dict, List, Optional, TypeVar, AsyncIterator
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
 )
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session
 
 
 from app.core.config import settings
 from app.db.dbDeclarative import Base
+from app.db.dbPool import MeteredQueuePool
+from app.db.dbInstrumentation import instrument_engine
 import app.core.errors as DBExceptions
 
+# request scoped routing state (see ReadYourWritesMiddleware)
+read_from_primary: ContextVar[bool] = ContextVar("read_from_primary", default=False)
+request_commits: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_commits", default=None
+)
+
+
+class WriteSession(Session):
+    """Session class bound to the primary; commits are recorded for read-your-writes."""
+
+
+@event.listens_for(WriteSession, "after_commit")
+def record_request_commit(session: Session):
+    state = request_commits.get()
+
+    if state is not None:
+        state["committed"] = True
+
 
 class DBModule:
     _base: Any = Base
@@ -24,36 +48,62 @@ class DBModule:
     def __init__(self, **kwargs):
         self.credentials = kwargs
 
-        # create database engine
+        # database engines are created on first use (see engine)
         self.engine_type = kwargs.get("engine", "postgres")
         self.engine_setup_func = self.get_engine_setup_func(self.engine_type)
-        self.engine: AsyncEngine = self.engine_setup_func(self.credentials)
+        self._engines: Optional[Dict[str, AsyncEngine]] = None
+        self._read_engines: List[AsyncEngine] = []
+        self._session_factory: Optional[async_sessionmaker] = None
+        self._engine_lock = Lock()
 
-        # create session
-        self.Session: AsyncSession = async_sessionmaker(
+        # create read only session (bound per session to one of the read engines)
+        self.ReadSession: AsyncSession = async_sessionmaker(
             autocommit=False,
             expire_on_commit=False,
-            autoflush=True,
-            bind=self.engine["write"],
+            autoflush=False,
             class_=AsyncSession,
         )
 
-        # sync connection
-        user = self.credentials.get("user")
-        pswd = self.credentials.get("pswd", "")
-        host = self.credentials.get("host")
-        port = self.credentials.get("port", 3306)
-        db = self.credentials.get("db")
+    @property
+    def engine(self) -> Dict[str, AsyncEngine]:
+        if self._engines is None:
+            with self._engine_lock:
+                if self._engines is None:
+                    self._build_engines()
 
-        # create synchronous session
-        # TODO: review if this is necessary
-        self.SyncSessionLocal = sessionmaker(
-            autocommit=False,
-            autoflush=False,
-            bind=create_engine(
-                f"postgresql://{user}:{quote(pswd)}@{host}:{port}/{db}", echo=False
-            ),
-        )
+        return self._engines
+
+    @property
+    def read_engines(self) -> List[AsyncEngine]:
+        if self._engines is None:
+            self.engine
+
+        return self._read_engines
+
+    @property
+    def Session(self) -> async_sessionmaker:
+        if self._session_factory is None:
+            self._session_factory = async_sessionmaker(
+                autocommit=False,
+                expire_on_commit=False,
+                autoflush=True,
+                bind=self.engine["write"],
+                class_=AsyncSession,
+                sync_session_class=WriteSession,
+            )
+
+        return self._session_factory
+
+    def _build_engines(self):
+        engines = self.engine_setup_func(self.credentials)
+        self._read_engines = engines.pop("replicas", [engines["read"]])
+        self._read_engine_cycle = cycle(self._read_engines)
+
+        # count statements per request on every engine
+        for engine in [engines["write"], *self._read_engines]:
+            instrument_engine(engine)
+
+        self._engines = engines
 
     @classmethod
     def get_declarative_base(self):
@@ -63,15 +113,58 @@ class DBModule:
         async with self.Session() as session:
             yield session
 
-    def get_sync_db(self):
-        return self.SyncSessionLocal()
+    async def get_read_db(self) -> AsyncIterator[AsyncSession]:
+        """
+        Yield a session on a read replica.
+
+        Falls back to the primary while the current client is inside its
+        read-your-writes window.
+        """
+        if read_from_primary.get():
+            async with self.Session() as session:
+                yield session
+            return
+
+        async with self.ReadSession(bind=self.get_read_engine()) as session:
+            yield session
+
+    def get_read_engine(self) -> AsyncEngine:
+        """Pick the next read engine (round robin over the configured replicas)."""
+        if self._engines is None:
+            self.engine
+
+        return next(self._read_engine_cycle)
 
     def get_engine(self):
         return self.engine
 
     def dispose(self):
+        if self._engines is None:
+            return
+
         self.engine["write"].dispose()
 
+        for engine in self.read_engines:
+            engine.dispose()
+
+    def pool_status(self) -> Dict[str, Dict[str, Any]]:
+        """Report connection pool statistics for the write and read engines."""
+        engines = {"write": self.engine["write"]}
+        engines.update(
+            {f"read_{index}": engine for index, engine in enumerate(self.read_engines)}
+        )
+
+        status = {}
+        for name, engine in engines.items():
+            pool = engine.pool
+            status[name] = (
+                pool.stats()
+                if isinstance(pool, MeteredQueuePool)
+                else {"pool_class": type(pool).__name__, "status": pool.status()}
+            )
+
+        return status
+
     async def check_models_generated(self):
         if not self._models_generated:
             await self.create_all_tables()
@@ -90,28 +183,33 @@ class DBModule:
         user = credentials.get("user")
         pswd = credentials.get("pswd", "")
         host = credentials.get("host")
-        port = credentials.get("port", 3306)
+        port = credentials.get("port", 5432)
         db = credentials.get("db")
         conn_string = f"postgresql+asyncpg://{user}:{quote(pswd)}@{host}:{port}/{db}"
 
-        # create database if it doesn't exist
-        cls.create_postgres_database_if_not_exist(conn_string)
-
         if not all([user, host, db]):
             raise DBExceptions.DatabaseCredentialException(
                 "DB, USER and HOST are required"
             )
 
-        return {
-            "write": create_async_engine(conn_string, future=True, echo=False),
-            "read": create_async_engine(conn_string, future=True, echo=False),
-        }
+        # size asyncpg's prepared statement cache and SQLAlchemy's adapter cache
+        statement_cache = (
+            f"prepared_statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE}"
+        )
+
+        return cls.build_engines(
+            write_url=f"{conn_string}?{statement_cache}",
+            read_urls=[
+                f"postgresql+asyncpg://{user}:{quote(pswd)}@{read_host}/{db}?{statement_cache}"
+                for read_host in cls.get_read_hosts(credentials, port)
+            ],
+            connect_args={"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+        )
 
     def setup_mysql(cls, credentials: dict):
         user = credentials.get("user")
         pswd = credentials.get("pswd", "")
         host = credentials.get("host")
-        read_host = credentials.get("read_host", host)
         port = credentials.get("port", 3306)
         db = credentials.get("db")
 
@@ -120,63 +218,110 @@ class DBModule:
                 "DB, USER and HOST are required"
             )
 
+        return cls.build_engines(
+            write_url=f"mysql+asyncmy://{user}:{quote(pswd)}@{host}:{port}/{db}",
+            read_urls=[
+                f"mysql+asyncmy://{user}:{quote(pswd)}@{read_host}/{db}"
+                for read_host in cls.get_read_hosts(credentials, port)
+            ],
+        )
+
+    def get_read_hosts(cls, credentials: dict, port: Any) -> List[str]:
+        """Return the configured replicas as host:port, defaulting to the primary host."""
+        read_hosts = credentials.get("read_hosts") or [
+            credentials.get("read_host", credentials.get("host"))
+        ]
+
+        return [host if ":" in host else f"{host}:{port}" for host in read_hosts]
+
+    def get_pool_options(cls) -> Dict[str, Any]:
         return {
-            "write": create_async_engine(
-                f"mysql+asyncmy://{user}:{quote(pswd)}@{host}:{port}/{db}",
-                future=True,
-                echo=False,
-            ),
-            "read": create_async_engine(
-                f"mysql+asyncmy://{user}:{quote(pswd)}@{read_host}:{port}/{db}",
-                future=True,
-                echo=False,
-            ),
+            "poolclass": MeteredQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
         }
 
-    def setup_memory(cls, credentials=":memory:"):
+    def build_engines(
+        cls, write_url: str, read_urls: List[str], **engine_options
+    ) -> Dict[str, Any]:
+        engine_options = {**cls.get_pool_options(), **engine_options}
+        replicas = [
+            create_async_engine(read_url, future=True, echo=False, **engine_options)
+            for read_url in read_urls
+        ]
+
         return {
             "write": create_async_engine(
-                f"sqlite+pysqlite:///{credentials}", future=True, echo=True
-            ),
-            "read": create_async_engine(
-                f"sqlite+pysqlite:///{credentials}", future=True, echo=True
+                write_url, future=True, echo=False, **engine_options
             ),
+            "read": replicas[0],
+            "replicas": replicas,
         }
 
+    def setup_memory(cls, credentials=":memory:"):
+        # an in-memory database only exists on its own engine, so reads share it
+        engine = create_async_engine(
+            f"sqlite+pysqlite:///{credentials}", future=True, echo=True
+        )
+
+        return {"write": engine, "read": engine}
+
     def setup_sqlite(self, credentials=None, db_path="app.db"):
+        pool_options = self.get_pool_options()
+
         return {
             "write": create_async_engine(
-                f"sqlite+aiosqlite:///{db_path}", echo=False, future=True
+                f"sqlite+aiosqlite:///{db_path}",
+                echo=False,
+                future=True,
+                **pool_options,
             ),
             "read": create_async_engine(
-                f"sqlite+aiosqlite:///{db_path}", echo=False, future=True
+                f"sqlite+aiosqlite:///{db_path}",
+                echo=False,
+                future=True,
+                **pool_options,
             ),
         }
 
-    def create_postgres_database_if_not_exist(
-        cls,
-        database_url: str,
-        default_database: str = f"postgresql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}/{settings.DB_DATABASE_DEFAULT}",
-    ):
-        engine = create_engine(default_database)
-        db_name = database_url.split("/")[-1]
-        conn = engine.connect()
+    async def create_postgres_database_if_not_exist(self):
+        if self.engine_type != "postgres":
+            return
+
+        user = self.credentials.get("user")
+        pswd = self.credentials.get("pswd", "")
+        host = self.credentials.get("host")
+        port = self.credentials.get("port", 5432)
+        db_name = self.credentials.get("db")
+
+        # single short-lived connection to the maintenance database
+        engine: AsyncEngine = create_async_engine(
+            f"postgresql+asyncpg://{user}:{quote(pswd)}@{host}:{port}/{settings.DB_DATABASE_DEFAULT}",
+            isolation_level="AUTOCOMMIT",
+            poolclass=NullPool,
+        )
 
         try:
-            conn.execute(text("commit"))
-            db_exists = conn.execute(
-                text(f"SELECT 1 FROM pg_database WHERE datname='{db_name}'")
-            ).scalar()
-
-            if not db_exists:
-                conn.execute(text(f"CREATE DATABASE {db_name}"))
-                print(f"Database {db_name} created successfully.")
-            else:
-                print(f"Database {db_name} already exists.")
+            async with engine.connect() as conn:
+                db_exists = (
+                    await conn.execute(
+                        text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                        {"name": db_name},
+                    )
+                ).scalar()
+
+                if not db_exists:
+                    await conn.execute(text(f'CREATE DATABASE "{db_name}"'))
+                    print(f"Database {db_name} created successfully.")
+                else:
+                    print(f"Database {db_name} already exists.")
         except SQLAlchemyError as e:
             print(f"An error occurred: {e}")
         finally:
-            conn.close()
+            await engine.dispose()
 
     async def create_all_tables(self):
         engine: AsyncEngine = self.engine["write"]
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Dict
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that records how long checkouts wait for a connection.
+
+    The wait covers queueing for a free slot, opening overflow connections and
+    the pre-ping, i.e. everything between asking for and receiving a connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_count: int = 0
+        self.wait_time_total: float = 0.0
+        self.wait_time_max: float = 0.0
+        self.timeouts: int = 0
+
+    def connect(self):
+        start_time = time.perf_counter()
+
+        try:
+            return super().connect()
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start_time
+            self.wait_count += 1
+            self.wait_time_total += waited
+            self.wait_time_max = max(self.wait_time_max, waited)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pool_size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "timeout": self._timeout,
+            "checkouts": self.wait_count,
+            "timeouts": self.timeouts,
+            "wait_time_avg_ms": round(
+                self.wait_time_total / self.wait_count * 1000 if self.wait_count else 0,
+                3,
+            ),
+            "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+        }
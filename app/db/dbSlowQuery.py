@@ -0,0 +1,190 @@
+import os
+import sys
+import json
+import random
+import logging
+import greenlet
+from threading import Lock
+from logging.handlers import RotatingFileHandler
+from typing import Any, List, Optional
+
+from app.core.config import settings
+from app.core.logger import AppLogger
+
+logger = logging.getLogger(__name__)
+
+
+class SlowQueryLog:
+    """
+    Records statements slower than DB_SLOW_QUERY_MS to a rotating file.
+
+    Each record carries the normalized SQL, the bound-parameter shape (types,
+    never values), the duration, the originating DAO method and the route. A
+    sample of records (DB_SLOW_QUERY_EXPLAIN_RATE) also carries the query plan:
+    EXPLAIN for Postgres (run inside a savepoint; EXPLAIN (ANALYZE, BUFFERS)
+    for SELECTs with DB_SLOW_QUERY_EXPLAIN_ANALYZE, which runs them twice) and
+    EXPLAIN QUERY PLAN for SQLite.
+    """
+
+    filename: str = "slow_queries.log"
+
+    def __init__(
+        self,
+        threshold_ms: int = settings.DB_SLOW_QUERY_MS,
+        explain_rate: float = settings.DB_SLOW_QUERY_EXPLAIN_RATE,
+        analyze: bool = settings.DB_SLOW_QUERY_EXPLAIN_ANALYZE,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain_rate = explain_rate
+        self.analyze = analyze
+        self._logger: Optional[logging.Logger] = None
+        self._lock = Lock()
+
+    @property
+    def logger(self) -> logging.Logger:
+        if self._logger is None:
+            with self._lock:
+                if self._logger is None:
+                    os.makedirs(AppLogger.LOG_DIRECTORY, exist_ok=True)
+                    handler = RotatingFileHandler(
+                        os.path.join(AppLogger.LOG_DIRECTORY, self.filename),
+                        maxBytes=10 * 1024 * 1024,
+                        backupCount=5,
+                    )
+                    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+
+                    logger = logging.getLogger("app.db.slow_query")
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.WARNING)
+                    logger.propagate = False
+                    self._logger = logger
+
+        return self._logger
+
+    def is_slow(self, elapsed: float) -> bool:
+        return self.threshold > 0 and elapsed >= self.threshold
+
+    def param_shape(self, parameters: Any, executemany: bool) -> Any:
+        if executemany and isinstance(parameters, (list, tuple)):
+            return {
+                "rows": len(parameters),
+                "row": self.param_shape(parameters[0], False) if parameters else None,
+            }
+        if isinstance(parameters, dict):
+            return {key: type(value).__name__ for key, value in parameters.items()}
+        if isinstance(parameters, (list, tuple)):
+            return [type(value).__name__ for value in parameters]
+
+        return type(parameters).__name__
+
+    def find_origin(self) -> Optional[str]:
+        """
+        Name the outermost DAO method on the stack.
+
+        Statements run in SQLAlchemy's greenlet, so the walk continues into the
+        parent greenlet where the awaiting coroutines live.
+        """
+        # imported here, dbCrud depends on the models which depend on the db layer
+        from app.db.dbCrud import BaseMixin
+
+        origin = None
+        frame = sys._getframe(1)
+        current = greenlet.getcurrent()
+
+        while frame is not None or current is not None:
+            if frame is None:
+                current = current.parent
+                frame = current.gr_frame if current is not None else None
+                continue
+
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, BaseMixin):
+                origin = f"{type(owner).__name__}.{frame.f_code.co_name}"
+
+            frame = frame.f_back
+
+        return origin
+
+    def explain(self, conn, statement: str, parameters: Any) -> Optional[List[Any]]:
+        """
+        The plan of statement, or a note on why there is none. Runs inside the
+        application's cursor hook, so it never raises.
+        """
+        dialect = conn.dialect.name
+        is_select = statement.lstrip().upper().startswith(("SELECT", "WITH"))
+
+        if dialect == "sqlite":
+            prefix = "EXPLAIN QUERY PLAN "
+        elif dialect == "postgresql" and self.analyze and is_select:
+            # ANALYZE executes the statement again, so only do that for reads
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+        else:
+            prefix = "EXPLAIN "
+
+        # a failed statement aborts a Postgres transaction: isolate the EXPLAIN
+        savepoint = dialect == "postgresql"
+
+        try:
+            cursor = conn.connection.cursor()
+        except Exception as e:
+            logger.warning(f"Slow query EXPLAIN failed: {e}")
+            return [f"EXPLAIN failed: {e}"]
+
+        try:
+            if savepoint and not self.execute(cursor, "SAVEPOINT slow_query_explain"):
+                return ["EXPLAIN skipped: savepoint failed"]
+
+            try:
+                cursor.execute(prefix + statement, parameters)
+                plan = [list(row) for row in cursor.fetchall()]
+            except Exception as e:
+                logger.warning(f"Slow query EXPLAIN failed: {e}")
+                if savepoint:
+                    self.execute(cursor, "ROLLBACK TO SAVEPOINT slow_query_explain")
+                return [f"EXPLAIN failed: {e}"]
+
+            if savepoint:
+                self.execute(cursor, "RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            try:
+                cursor.close()
+            except Exception as e:
+                logger.warning(f"Slow query EXPLAIN cursor close failed: {e}")
+
+    def execute(self, cursor, statement: str) -> bool:
+        """Run a savepoint statement for explain; log and report failures."""
+        try:
+            cursor.execute(statement)
+            return True
+        except Exception as e:
+            logger.warning(f"Slow query {statement} failed: {e}")
+            return False
+
+    def record(
+        self,
+        conn,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed: float,
+        normalized: str,
+        route: Optional[str],
+    ):
+        entry = {
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 3),
+            "statement": normalized,
+            "parameters": self.param_shape(parameters, executemany),
+            "dao_method": self.find_origin(),
+            "route": route,
+        }
+
+        if not executemany and random.random() < self.explain_rate:
+            entry["plan"] = self.explain(conn, statement, parameters)
+
+        self.logger.warning(json.dumps(entry, default=str))
+
+
+# create slow query log
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,224 @@
+import os
+import json
+import time
+import socket
+import asyncio
+import hashlib
+import tempfile
+from urllib.parse import quote
+from sqlalchemy.pool import NullPool
+from filelock import FileLock, Timeout
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    String,
+    Table,
+    delete,
+    insert,
+    select,
+    text,
+)
+
+from app.core.config import settings
+from app.db.dbDeclarative import Base
+
+StartupTask = Callable[[], Awaitable[None]]
+
+# one row per startup id whose leader tasks have completed, kept in the
+# application database so every host sharing it sees the same state
+startup_runs = Table(
+    "startup_run",
+    MetaData(),
+    Column("startup_id", String(64), primary_key=True),
+    Column("leader", String(255)),
+    Column("finished_at", DateTime(timezone=True)),
+)
+
+
+class AdvisoryStartupLock:
+    """
+    Postgres session level advisory lock, taken on the maintenance database so
+    it also covers CREATE DATABASE for the application database.
+    """
+
+    def __init__(self, credentials: dict, name: str):
+        user = credentials.get("user")
+        pswd = credentials.get("pswd", "")
+        host = credentials.get("host")
+        port = credentials.get("port", 5432)
+
+        self.key = int.from_bytes(
+            hashlib.sha1(name.encode()).digest()[:8], "big", signed=True
+        )
+        self.url = f"postgresql+asyncpg://{user}:{quote(pswd)}@{host}:{port}/{settings.DB_DATABASE_DEFAULT}"
+        self._engine: Optional[AsyncEngine] = None
+        self._conn: Optional[AsyncConnection] = None
+
+    async def acquire(self) -> bool:
+        self._engine = self._engine or create_async_engine(
+            self.url, isolation_level="AUTOCOMMIT", poolclass=NullPool
+        )
+        conn = await self._engine.connect()
+        acquired = (
+            await conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            )
+        ).scalar()
+
+        if acquired:
+            self._conn = conn
+        else:
+            await conn.close()
+
+        return bool(acquired)
+
+    async def release(self):
+        if self._conn is not None:
+            await self._conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": self.key}
+            )
+            await self._conn.close()
+            self._conn = None
+
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+class FileStartupLock:
+    """Lock file for single host engines (SQLite); released if the holder dies."""
+
+    def __init__(self, path: str):
+        self.lock = FileLock(path)
+
+    async def acquire(self) -> bool:
+        try:
+            self.lock.acquire(timeout=0)
+            return True
+        except Timeout:
+            return False
+
+    async def release(self):
+        self.lock.release()
+
+
+class StartupCoordinator:
+    """
+    Runs shared startup work (schema sync, cache warming) in one worker only.
+
+    Completion is recorded in the application database (startup_run), keyed
+    by a startup id: STARTUP_ID when set (e.g. a release or commit id),
+    otherwise a hash of the mapped schema and the task names. A worker that
+    finds its startup id recorded skips the work. Otherwise it tries the
+    startup lock without blocking: the winner checks the record again (a
+    leader may have finished in between), runs the leader tasks and records
+    them, the others poll for the record and retry the lock while waiting, so
+    a crashed leader is replaced. Boot time does not grow with the number of
+    workers.
+    """
+
+    def __init__(self, db_module, poll_interval: float = 0.2):
+        self.db_module = db_module
+        self.poll_interval = poll_interval
+        self.leader_tasks: Dict[str, StartupTask] = {}
+        self.is_leader: bool = False
+        self.ready: bool = False
+
+        name = f"{settings.APP_NAME}-{settings.DB_DATABASE}-startup".replace("/", "_")
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self.lock_name = name
+
+    def add_leader_task(self, name: str, task: StartupTask):
+        self.leader_tasks[name] = task
+
+    def get_lock(self):
+        if self.db_module.engine_type == "postgres":
+            return AdvisoryStartupLock(self.db_module.credentials, self.lock_name)
+
+        return FileStartupLock(self.lock_path)
+
+    @property
+    def startup_id(self) -> str:
+        if settings.STARTUP_ID:
+            return settings.STARTUP_ID[:64]
+
+        schema = sorted(
+            f"{table.name}.{column.name}:{column.type!r}"
+            for table in Base.metadata.tables.values()
+            for column in table.columns
+        )
+
+        return hashlib.sha1(
+            json.dumps([schema, sorted(self.leader_tasks)]).encode()
+        ).hexdigest()
+
+    async def is_marked_ready(self) -> bool:
+        """Whether a leader has completed the tasks of this startup id."""
+        try:
+            async with self.db_module.engine["write"].connect() as conn:
+                marked = await conn.scalar(
+                    select(startup_runs.c.startup_id).where(
+                        startup_runs.c.startup_id == self.startup_id
+                    )
+                )
+        except Exception:
+            # no database (it is created by a leader task) or no record table yet
+            return False
+
+        return marked is not None
+
+    async def mark_ready(self):
+        async with self.db_module.engine["write"].begin() as conn:
+            await conn.run_sync(startup_runs.create, checkfirst=True)
+            await conn.execute(
+                delete(startup_runs).where(startup_runs.c.startup_id == self.startup_id)
+            )
+            await conn.execute(
+                insert(startup_runs).values(
+                    startup_id=self.startup_id,
+                    leader=f"{socket.gethostname()}:{os.getpid()}",
+                    finished_at=datetime.now(timezone.utc),
+                )
+            )
+
+    async def run(self) -> Dict[str, float]:
+        """Run (or wait for) the leader tasks; returns per task timings in seconds."""
+        timings: Dict[str, float] = {}
+
+        if not self.leader_tasks:
+            self.ready = True
+            return timings
+
+        lock = self.get_lock()
+        deadline = time.monotonic() + settings.STARTUP_TIMEOUT
+
+        try:
+            while time.monotonic() < deadline:
+                if await self.is_marked_ready():
+                    break
+
+                if await lock.acquire():
+                    # the previous holder may have finished since the check above
+                    if not await self.is_marked_ready():
+                        self.is_leader = True
+                        for name, task in self.leader_tasks.items():
+                            started = time.perf_counter()
+                            await task()
+                            timings[name] = time.perf_counter() - started
+                        await self.mark_ready()
+                    break
+
+                await asyncio.sleep(self.poll_interval)
+            else:
+                raise RuntimeError(
+                    f"Timed out after {settings.STARTUP_TIMEOUT}s waiting for the startup leader"
+                )
+        finally:
+            await lock.release()
+
+        self.ready = True
+        return timings
@@ -20,4 +20,5 @@ class AttendanceLogDAO(BaseDAO[AttendanceLog]):
             detail_mappings=self.detail_mappings,
             excludes=excludes or [],
             primary_key="attendance_id",
+            include_graph=["user"],
         )
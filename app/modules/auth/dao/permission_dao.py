@@ -23,4 +23,7 @@ class PermissionDAO(BaseDAO[Permissions]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="permission_id",
+            natural_key=["name"],
+            cache_expiry=300,
+            include_graph=["roles"],
         )
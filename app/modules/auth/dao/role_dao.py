@@ -31,6 +31,9 @@ class RoleDAO(BaseDAO[Role]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="role_id",
+            natural_key=["name"],
+            cache_expiry=60,
+            include_graph=["permissions", "address", "users"],
         )
 
     async def _fetch_role_stats(self, db_session: AsyncSession) -> Dict[str, int]:
@@ -21,6 +21,7 @@ from app.modules.auth.models.user import User
 from app.modules.auth.schema.user_schema import UserCreateSchema, UserUpdateSchema
 
 # core
+from app.core.config import settings
 from app.core.response import DAOResponse
 
 # services
@@ -55,6 +56,18 @@ class UserDAO(BaseDAO[User]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="user_id",
+            negative_cache_keys=["email"],
+            negative_cache_expiry=settings.CACHE_NEGATIVE_TTL,
+            include_graph=[
+                "roles",
+                "roles.permissions",
+                "address",
+                "accounts",
+                "answers",
+                "media",
+                "attendance_logs",
+                "entity_questionnaires",
+            ],
         )
 
     @override
@@ -77,17 +90,22 @@ class UserDAO(BaseDAO[User]):
                 str(uuid.uuid4()),
             )
 
-            new_user: User = await super().create(
-                db_session=db_session, obj_in=obj_in.model_dump()
-            )
+            # user, relationships and tokens are committed together
+            async with self.unit_of_work(db_session) as outermost:
+                new_user: User = await super().create(
+                    db_session=db_session, obj_in=obj_in.model_dump()
+                )
+                user_load_addr = await self.update_and_refresh_user(
+                    db_session, new_user, verification_token, is_subscribed_token
+                )
+
+            if outermost:
+                await db_session.refresh(user_load_addr)
 
             # send email to user
             await self.send_verification_email(
                 new_user, verification_token, is_subscribed_token
             )
-            user_load_addr = await self.update_and_refresh_user(
-                db_session, new_user, verification_token, is_subscribed_token
-            )
 
             return (
                 user_load_addr
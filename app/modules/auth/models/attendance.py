@@ -2,7 +2,7 @@ import uuid
 from typing import Optional
 from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import DateTime, ForeignKey, func, UUID, event, inspect
+from sqlalchemy import DateTime, ForeignKey, Index, func, UUID, event, inspect
 
 # models
 from app.modules.common.models.model_base import BaseModel as Base
@@ -31,6 +31,14 @@ class AttendanceLog(Base):
         DateTime(timezone=True), default=func.now()
     )
 
+    __table_args__ = (
+        Index(
+            "ix_attendance_logs_created_at_attendance_id",
+            "created_at",
+            "attendance_id",
+        ),
+    )
+
     # users
     user: Mapped["User"] = relationship(
         "User",
@@ -2,7 +2,7 @@ import uuid
 from typing import List, Optional
 from datetime import date, datetime
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy import UUID, Boolean, Date, DateTime, Enum, String, func, event
+from sqlalchemy import UUID, Boolean, Date, DateTime, Enum, Index, String, func, event
 
 # enums
 from app.modules.auth.enums.user_enums import GenderEnum
@@ -14,6 +14,8 @@ from app.modules.common.models.model_base import BaseModel as Base, BaseModelCol
 class User(Base):
     __tablename__ = "users"
 
+    __table_args__ = (Index("ix_users_created_at_user_id", "created_at", "user_id"),)
+
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
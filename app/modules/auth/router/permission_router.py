@@ -6,6 +6,9 @@ from app.modules.auth.dao.permission_dao import PermissionDAO
 # router
 from app.modules.common.router.base_router import BaseCRUDRouter
 
+# core
+from app.core.config import settings
+
 # schemas
 from app.modules.common.schema.schemas import PermissionSchema
 from app.modules.auth.schema.permission import (
@@ -21,7 +24,11 @@ class PermissionRouter(BaseCRUDRouter):
         self.dao: PermissionDAO = PermissionDAO(excludes=[""])
 
         super().__init__(
-            dao=self.dao, schemas=PermissionSchema, prefix=prefix, tags=tags
+            dao=self.dao,
+            schemas=PermissionSchema,
+            prefix=prefix,
+            tags=tags,
+            response_cache_expiry=settings.CACHE_RESPONSE_TTL,
         )
         self.register_routes()
 
@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Literal, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import Depends, Query, Request
+from fastapi import Depends, Query, Request, Response, status
 
 # dao
 from app.modules.auth.dao.role_dao import RoleDAO
@@ -13,7 +13,8 @@ from app.modules.common.schema.schemas import RoleSchema
 from app.modules.auth.schema.role_schema import RoleUpdateSchema, RoleCreateSchema
 
 # core
-from app.core.lifespan import get_db
+from app.core.config import settings
+from app.core.lifespan import get_read_db
 from app.core.response import DAOResponse
 from app.core.errors import CustomException, RecordNotFoundException, IntegrityError
 
@@ -30,24 +31,50 @@ class RoleRouter(BaseCRUDRouter):
             prefix=prefix,
             tags=tags,
             route_overrides=["get_all"],
+            response_cache_expiry=settings.CACHE_RESPONSE_TTL,
         )
         self.register_routes()
 
     def register_routes(self):
         @self.router.get("/")
+        @self.cache_response()
         async def get_all(
             request: Request,
+            response: Response,
             limit: int = Query(default=10, ge=1),
             offset: int = Query(default=0, ge=0),
-            db_session: AsyncSession = Depends(get_db),
+            include: Optional[str] = Query(
+                default=None, description="Comma separated relationships to load"
+            ),
+            pagination: Literal["offset", "cursor"] = Query(default="offset"),
+            after: Optional[str] = Query(
+                default=None, description="Cursor of the page to read after"
+            ),
+            before: Optional[str] = Query(
+                default=None, description="Cursor of the page to read before"
+            ),
+            db_session: AsyncSession = Depends(get_read_db),
         ) -> DAOResponse:
             try:
-                items = await self.dao.get_all(
-                    db_session=db_session, offset=offset, limit=limit
+                # role_stats come from user_roles, versioned by the User generation
+                validators = await self.get_page_validators(
+                    request, db_session, limit, offset, pagination, after, before
                 )
+                if self.is_not_modified(request, validators):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators
+                    )
+                response.headers.update(validators or {})
 
-                meta = await self.dao.build_pagination_meta(
-                    request=request, limit=limit, offset=offset, db_session=db_session
+                items, meta = await self.get_page(
+                    request=request,
+                    db_session=db_session,
+                    limit=limit,
+                    offset=offset,
+                    include=self.dao.parse_includes(include),
+                    pagination=pagination,
+                    after=after,
+                    before=before,
                 )
 
                 role_stats = await self.dao._fetch_role_stats(db_session)
@@ -1,4 +1,5 @@
 import asyncio
+from urllib.parse import urlencode
 from pydantic import BaseModel
 from fastapi import Request, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,7 +7,6 @@ from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Generic, Uni
 
 # cache
 from app.cache.cacheCrud import DBOperationsWithCache
-from app.db.dbCrud import DBOperations
 
 # core
 from app.core.lifespan import get_db
@@ -16,7 +16,7 @@ from app.core.errors import RecordNotFoundException
 DBModelType = TypeVar("DBModelType")
 
 
-class BaseDAO(DBOperations, Generic[DBModelType]):
+class BaseDAO(DBOperationsWithCache, Generic[DBModelType]):
     def __init__(
         self,
         model: Type[DBModelType],
@@ -24,7 +24,8 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
         detail_mappings: Optional[Dict[str, Any]] = {},
         model_entity_params: Optional[Dict[str, Any]] = {},
         model_registry: Optional[Dict[str, Type[BaseModel]]] = None,
-        cache_expiry: Optional[int] = 300,
+        cache_expiry: Optional[int] = None,
+        negative_cache_expiry: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -39,6 +40,7 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
             excludes=excludes,
             model_registry=model_registry,
             cache_expiry=cache_expiry,
+            negative_cache_expiry=negative_cache_expiry,
             *args,
             **kwargs,
         )
@@ -94,6 +96,15 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
 
         return None
 
+    def build_page_url(self, request: Request, **params: Any) -> str:
+        """Build a page link for the current path, keeping any other query params."""
+        query_params = {
+            **{k: v for k, v in params.items() if v is not None},
+            **{k: v for k, v in request.query_params.items() if k not in params},
+        }
+
+        return f"{request.url.path}?{urlencode(query_params)}"
+
     async def build_pagination_meta(
         self,
         request: Request,
@@ -102,7 +113,6 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
         filter_condition: Dict[str, Any] = None,
         db_session: AsyncSession = Depends(get_db),
     ) -> Dict[str, Any]:
-        base_url = request.url.path
         total = await self.query_count(
             db_session=db_session, filter_condition=filter_condition
         )
@@ -114,12 +124,38 @@ class BaseDAO(DBOperations, Generic[DBModelType]):
             "total": total,
             "limit": limit,
             "offset": offset,
-            "next": f"{base_url}?limit={limit}&offset={next_offset}"
+            "next": self.build_page_url(request, limit=limit, offset=next_offset)
             if next_offset < total
             else None,
-            "previous": f"{base_url}?limit={limit}&offset={previous_offset}"
+            "previous": self.build_page_url(
+                request, limit=limit, offset=previous_offset
+            )
             if offset > 0
             else None,
         }
 
         return meta
+
+    def build_cursor_pagination_meta(
+        self,
+        request: Request,
+        limit: int,
+        cursors: Dict[str, Optional[str]],
+    ) -> Dict[str, Any]:
+        next_cursor, previous_cursor = cursors.get("next"), cursors.get("previous")
+
+        return {
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "previous_cursor": previous_cursor,
+            "next": self.build_page_url(
+                request, limit=limit, after=next_cursor, before=None, offset=None
+            )
+            if next_cursor
+            else None,
+            "previous": self.build_page_url(
+                request, limit=limit, before=previous_cursor, after=None, offset=None
+            )
+            if previous_cursor
+            else None,
+        }
@@ -33,6 +33,11 @@ class AssociationProcessor:
 
         try:
             self._is_processing = True
+
+            # generated keys of staged rows are only known after a flush
+            if inspect(item).pending or inspect(self._parent).pending:
+                await session.flush()
+
             association_data = self._build_association_data(item, config)
 
             # check if association already exists
@@ -166,9 +171,6 @@ class AssociationProcessor:
                         setattr(existing_association, key, str(value))
 
             session.add(existing_association)
-            await session.commit()
-            await session.refresh(existing_association)
-            await session.flush()
         except Exception as e:
             raise Exception(f"Error updating existing association: {str(e)}")
 
@@ -182,8 +184,5 @@ class AssociationProcessor:
         try:
             entity_association_data = association_class(**association_data)
             session.add(entity_association_data)
-            await session.commit()
-            await session.refresh(entity_association_data)
-            await session.flush()
         except Exception as e:
             raise Exception(f"Error creating new association: {str(e)}")
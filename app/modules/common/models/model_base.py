@@ -1,28 +1,35 @@
 import pytz
 from datetime import datetime
-from functools import lru_cache
-from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncAttrs
 from sqlalchemy.ext.declarative import declared_attr
 from typing import Dict, List, Any, Optional, Tuple, Union
 from sqlalchemy.orm import (
     Mapped,
-    mapped_column,
     Session,
+    mapped_column,
 )
 from sqlalchemy import (
     DateTime,
     UUID,
     MetaData,
     Table,
-    inspect,
-    exists,
     event,
 )
 
 from app.db.dbDeclarative import Base
 from app.modules.common.models.model_registry import registry
-from app.modules.common.models.model_base_collection import BaseModelCollection
+from app.modules.common.models.model_meta import model_meta_registry
+from app.modules.common.models.model_base_collection import BaseModelCollection  # noqa: F401 (re-exported)
+import app.modules.common.models.model_entity_validator  # noqa: F401 (flush validator)
+
+# session.info key of the models written outside the DAOs (e.g. by mapper
+# events), whose cached reads the DAO layer retires once the session commits
+STAGED_MODELS = "cache_models"
+
+
+def register_inserted_model(mapper, connection, target):
+    """Listener registering the relationship config of a model on its first insert."""
+    registry.register_model(mapper.class_, "before_insert")
 
 
 class BaseModel(Base, AsyncAttrs):
@@ -74,21 +81,24 @@ class BaseModel(Base, AsyncAttrs):
 
         # on model insert
         event.listen(
-            model_class,
-            "before_insert",
-            lambda *arg: registry.register_model(model_class, "before_insert"),
-            propagate=True,
+            model_class, "before_insert", register_inserted_model, propagate=True
         )
 
+    @classmethod
+    def stage_cache_invalidation(cls, session: Optional[Session]):
+        """Retire the cached reads of cls once session commits (see after_commit)."""
+        if session is not None:
+            session.info.setdefault(STAGED_MODELS, set()).add(cls.__name__)
+
     def _set_collection_parents(self):
         """dynamically set the parent for all relationships that are instances of BaseModelCollection."""
-        mapper = inspect(self.__class__)
+        meta = model_meta_registry.get(self.__class__)
 
-        for relationship in mapper.relationships:
-            attr_name = relationship.key
-            attr_value = getattr(self, attr_name, None)
+        # touching list relationships initialises them empty on new objects
+        for attr_name in meta.list_relationship_keys:
+            attr_value = getattr(self, attr_name)
 
-            if isinstance(attr_value, BaseModelCollection):
+            if attr_name in meta.collection_keys:
                 attr_value.set_parent(self)
 
     def set_entity_params(self, entity_data: Dict[str, Any]):
@@ -108,31 +118,6 @@ class BaseModel(Base, AsyncAttrs):
     def get_entity_type(self):
         return str(self.__tablename__)
 
-    def execute_select(self, stmt: str):
-        from app.db.dbManager import DBManager
-
-        db_manager = DBManager()
-
-        session: Session = db_manager.db_module.get_sync_db()
-        return session.execute(stmt)
-
-    @lru_cache(maxsize=1024)
-    def _cached_entity_exists(
-        self, table_name: str, column_name: str, entity_id: Any
-    ) -> bool:
-        try:
-            table_class = Base.metadata.tables.get(table_name.lower())
-
-            if not isinstance(table_class, Table):
-                raise ValueError(f"Model class for {table_name} not found")
-
-            stmt = select(exists().where(table_class.c[column_name] == str(entity_id)))
-            result = self.execute_select(stmt)
-
-            return result.scalar()
-        except Exception as e:
-            raise RuntimeError(f"Error checking if entity exists: {e}")
-
     def validate_entity(
         self,
         entity_id: Any,
@@ -144,8 +129,8 @@ class BaseModel(Base, AsyncAttrs):
         if not table_name or not column_name:
             raise ValueError(f"Invalid entity type: {entity_type}")
 
-        if not self._cached_entity_exists(table_name, column_name, entity_id):
-            raise ValueError(f"Invalid {str(entity_type)} ID: {entity_id}")
+        # existence is checked in one batched query per table when the session flushes
+        self._entity_reference = (entity_type, table_name, column_name, entity_id)
 
         return entity_id
 
@@ -1,30 +1,36 @@
 from asyncio import Lock
-from functools import lru_cache
-from typing import Dict, Any, Union
-from dogpile.cache import make_region
+from typing import Dict, Any, Optional, Union
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Mapper, object_session
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.collections import InstrumentedList
+from sqlalchemy.orm.collections import InstrumentedList, collection_adapter
 
 from app.core.config import settings
 from app.modules.common.models.model_registry import registry
 from app.modules.common.models.model_association import AssociationProcessor
 
-
-cache_region = make_region().configure(
-    "dogpile.cache.dbm",
-    expiration_time=300,
-    arguments={"filename": f"{settings.CACHE_PATH}cachefile.dbm"},
-)
+# session.info key of the collection cache keys changed by uncommitted writes
+STAGED_COLLECTIONS = "cache_collections"
 
 
 class BaseModelCollection(InstrumentedList):
+    """
+    List collection for relationships whose items are associated through the
+    registry's configs (see append_item).
+
+    Membership changes stage the collection's cache key (see
+    app.cache.cacheCollection) on the parent's session, and the DAO layer drops
+    the staged keys once the write has committed: append_item does so itself,
+    and the append/remove attribute events (which also cover remove, pop and
+    clear) do so for every list relationship, BaseModelCollection or not.
+    """
+
     commit_lock = Lock()
 
     def __init__(self, *args, **kwargs):
         self._config_cache = {}
         self._is_processing = False
         self._parent = kwargs.pop("parent", None)
-        self._cache_enabled = kwargs.pop("cache_enabled", True)
 
         super().__init__(*args, **kwargs)
 
@@ -57,102 +63,70 @@ class BaseModelCollection(InstrumentedList):
 
         return self._config_cache[child_type]
 
-    @lru_cache(maxsize=1024)
-    def _cached_items(self):
-        """Returns the cached items in the collection."""
-        return list(self)
-
-    def _generate_cache_key(self):
-        """Generate a unique cache key based on parent and relationship."""
-        parent_type = "unknown"
-        parent_id = "__default__"
-        print(f"\t\t\t_generate_cache_key {self._parent} {isinstance(self, list)}")
-
-        # handle case when there's no parent and self is a list
-        if not self._parent and isinstance(self, list):
-            first_item = self.__getitem__(0) if len(self) > 0 else None
-            print(
-                f"\t\t\t\t {first_item} {self} {first_item.__class__.__name__.lower()}"
-            )
-            if first_item:
-                parent_type = first_item.__class__.__name__.lower()
-
-        if not self._parent and parent_id != "__default__" and not parent_type:
-            print(f"\t\t\treturning {self._parent}")
+    @staticmethod
+    def cache_key(parent: Any, relationship: str) -> Optional[str]:
+        """Collection cache key of parent's relationship, or None for unsaved parents."""
+        identity = inspect(parent).identity
+        if identity is None:
+            return None
+
+        parent_id = ",".join(str(value) for value in identity)
+        return (
+            f"{settings.APP_NAME}:collection:{parent.__tablename__}:"
+            f"{parent_id}:{relationship}"
+        )
+
+    @classmethod
+    def stage_invalidation(cls, parent: Any, relationship: str, *items):
+        """
+        Stage the cached copy of parent's relationship, and the reverse
+        collections of items, for invalidation once parent's session commits.
+        """
+        session = object_session(parent)
+
+        # a parent outside a session changes nothing the cache has seen
+        if session is None:
             return
 
-        # if there's a parent, use the parent's table name and ID
-        if self._parent:
-            parent_type = getattr(self._parent, "__tablename__", "unknown")
-            parent_id = getattr(
-                self._parent, f"{self._parent.__tablename__}_id", "__default__"
-            )
-
-        # return the formatted cache key
-        return f"{parent_type}:{parent_id}"
-
-    def _get_cached_items(self):
-        """Get the items from cache, or load and cache them if not present."""
-        cache_key = self._generate_cache_key()
-
-        if cache_key:
-            print(f"\t\t\tcache key: {cache_key}")
-            return cache_region.get_or_create(
-                cache_key, lambda: list(InstrumentedList.__iter__(self))
-            )
-        else:
-            print(f"\t\t\telse cache key {cache_key} {self}")
-            return list(InstrumentedList.__iter__(self))
-
-    def _invalidate_cache(self):
-        """Invalidate the cache when the collection changes."""
-        # self._cached_items.cache_clear()
-        cache_key = self._generate_cache_key()
-        cache_region.delete(cache_key)
-
-    # TODO (DQ): Fix caching issue
-    def __iter__(self):
-        """Override the iterator to return cached items if enabled."""
-        # if self._cache_enabled:
-        # return iter(self._cached_items())
-        # return iter(self._get_cached_items())
-        return super().__iter__()
-
-    def __getitem__(self, index):
-        """Override the item getter to use caching."""
-        return super().__getitem__(index)
-
-    def remove(self, item):
-        """Override remove to clear the cache when an item is removed."""
-        self._invalidate_cache()
-        super().remove(item)
-
-    def pop(self, index=-1):
-        """Override pop to clear the cache when an item is popped from the list."""
-        self._invalidate_cache()
-        return super().pop(index)
-
-    def clear(self):
-        """Override clear to clear the cache when the list is cleared."""
-        self._invalidate_cache()
-        super().clear()
-
-    def append(self, object) -> None:
-        super().append(object)
+        prop = inspect(parent).mapper.relationships[relationship]
+        keys = {cls.cache_key(parent, relationship)}
+
+        if (
+            prop.back_populates
+            and prop.mapper.relationships[prop.back_populates].uselist
+        ):
+            keys.update(cls.cache_key(item, prop.back_populates) for item in items)
+
+        keys.discard(None)
+        session.info.setdefault(STAGED_COLLECTIONS, set()).update(keys)
 
     async def append_item(self, item, session: AsyncSession = None):
-        """Override append to clear the cache when an item is added."""
-        self._invalidate_cache()
+        """Stage the association of item with the parent and clear the cache."""
+        adapter = collection_adapter(self)
+        if adapter is not None:
+            self.stage_invalidation(adapter.owner_state.obj(), adapter.attr.key, item)
 
-        # process the item asynchronously
+        # process the item asynchronously; the association is only staged, the
+        # caller's unit of work commits it together with the parent
         processor = AssociationProcessor(self._parent, self._get_child_config)
         item = await processor.process_item(item, session)
 
-        # commit the session and refresh the parent to ensure consistency
-        await session.commit()
-        # await session.refresh(self._parent) # Caused issue with saving child items
+        return item
 
-        # flush the session to ensure the collection is persisted
-        await session.flush()
 
-        return item
+def collection_listener(relationship: str):
+    # bound per attribute: backref events carry the other side's initiator
+    def on_change(target, value, initiator):
+        BaseModelCollection.stage_invalidation(target, relationship, value)
+
+    return on_change
+
+
+@event.listens_for(Mapper, "mapper_configured")
+def listen_for_collection_changes(mapper: Mapper, class_: Any):
+    """Stage cache invalidation on every append to or removal from a collection."""
+    for prop in mapper.relationships:
+        if prop.uselist:
+            attribute = getattr(class_, prop.key)
+            event.listen(attribute, "append", collection_listener(prop.key))
+            event.listen(attribute, "remove", collection_listener(prop.key))
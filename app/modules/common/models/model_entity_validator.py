@@ -0,0 +1,130 @@
+import time
+import uuid
+from itertools import chain
+from threading import Lock
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, Set, Tuple
+from sqlalchemy import Column, Table, Uuid, event, select
+from sqlalchemy.orm import Session
+
+from app.db.dbDeclarative import Base
+
+EntityKey = Tuple[str, str, str]
+
+
+class EntityReferenceValidator:
+    """
+    Validates polymorphic (entity_type, entity_id) references when a session flushes.
+
+    Models record references through BaseModel.validate_entity; before each flush
+    every pending reference is checked with one IN query per target table on the
+    session's own connection (async-adapted, so nothing blocks the event loop).
+    Confirmed ids are kept in a process-wide TTL cache.
+    """
+
+    def __init__(self, ttl: int = 300, maxsize: int = 10000):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._known: "OrderedDict[EntityKey, float]" = OrderedDict()
+        self._lock = Lock()
+
+    def is_known(self, key: EntityKey) -> bool:
+        with self._lock:
+            expires_at = self._known.get(key)
+
+            if expires_at is None:
+                return False
+            if expires_at < time.monotonic():
+                del self._known[key]
+                return False
+
+            self._known.move_to_end(key)
+            return True
+
+    def remember(self, keys: Iterable[EntityKey]):
+        expires_at = time.monotonic() + self.ttl
+
+        with self._lock:
+            for key in keys:
+                self._known[key] = expires_at
+                self._known.move_to_end(key)
+
+            while len(self._known) > self.maxsize:
+                self._known.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._known.clear()
+
+    def coerce_id(self, column: Column, entity_id: Any) -> Any:
+        if isinstance(column.type, Uuid) and not isinstance(entity_id, uuid.UUID):
+            return uuid.UUID(str(entity_id))
+
+        return entity_id
+
+    def get_table(self, table_name: str) -> Table:
+        table = Base.metadata.tables.get(table_name.lower())
+
+        if not isinstance(table, Table):
+            raise ValueError(f"Model class for {table_name} not found")
+
+        return table
+
+    def collect(self, session: Session) -> Dict[Tuple[str, str], Dict[Any, Any]]:
+        """Group unconfirmed references of new/dirty objects by target (table, column)."""
+        pending: Dict[Tuple[str, str], Dict[Any, Any]] = defaultdict(dict)
+
+        for obj in chain(session.new, session.dirty):
+            reference = getattr(obj, "_entity_reference", None)
+            if not reference:
+                continue
+
+            entity_type, table_name, column_name, entity_id = reference
+            if entity_id is None:
+                continue
+
+            column = self.get_table(table_name).c[column_name]
+            try:
+                entity_id = self.coerce_id(column, entity_id)
+            except ValueError:
+                raise ValueError(f"Invalid {str(entity_type)} ID: {entity_id}")
+
+            if not self.is_known((table_name, column_name, str(entity_id))):
+                pending[(table_name, column_name)][entity_id] = entity_type
+
+        return pending
+
+    def staged_ids(self, session: Session, table_name: str, column_name: str) -> Set:
+        """Ids of rows for table_name that are being inserted by this same flush."""
+        return {
+            getattr(obj, column_name, None)
+            for obj in session.new
+            if getattr(obj, "__tablename__", None) == table_name
+        }
+
+    def validate(self, session: Session):
+        pending = self.collect(session)
+
+        for (table_name, column_name), references in pending.items():
+            column = self.get_table(table_name).c[column_name]
+            result = session.connection().execute(
+                select(column).where(column.in_(list(references)))
+            )
+            existing = set(result.scalars())
+            staged = self.staged_ids(session, table_name, column_name)
+
+            for entity_id, entity_type in references.items():
+                if entity_id not in existing and entity_id not in staged:
+                    raise ValueError(f"Invalid {str(entity_type)} ID: {entity_id}")
+
+            self.remember(
+                (table_name, column_name, str(entity_id)) for entity_id in existing
+            )
+
+
+entity_validator = EntityReferenceValidator()
+
+
+@event.listens_for(Session, "before_flush")
+def validate_entity_references(session: Session, flush_context, instances):
+    entity_validator.validate(session)
@@ -0,0 +1,94 @@
+from threading import Lock
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type
+from sqlalchemy import inspect
+from sqlalchemy.orm import configure_mappers, selectinload
+
+from app.db.dbDeclarative import Base
+from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
+from app.modules.common.models.model_base_collection import BaseModelCollection
+
+
+@dataclass(frozen=True)
+class ModelMeta:
+    """Mapper facts the CRUD layer needs per request, computed once per model."""
+
+    model: Type[Any]
+    table_name: str
+    primary_key: Optional[str]
+    column_keys: Tuple[str, ...]
+    column_key_set: FrozenSet[str]
+    relationship_keys: Tuple[str, ...]
+    list_relationship_keys: Tuple[str, ...]
+    collection_keys: Tuple[str, ...]
+    entity_type: Optional[EntityTypeEnum]
+    loader_options: Tuple[Any, ...]
+
+
+class ModelMetaRegistry:
+    def __init__(self):
+        self._metas: Dict[Type[Any], ModelMeta] = {}
+        self._lock = Lock()
+
+    def get(self, model: Type[Any]) -> ModelMeta:
+        """Return the model's ModelMeta, building it on first use if startup missed it."""
+        meta = self._metas.get(model)
+
+        if meta is None:
+            with self._lock:
+                meta = self._metas.get(model) or self._build(model)
+                self._metas[model] = meta
+
+        return meta
+
+    def build_all(self) -> int:
+        """Build ModelMeta for every mapped class (called at startup)."""
+        configure_mappers()
+
+        for mapper in Base.registry.mappers:
+            self.get(mapper.class_)
+
+        return len(self._metas)
+
+    def _build(self, model: Type[Any]) -> ModelMeta:
+        mapper = inspect(model)
+        column_keys = tuple(attr.key for attr in mapper.column_attrs)
+        relationships = list(mapper.relationships)
+        primary_keys = [
+            mapper.get_property_by_column(c).key for c in mapper.primary_key
+        ]
+
+        return ModelMeta(
+            model=model,
+            table_name=getattr(model, "__tablename__", ""),
+            primary_key=primary_keys[0] if primary_keys else None,
+            column_keys=column_keys,
+            column_key_set=frozenset(column_keys),
+            relationship_keys=tuple(rel.key for rel in relationships),
+            list_relationship_keys=tuple(
+                rel.key for rel in relationships if rel.uselist
+            ),
+            collection_keys=tuple(
+                rel.key
+                for rel in relationships
+                if isinstance(rel.collection_class, type)
+                and issubclass(rel.collection_class, BaseModelCollection)
+            ),
+            entity_type=self._resolve_entity_type(model),
+            loader_options=tuple(
+                selectinload(getattr(model, rel.key)) for rel in relationships
+            ),
+        )
+
+    def _resolve_entity_type(self, model: Type[Any]) -> Optional[EntityTypeEnum]:
+        # walk the MRO so mapped subclasses resolve like isinstance checks would
+        for cls in model.__mro__:
+            for name in (cls.__name__.lower(), cls.__dict__.get("__tablename__")):
+                if name in EntityTypeEnum.__members__:
+                    return EntityTypeEnum[name]
+
+        return None
+
+
+# create model meta registry
+model_meta_registry = ModelMetaRegistry()
@@ -1,20 +1,40 @@
+import json
 import inspect
+import hashlib
 from uuid import UUID
 from functools import partial
+from datetime import timezone
+from email.utils import format_datetime
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, TypeVar, Generic, Union
-from fastapi import APIRouter, Depends, Query, Request, status
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+    Generic,
+    Union,
+)
+from pydantic import ValidationError
+from fastapi import APIRouter, Body, Depends, Query, Request, Response, status
 
 # dao
 from app.modules.common.dao.base_dao import BaseDAO
 
+# cache
+from app.cache.cacheManager import CacheManager
+from app.cache.cacheResponse import etag_matches, response_cache
+
 # schema
 from app.modules.common.schema.base_schema import SchemasDictType
 
 # core
-from app.core.lifespan import get_db
-from app.core.response import DAOResponse
+from app.core.lifespan import get_db, get_read_db
+from app.core.response import DAOAPIRoute, DAOJSONResponse, DAOResponse
 from app.core.errors import CustomException, RecordNotFoundException, IntegrityError
 
 
@@ -30,14 +50,22 @@ class BaseCRUDRouter(Generic[DBModelType]):
         tags: List[str] = [],
         show_default_routes: bool = True,
         route_overrides: List[str] = [],
+        response_cache_expiry: Optional[int] = None,
     ):
         self.dao = dao
+        self.response_cache_expiry = response_cache_expiry
         self.model_pk = schemas["primary_keys"]
         self.model_schema = schemas["model_schema"]
         self.create_schema = schemas["create_schema"]
         self.update_schema = schemas["update_schema"]
         self.get_db = get_db
-        self.router = APIRouter(prefix=prefix, tags=tags)
+        self.get_read_db = get_read_db
+        self.router = APIRouter(
+            prefix=prefix,
+            tags=tags,
+            route_class=DAOAPIRoute,
+            default_response_class=DAOJSONResponse,
+        )
 
         self.route_overrides = route_overrides
 
@@ -48,31 +76,200 @@ class BaseCRUDRouter(Generic[DBModelType]):
                 self.add_get_route()
             if "create" not in self.route_overrides:
                 self.add_create_route()
+            # DAOs overriding create (e.g. users) must not be bypassed by bulk writes
+            if "bulk_create" not in self.route_overrides and self.dao.can_bulk_create:
+                self.add_bulk_create_route()
             if "update" not in self.route_overrides:
                 self.add_update_route()
             if "delete" not in self.route_overrides:
                 self.add_delete_route()
 
+    async def get_page(
+        self,
+        request: Request,
+        db_session: AsyncSession,
+        limit: int,
+        offset: int,
+        include: Optional[List[str]] = None,
+        pagination: str = "offset",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Tuple[List[DBModelType], Dict[str, Any]]:
+        """Fetch a list page and its pagination meta using offset or cursor pagination."""
+        if self.is_cursor_page(pagination, after, before):
+            items, cursors = await self.dao.get_all_keyset(
+                db_session=db_session,
+                limit=limit,
+                after=after,
+                before=before,
+                include=include,
+            )
+            meta = self.dao.build_cursor_pagination_meta(
+                request=request, limit=limit, cursors=cursors
+            )
+
+            return items, meta
+
+        items = await self.dao.get_all(
+            db_session=db_session, offset=offset, limit=limit, include=include
+        )
+        meta = await self.dao.build_pagination_meta(
+            request=request, limit=limit, offset=offset, db_session=db_session
+        )
+
+        return items, meta
+
+    def cache_response(self) -> Callable:
+        """
+        Decorator caching a read route's encoded responses (see ResponseCache);
+        a no-op unless the router was given a response_cache_expiry.
+        """
+        if not self.response_cache_expiry:
+            return lambda endpoint: endpoint
+
+        return response_cache.cached(self.dao, expiry=self.response_cache_expiry)
+
+    async def get_validators(
+        self,
+        request: Request,
+        db_session: AsyncSession,
+        id: Optional[Union[UUID, int, str]] = None,
+        dao: Optional[BaseDAO] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Optional[Dict[str, str]]:
+        """
+        ETag and Last-Modified headers for a read of item id, of the offset page
+        at offset/limit, or of the whole list of dao's model (the router's DAO
+        by default).
+
+        The ETag hashes the version of the rows served (see
+        DBOperations.query_version, which also catches deletes), the DAO's cache
+        generations (bumped by writes to the related models its responses
+        embed) and the query string (include, paging).
+
+        Returns:
+            Optional[Dict[str, str]]: None if the model has no updated_at, the
+            item does not exist or Redis is unavailable: the generations are
+            then only bumped in the process that wrote, so other workers would
+            keep answering 304 for changed related rows.
+        """
+        if CacheManager.get_instance().get_redis() is None:
+            return None
+
+        dao = dao or self.dao
+        version = await dao.query_version(db_session, id, offset=offset, limit=limit)
+        if version is None or (id is not None and not version[1]):
+            return None
+
+        last_modified, count, ids = version
+        digest = hashlib.sha1(
+            json.dumps(
+                [
+                    str(id),
+                    str(last_modified),
+                    count,
+                    ids,
+                    await dao.cache_version(),
+                    request.url.query,
+                ]
+            ).encode()
+        ).hexdigest()
+        headers = {"ETag": f'W/"{digest[:27]}"', "Cache-Control": "no-cache"}
+
+        if last_modified is not None:
+            if last_modified.tzinfo is None:
+                last_modified = last_modified.replace(tzinfo=timezone.utc)
+            headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+        return headers
+
+    @staticmethod
+    def is_cursor_page(
+        pagination: str, after: Optional[str] = None, before: Optional[str] = None
+    ) -> bool:
+        """Whether a list read is served with cursor (keyset) pagination."""
+        return pagination == "cursor" or bool(after or before)
+
+    async def get_page_validators(
+        self,
+        request: Request,
+        db_session: AsyncSession,
+        limit: int,
+        offset: int,
+        pagination: str = "offset",
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> Optional[Dict[str, str]]:
+        """
+        get_validators for a list page. Cursor pages get none: they exist to
+        avoid reading the whole table, which their version would require.
+        """
+        if self.is_cursor_page(pagination, after, before):
+            return None
+
+        return await self.get_validators(
+            request, db_session, offset=offset, limit=limit
+        )
+
+    def is_not_modified(
+        self, request: Request, validators: Optional[Dict[str, str]]
+    ) -> bool:
+        """
+        Whether If-None-Match (weakly) matches the ETag.
+
+        If-Modified-Since is not evaluated: updated_at alone misses deletes and
+        changes to related rows, which the ETag accounts for.
+        """
+        return bool(validators) and etag_matches(
+            request.headers.get("if-none-match"), validators["ETag"]
+        )
+
     def add_get_all_route(self):
         @self.router.get("/")
+        @self.cache_response()
         async def get_all(
             request: Request,
+            response: Response,
             limit: int = Query(default=10, ge=1),
             offset: int = Query(default=0, ge=0),
-            db_session: AsyncSession = Depends(get_db),
+            include: Optional[str] = Query(
+                default=None, description="Comma separated relationships to load"
+            ),
+            pagination: Literal["offset", "cursor"] = Query(default="offset"),
+            after: Optional[str] = Query(
+                default=None, description="Cursor of the page to read after"
+            ),
+            before: Optional[str] = Query(
+                default=None, description="Cursor of the page to read before"
+            ),
+            db_session: AsyncSession = Depends(get_read_db),
         ) -> DAOResponse:
             try:
-                items = await self.dao.get_all(
-                    db_session=db_session, offset=offset, limit=limit
+                # answered before any row is loaded or serialized
+                validators = await self.get_page_validators(
+                    request, db_session, limit, offset, pagination, after, before
+                )
+                if self.is_not_modified(request, validators):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators
+                    )
+                response.headers.update(validators or {})
+
+                items, meta = await self.get_page(
+                    request=request,
+                    db_session=db_session,
+                    limit=limit,
+                    offset=offset,
+                    include=self.dao.parse_includes(include),
+                    pagination=pagination,
+                    after=after,
+                    before=before,
                 )
 
                 # if not items:
                 #     raise RecordNotFoundException(msg="No Record found")
 
-                meta = await self.dao.build_pagination_meta(
-                    request=request, limit=limit, offset=offset, db_session=db_session
-                )
-
                 if isinstance(items, DAOResponse):
                     if hasattr(items, "meta") and getattr(items, "meta"):
                         meta_data = items.meta
@@ -93,12 +290,32 @@ class BaseCRUDRouter(Generic[DBModelType]):
 
     def add_get_route(self):
         @self.router.get("/{id}")
+        @self.cache_response()
         async def get(
-            id: Union[UUID | int | str], db_session: AsyncSession = Depends(get_db)
+            request: Request,
+            response: Response,
+            id: Union[UUID | int | str],
+            include: Optional[str] = Query(
+                default=None, description="Comma separated relationships to load"
+            ),
+            db_session: AsyncSession = Depends(get_read_db),
         ) -> DAOResponse:
             try:
                 id = int(id) if isinstance(id, str) and id.isdigit() else id
-                item = await self.dao.get(db_session=db_session, id=id)
+
+                # answered before any row is loaded or serialized
+                validators = await self.get_validators(request, db_session, id)
+                if self.is_not_modified(request, validators):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators
+                    )
+                response.headers.update(validators or {})
+
+                item = await self.dao.get(
+                    db_session=db_session,
+                    id=id,
+                    include=self.dao.parse_includes(include),
+                )
 
                 if not item:
                     raise RecordNotFoundException(
@@ -147,6 +364,72 @@ class BaseCRUDRouter(Generic[DBModelType]):
             except Exception as e:
                 raise CustomException(e)
 
+    def add_bulk_create_route(self):
+        @self.router.post("/bulk", status_code=status.HTTP_201_CREATED)
+        async def bulk_create(
+            items: List[Dict[str, Any]] = Body(...),
+            upsert: bool = Query(
+                default=False,
+                description="Update rows whose primary or natural key already exists",
+            ),
+            db_session: AsyncSession = Depends(get_db),
+        ) -> DAOResponse:
+            # validate every row first so all errors are reported together
+            validated_items, errors = [], []
+            for index, item in enumerate(items):
+                try:
+                    validated_items.append(self.create_schema(**item))
+                except ValidationError as e:
+                    errors.append(
+                        {"index": index, "error": e.errors(include_url=False)}
+                    )
+
+            if not errors and upsert:
+                if not all(self.dao.can_upsert(item) for item in validated_items):
+                    raise CustomException(
+                        "Upsert is not supported for these items, create them individually"
+                    )
+
+                try:
+                    created_items = await self.dao.bulk_upsert(
+                        db_session=db_session, objs=validated_items
+                    )
+                except Exception as e:
+                    raise CustomException(e)
+            elif not errors:
+                try:
+                    created_items, errors = await self.dao.bulk_create(
+                        db_session=db_session, objs=validated_items
+                    )
+                except Exception as e:
+                    raise CustomException(e)
+
+            if errors:
+                failed_rows = sum(error.get("count", 1) for error in errors)
+                return DAOJSONResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    content=DAOResponse[dict](
+                        success=False,
+                        error=f"{failed_rows} of {len(items)} rows could not be created",
+                        meta={"errors": errors},
+                    ),
+                )
+
+            # determine how to call model_validate
+            method = getattr(self.create_schema, "model_validate")
+            signature = inspect.signature(method)
+
+            if "for_insertion" in signature.parameters:
+                model_validate = partial(method, for_insertion=False)
+            else:
+                model_validate = method
+
+            return DAOResponse(
+                success=True,
+                data=[model_validate(created_item) for created_item in created_items],
+                meta={"count": len(created_items)},
+            )
+
     def add_update_route(self):
         @self.router.put("/{id}")
         async def update(
@@ -0,0 +1,60 @@
+from typing import List
+from fastapi import APIRouter, Response, status
+
+# core
+from app.core.lifespan import cache_manager, db_manager, startup_coordinator
+from app.core.response import DAOResponse
+
+# cache
+from app.cache.cacheTier import model_cache
+from app.cache.cacheFlight import cache_flight
+from app.cache.cacheResponse import response_cache
+from app.cache.cacheCollection import collection_cache
+
+
+class InternalRouter:
+    """Operational endpoints (pool sizing, diagnostics); not part of the public API."""
+
+    def __init__(self, prefix: str = "/internal", tags: List[str] = ["Internal"]):
+        self.router = APIRouter(prefix=prefix, tags=tags, include_in_schema=False)
+
+        self.register_routes()
+
+    def register_routes(self):
+        @self.router.get("/db/pool")
+        async def db_pool() -> DAOResponse:
+            return DAOResponse(success=True, data=db_manager.db_module.pool_status())
+
+        @self.router.get("/cache")
+        async def cache_stats() -> DAOResponse:
+            return DAOResponse(
+                success=True,
+                data={
+                    **model_cache.get_stats(),
+                    "flight": cache_flight.get_stats(),
+                    "collections": collection_cache.get_stats(),
+                    "responses": response_cache.get_stats(),
+                    "breaker": cache_manager.breaker.get_stats(),
+                },
+            )
+
+        @self.router.get("/cache/health")
+        async def cache_health(response: Response) -> DAOResponse:
+            health = await cache_manager.health()
+            if not health["ok"]:
+                response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+            return DAOResponse(success=health["ok"], data=health)
+
+        @self.router.get("/ready")
+        async def ready(response: Response) -> DAOResponse:
+            if not startup_coordinator.ready:
+                response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+            return DAOResponse(
+                success=startup_coordinator.ready,
+                data={
+                    "ready": startup_coordinator.ready,
+                    "leader": startup_coordinator.is_leader,
+                },
+            )
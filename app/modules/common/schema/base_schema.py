@@ -1,11 +1,20 @@
-from faker import Faker
 from datetime import date
 from sqlalchemy import inspect
 from typing import List, Optional, Type, Dict
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from pydantic import BaseModel, ConfigDict, create_model
 
-BaseFaker = Faker()
+from app.core.config import settings
+from app.modules.common.schema.example_faker import ExampleFaker
+
+# faker only generates openapi examples; skip importing it in fast startup mode
+if settings.FAST_STARTUP:
+    BaseFaker = ExampleFaker()
+else:
+    from faker import Faker
+
+    BaseFaker = Faker()
+
 SchemasDictType = Dict[str, Type[BaseModel]]
 
 
@@ -43,7 +52,7 @@ class CustomBaseModel(BaseModel):
                 for name, (typ, _) in columns.items()
                 if name not in default_excludes
             },
-            __config__=ConfigDict(from_attributes=True),
+            __config__=ConfigDict(from_attributes=True, defer_build=True),
         )
 
         default_excludes.extend(excludes)
@@ -55,7 +64,7 @@ class CustomBaseModel(BaseModel):
                 for name, (typ, _) in columns.items()
                 if name not in default_excludes
             },
-            __config__=ConfigDict(from_attributes=True),
+            __config__=ConfigDict(from_attributes=True, defer_build=True),
         )
 
         update_schema = create_model(
@@ -65,7 +74,7 @@ class CustomBaseModel(BaseModel):
                 for name, (typ, _) in columns.items()
                 if name not in default_excludes
             },
-            __config__=ConfigDict(from_attributes=True),
+            __config__=ConfigDict(from_attributes=True, defer_build=True),
         )
 
         return {
@@ -0,0 +1,120 @@
+import uuid
+import random
+import string
+from typing import Any, List, Sequence
+from datetime import date, datetime, timedelta
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua"
+).split()
+
+
+class ExampleFaker:
+    """
+    Stdlib stand-in for the Faker methods our schemas use for OpenAPI examples.
+
+    Used when FAST_STARTUP is set so that importing the schemas neither imports
+    nor instantiates Faker (its locale providers dominate cold start time).
+    """
+
+    def uuid4(self) -> str:
+        return str(uuid.uuid4())
+
+    def boolean(self) -> bool:
+        return random.random() < 0.5
+
+    def random_int(self, min: int = 0, max: int = 9999) -> int:
+        return random.randint(min, max)
+
+    def random_number(self, digits: int = 4) -> int:
+        return random.randint(0, 10**digits - 1)
+
+    def random_element(self, elements: Sequence[Any] = ("a", "b", "c")) -> Any:
+        return random.choice(list(elements))
+
+    def random_choices(self, elements: Sequence[Any], length: int = 1) -> List[Any]:
+        return random.choices(list(elements), k=length)
+
+    def bothify(self, text: str = "## ??") -> str:
+        return "".join(
+            str(random.randint(0, 9))
+            if char == "#"
+            else random.choice(string.ascii_letters)
+            if char == "?"
+            else char
+            for char in text
+        )
+
+    def word(self) -> str:
+        return random.choice(_WORDS)
+
+    def sentence(self) -> str:
+        return " ".join(random.choices(_WORDS, k=6)).capitalize() + "."
+
+    def text(self, max_nb_chars: int = 200) -> str:
+        return " ".join(self.sentence() for _ in range(5))[:max_nb_chars]
+
+    def first_name(self) -> str:
+        return "Ama"
+
+    def last_name(self) -> str:
+        return "Mensah"
+
+    def name(self) -> str:
+        return f"{self.first_name()} {self.last_name()}"
+
+    def email(self) -> str:
+        return f"{self.word()}{self.random_number(3)}@example.com"
+
+    def phone_number(self) -> str:
+        return self.bothify("+233#########")
+
+    def url(self) -> str:
+        return f"https://www.example.com/{self.word()}"
+
+    def company(self) -> str:
+        return "Example Ltd"
+
+    def city(self) -> str:
+        return "Accra"
+
+    def job(self) -> str:
+        return "Teacher"
+
+    def _offset(self, value: str) -> timedelta:
+        # faker style relative dates: "now", "-2y", "-30d", "+1y"
+        if value in ("now", "today"):
+            return timedelta()
+
+        units = {"y": 365, "m": 30, "w": 7, "d": 1}
+        return timedelta(days=int(value[:-1]) * units[value[-1]])
+
+    def date_time_between(
+        self, start_date: str = "-30y", end_date: str = "now"
+    ) -> datetime:
+        start = datetime.now() + self._offset(start_date)
+        end = datetime.now() + self._offset(end_date)
+        return start + (end - start) * random.random()
+
+    def date_between(self, start_date: str = "-30y", end_date: str = "today") -> date:
+        return self.date_time_between(start_date, end_date).date()
+
+    def date_time_this_year(self) -> datetime:
+        now = datetime.now()
+        start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+        return start + (now - start) * random.random()
+
+    def date_time_this_month(self) -> datetime:
+        now = datetime.now()
+        start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return start + (now - start) * random.random()
+
+    def date_this_year(self) -> date:
+        return self.date_time_this_year().date()
+
+    def future_datetime(self, end_date: str = "+30d") -> datetime:
+        return self.date_time_between("now", end_date)
+
+    def future_date(self, end_date: str = "+30d") -> date:
+        return self.future_datetime(end_date).date()
@@ -17,4 +17,5 @@ class AnswerDAO(BaseDAO[Answer]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="answer_id",
+            include_graph=["question", "questionnaire", "entity_questionnaires"],
         )
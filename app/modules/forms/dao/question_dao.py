@@ -26,4 +26,5 @@ class QuestionDAO(BaseDAO[Question]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="question_id",
+            include_graph=["answers", "questionnaire", "entity_questionnaires"],
         )
@@ -22,4 +22,5 @@ class QuestionnaireDAO(BaseDAO[Questionnaire]):
             detail_mappings=self.detail_mappings,
             excludes=excludes,
             primary_key="questionnaire_id",
+            include_graph=["questions", "questions.answers", "entity_questionnaires"],
         )
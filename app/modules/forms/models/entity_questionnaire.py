@@ -1,6 +1,13 @@
 import uuid
 from importlib import import_module
-from sqlalchemy.orm import relationship, Mapped, mapped_column, validates, Session
+from sqlalchemy.orm import (
+    relationship,
+    Mapped,
+    mapped_column,
+    object_session,
+    validates,
+    Session,
+)
 from sqlalchemy import UUID, ForeignKey, Enum, Boolean, CheckConstraint, event, inspect
 
 from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
@@ -139,4 +146,8 @@ def increment_number_of_responses(mapper, connection, target):
                     questionnaire.number_of_responses = distinct_user_count
                     session.add(questionnaire)
                     session.commit()  # Save the updated number_of_responses
+
+                    # written behind the DAOs: have the flushing session's
+                    # commit retire the cached questionnaires
+                    questionnaire_model.stage_cache_invalidation(object_session(target))
                 session.close()
@@ -3,7 +3,7 @@ from typing import List, Union
 from sqlalchemy import update
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
-from fastapi import Depends, Query, Request
+from fastapi import Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -14,6 +14,7 @@ from app.modules.associations.enums.entity_type_enums import EntityTypeEnum
 from app.modules.forms.models.entity_questionnaire import EntityQuestionnaire
 
 # dao
+from app.modules.common.dao.base_dao import BaseDAO
 from app.modules.forms.dao.questionnaire_dao import QuestionnaireDAO
 
 # router
@@ -27,6 +28,7 @@ from app.modules.forms.schema.questionnaire_schema import (
 )
 
 # core
+from app.core.config import settings
 from app.core.response import DAOResponse
 from app.core.errors import CustomException, RecordNotFoundException, IntegrityError
 from app.modules.auth.schema.mixins.user_mixin import UserBaseMixin
@@ -39,14 +41,23 @@ class QuestionnaireRouter(BaseCRUDRouter):
         self.dao: QuestionnaireDAO = QuestionnaireDAO(
             excludes=["entity_questionnaires"]
         )
+        # versions the /responses/ reads, which query entity questionnaires directly
+        self.responses_dao = BaseDAO(
+            EntityQuestionnaire, primary_key="entity_questionnaire_id"
+        )
 
         super().__init__(
-            dao=self.dao, schemas=QuestionnaireSchema, prefix=prefix, tags=tags
+            dao=self.dao,
+            schemas=QuestionnaireSchema,
+            prefix=prefix,
+            tags=tags,
+            response_cache_expiry=settings.CACHE_RESPONSE_TTL,
         )
         self.register_routes()
 
     def register_routes(self):
         @self.router.get("/published/")
+        @self.cache_response()
         async def published_questionnaires(
             request: Request,
             limit: int = Query(default=10, ge=1),
@@ -127,6 +138,7 @@ class QuestionnaireRouter(BaseCRUDRouter):
                 raise CustomException(e)
 
         @self.router.get("/onboarding/")
+        @self.cache_response()
         async def onboarding_questionnaires(
             request: Request,
             limit: int = Query(default=10, ge=1),
@@ -171,10 +183,20 @@ class QuestionnaireRouter(BaseCRUDRouter):
         @self.router.get("/responses/")
         async def get_user_entity_questionnaire_data(
             request: Request,
+            response: Response,
             limit: int = Query(default=10, ge=1),
             offset: int = Query(default=0, ge=0),
             db_session: AsyncSession = Depends(self.get_db),
         ):
+            validators = await self.get_validators(
+                request, db_session, dao=self.responses_dao
+            )
+            if self.is_not_modified(request, validators):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=validators
+                )
+            response.headers.update(validators or {})
+
             # Query entity questionnaires where entity_type is 'user'
             stmt = (
                 select(EntityQuestionnaire)
@@ -291,6 +313,9 @@ class QuestionnaireRouter(BaseCRUDRouter):
                 await db_session.execute(update_stmt)
                 await db_session.commit()
 
+                # a Core update: no objects for the DAO layer to see
+                await self.responses_dao.after_write(db_session, [])
+
             except Exception as e:
                 await db_session.rollback()
                 raise Exception(f"Failed to mark questionnaire as read: {str(e)}")
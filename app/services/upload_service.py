@@ -5,7 +5,7 @@ import cloudinary.api
 import cloudinary.uploader
 
 # utils
-from app.core.config import settings
+from app.core.config import settings, configure_cloudinary
 from app.core.response import DAOResponse
 
 
@@ -15,6 +15,8 @@ class MediaUploaderService:
         self.file_name = file_name
         self.media_type = media_type
 
+        configure_cloudinary()
+
     def get_image_type(self):
         """
         Extracts the image type from a base64 encoded image string.
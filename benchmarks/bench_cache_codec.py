@@ -0,0 +1,169 @@
+"""
+Measure cache payload size and encode/decode time for User and Questionnaire.
+
+Loads one user (with roles and permissions) and one questionnaire (with its
+questions) through their DAOs, the way a cached read does, from a throwaway
+SQLite database, then times EntityCodec.dumps / loads. The same codec with the
+stdlib json module in place of orjson is shown as a baseline.
+
+Usage (with the app's .env / environment loaded):
+    python -m benchmarks.bench_cache_codec [--children 10] [--runs 2000]
+"""
+
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from uuid import uuid4
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Dict, Union
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# core
+from app.db.dbDeclarative import Base
+import app.core.routes  # noqa: F401 (imports every DAO and model)
+
+# cache
+from app.cache.cacheCodec import EntityCodec, entity_codec
+
+# models
+from app.modules.auth.models.role import Role
+from app.modules.auth.models.user import User
+from app.modules.auth.models.permissions import Permissions
+from app.modules.forms.models.question import Question
+from app.modules.forms.models.questionnaire import Questionnaire
+from app.modules.auth.enums.user_enums import GenderEnum
+from app.modules.forms.enums.questionnaire_enums import QuestionType
+
+# daos
+from app.modules.auth.dao.user_dao import UserDAO
+from app.modules.forms.dao.questionnaire_dao import QuestionnaireDAO
+
+
+class StdlibJSONCodec(EntityCodec):
+    def encode_value(self, value: Any) -> Any:
+        if isinstance(value, Decimal) or hasattr(value, "hex"):
+            return str(value)
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        if hasattr(value, "value"):
+            return value.value
+
+        return super().encode_value(value)
+
+    def encode(self, data: Dict[str, Any]) -> str:
+        return json.dumps(data, default=self.encode_value, separators=(",", ":"))
+
+    def decode(self, payload: Union[str, bytes]) -> Dict[str, Any]:
+        return json.loads(payload)
+
+
+def build_user(children: int) -> User:
+    roles = [
+        Role(
+            name=f"role-{uuid4().hex[:8]}",
+            alias="bench",
+            description="benchmark role",
+            permissions=[
+                Permissions(name=f"perm-{uuid4().hex[:8]}", alias="bench")
+                for _ in range(children)
+            ],
+        )
+        for _ in range(2)
+    ]
+
+    return User(
+        first_name="Ama",
+        last_name="Mensah",
+        email=f"{uuid4().hex[:8]}@example.com",
+        phone_number="+233000000000",
+        identification_number="GHA-000000000-0",
+        photo_url="https://www.example.com/photo.png",
+        gender=GenderEnum.female,
+        date_of_birth=date(1990, 1, 1),
+        roles=roles,
+    )
+
+
+def build_questionnaire(children: int) -> Questionnaire:
+    return Questionnaire(
+        title="Onboarding",
+        description="benchmark questionnaire",
+        published=True,
+        questionnaire_questions=[
+            Question(
+                content=f"Question {index}?",
+                question_type=QuestionType.short_text,
+            )
+            for index in range(children)
+        ],
+    )
+
+
+def timed(fn: Callable[[], Any], runs: int) -> float:
+    """Mean microseconds per call."""
+    start_time = time.perf_counter()
+    for _ in range(runs):
+        fn()
+
+    return (time.perf_counter() - start_time) / runs * 1e6
+
+
+async def run(children: int, runs: int):
+    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file.name}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with Session() as session:
+        user, questionnaire = build_user(children), build_questionnaire(children)
+        session.add_all([user, questionnaire])
+        await session.commit()
+        ids = {
+            "User": str(user.user_id),
+            "Questionnaire": str(questionnaire.questionnaire_id),
+        }
+
+    print(f"{children} children per entity, mean of {runs} runs")
+    print(
+        f"{'entity':<15}{'objects':>8}{'bytes':>8}{'enc µs':>9}{'dec µs':>9}"
+        f"{'json bytes':>12}{'json enc':>10}{'json dec':>10}"
+    )
+
+    baseline_codec = StdlibJSONCodec()
+
+    for dao in (UserDAO(), QuestionnaireDAO()):
+        async with Session() as session:
+            db_obj = await dao.get(session, ids[dao.model.__name__])
+
+        payload = entity_codec.dumps(db_obj)
+        baseline = baseline_codec.dumps(db_obj)
+        assert entity_codec.loads(payload) is not None
+
+        print(
+            f"{dao.model.__name__:<15}{len(json.loads(payload)['objects']):>8}"
+            f"{len(payload.encode()):>8}"
+            f"{timed(lambda: entity_codec.dumps(db_obj), runs):>9.1f}"
+            f"{timed(lambda: entity_codec.loads(payload), runs):>9.1f}"
+            f"{len(baseline.encode()):>12}"
+            f"{timed(lambda: baseline_codec.dumps(db_obj), runs):>10.1f}"
+            f"{timed(lambda: baseline_codec.loads(baseline), runs):>10.1f}"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--children", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    asyncio.run(run(children=args.children, runs=args.runs))
@@ -0,0 +1,177 @@
+"""
+Measure /users/?limit=100 throughput with FastAPI's JSON path and DAOJSONResponse.
+
+Serves the user routes from two otherwise identical apps over a throwaway
+SQLite database: one with FastAPI's APIRoute and JSONResponse (the returned
+DAOResponse is validated against the response model, dumped, passed through
+jsonable_encoder and encoded with json), one with DAOAPIRoute and
+DAOJSONResponse (encoded once with orjson). Requests go through httpx's ASGI
+transport, without a server or middleware, and both bodies are compared. The
+encoding of the same DAOResponse by each app is also timed on its own.
+
+Usage (with the app's .env / environment loaded):
+    python -m benchmarks.bench_response_class [--users 100] [--requests 200]
+"""
+
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+from typing import Awaitable, Callable, Type
+from fastapi import FastAPI
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# core
+from app.db.dbDeclarative import Base
+from app.core.lifespan import get_db, get_read_db
+from app.core.response import DAOAPIRoute, DAOJSONResponse, DAOResponse
+import app.core.routes  # noqa: F401 (imports every DAO and model)
+
+# daos
+from app.modules.auth.dao.user_dao import UserDAO
+
+# routers
+from app.modules.auth.router.user_router import UserRouter
+
+from benchmarks.bench_cache_codec import build_user
+
+URL = "/users/?limit=100"
+
+
+def build_app(
+    route_class: Type[APIRoute], response_class: Type[JSONResponse], Session
+) -> FastAPI:
+    app = FastAPI(default_response_class=response_class)
+
+    for route in UserRouter(prefix="/users", tags=["Users"]).router.routes:
+        app.router.add_api_route(
+            route.path,
+            route.endpoint,
+            methods=route.methods,
+            response_model=route.response_model,
+            status_code=route.status_code,
+            response_class=response_class,
+            route_class_override=route_class,
+        )
+
+    async def get_session():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_session
+    app.dependency_overrides[get_read_db] = get_session
+
+    return app
+
+
+async def throughput(app: FastAPI, requests: int) -> float:
+    """Requests per second over sequential requests (after one warm-up)."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        (await client.get(URL)).raise_for_status()
+
+        start_time = time.perf_counter()
+        for _ in range(requests):
+            await client.get(URL)
+
+    return requests / (time.perf_counter() - start_time)
+
+
+async def fetch(app: FastAPI) -> bytes:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+        return (await client.get(URL)).content
+
+
+async def encode_fastapi(route: APIRoute, dao_response: DAOResponse) -> bytes:
+    """What FastAPI does with a DAOResponse returned by an APIRoute endpoint."""
+    content = await serialize_response(
+        field=route.response_field, response_content=dao_response, is_coroutine=True
+    )
+
+    return JSONResponse(content).body
+
+
+async def encode_single_pass(route: APIRoute, dao_response: DAOResponse) -> bytes:
+    return DAOJSONResponse(dao_response).body
+
+
+async def timed_encode(
+    encode: Callable[[APIRoute, DAOResponse], Awaitable[bytes]],
+    route: APIRoute,
+    dao_response: DAOResponse,
+    runs: int,
+) -> float:
+    """Mean milliseconds per encoding."""
+    start_time = time.perf_counter()
+    for _ in range(runs):
+        await encode(route, dao_response)
+
+    return (time.perf_counter() - start_time) / runs * 1000
+
+
+async def run(users: int, requests: int):
+    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file.name}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with Session() as session:
+        session.add_all([build_user(children=2) for _ in range(users)])
+        await session.commit()
+
+    apps = {
+        "APIRoute + JSONResponse": (
+            build_app(APIRoute, JSONResponse, Session),
+            encode_fastapi,
+        ),
+        "DAOAPIRoute + DAOJSONResponse": (
+            build_app(DAOAPIRoute, DAOJSONResponse, Session),
+            encode_single_pass,
+        ),
+    }
+
+    bodies = [await fetch(served) for served, _ in apps.values()]
+    assert json.loads(bodies[0]) == json.loads(bodies[1])
+
+    async with Session() as session:
+        dao_response = DAOResponse(
+            success=True, data=await UserDAO().get_all(session, limit=users)
+        )
+
+    print(
+        f"GET {URL}: {len(json.loads(bodies[0])['data'])} users, "
+        f"{len(bodies[1])} bytes, identical bytes: {bodies[0] == bodies[1]}"
+    )
+    print(f"{'app':<32}{'req/s':>8}{'ms/req':>9}{'encode ms':>11}")
+    for label, (served, encode) in apps.items():
+        route = next(
+            route
+            for route in served.routes
+            if isinstance(route, APIRoute) and route.path == "/users/"
+        )
+        rate = await throughput(served, requests)
+        encode_ms = await timed_encode(encode, route, dao_response, requests)
+        print(f"{label:<32}{rate:>8.1f}{1000 / rate:>9.2f}{encode_ms:>11.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(users=args.users, requests=args.requests))
@@ -0,0 +1,134 @@
+"""
+Measure per-item cost of converting ORM rows to their *Response schemas.
+
+Loads a page of users (with roles and permissions) through UserDAO from a
+throwaway SQLite database and converts it the way DAOResponse does: first
+with the old per-response path (import the schema module, look the class up
+and print, then model_validate item by item), then through the startup-built
+response schema registry. A plain from_attributes schema, which the registry
+validates as a whole list with a cached TypeAdapter, is timed against per-item
+model_validate as well.
+
+Usage (with the app's .env / environment loaded):
+    python -m benchmarks.bench_response_schema [--rows 100] [--runs 200]
+"""
+
+import io
+import time
+import asyncio
+import argparse
+import tempfile
+import contextlib
+from uuid import UUID
+from importlib import import_module
+from typing import Any, Callable, List, Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# core
+from app.db.dbDeclarative import Base
+from app.core.response import ResponseSchema, response_schema_registry
+import app.core.routes  # noqa: F401 (imports every DAO and model)
+
+# models
+from app.modules.auth.models.user import User
+
+# daos
+from app.modules.auth.dao.user_dao import UserDAO
+
+from benchmarks.bench_cache_codec import build_user, timed
+
+
+class PlainUserResponse(BaseModel):
+    user_id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    phone_number: Optional[str] = None
+    photo_url: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+def legacy_convert(data: List[Any]) -> List[Any]:
+    """DAOResponse._convert_data before the registry (prints discarded)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        sa_class = type(data[0])
+        module_name = sa_class.__module__.replace(".models.", ".schema.")
+        if not module_name.endswith("_schema"):
+            module_name += "_schema"
+        schema_name = f"{sa_class.__name__}Response"
+
+        print(f"Trying to import: {module_name}.{schema_name}")
+        schema = getattr(import_module(module_name), schema_name)
+        print(f"response_class {schema} {type(schema)}")
+
+        return [schema.model_validate(item) for item in data]
+
+
+def registry_convert(data: List[Any]) -> List[Any]:
+    """DAOResponse._convert_data with the registry."""
+    return response_schema_registry.get(type(data[0])).validate_list(data)
+
+
+async def run(rows: int, runs: int):
+    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file.name}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(
+        bind=engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with Session() as session:
+        session.add_all([build_user(children=2) for _ in range(rows)])
+        await session.commit()
+
+    async with Session() as session:
+        users = list(await UserDAO().get_all(session, limit=rows))
+
+    started = time.perf_counter()
+    schema_count = response_schema_registry.build_all()
+    build_ms = (time.perf_counter() - started) * 1000
+    assert legacy_convert(users) == registry_convert(users)
+
+    def per_item(fn: Callable[[], Any]) -> float:
+        return timed(fn, runs) / rows
+
+    plain = ResponseSchema(
+        schema=PlainUserResponse,
+        custom_validate=False,
+        list_adapter=TypeAdapter(List[PlainUserResponse]),
+    )
+    assert plain.validate_list(users) == [
+        PlainUserResponse.model_validate(user) for user in users
+    ]
+
+    print(
+        f"registry: {schema_count} schemas resolved in {build_ms:.1f}ms; "
+        f"{len(users)} {User.__name__} rows, mean of {runs} runs"
+    )
+    print(f"{'path':<40}{'µs/item':>10}")
+    for label, fn in (
+        ("UserResponse, per-response resolve", lambda: legacy_convert(users)),
+        ("UserResponse, registry", lambda: registry_convert(users)),
+        (
+            "plain schema, per-item model_validate",
+            lambda: [PlainUserResponse.model_validate(user) for user in users],
+        ),
+        ("plain schema, cached TypeAdapter", lambda: plain.validate_list(users)),
+    ):
+        print(f"{label:<40}{per_item(fn):>10.2f}")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(rows=args.rows, runs=args.runs))
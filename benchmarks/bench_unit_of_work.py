@@ -0,0 +1,112 @@
+"""
+Count commits, flushes and statements for nested creates.
+
+Creates a role with N permissions through RoleDAO.create, then attaches N more
+permissions through RoleDAO.update, against a throwaway SQLite database.
+
+Usage (with the app's .env / environment loaded):
+    python -m benchmarks.bench_unit_of_work [--children 5] [--runs 5]
+"""
+
+import time
+import asyncio
+import argparse
+import tempfile
+from uuid import uuid4
+from collections import Counter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+# core
+from app.db.dbModule import WriteSession
+from app.db.dbDeclarative import Base
+import app.core.routes  # noqa: F401 (imports every DAO and model)
+
+# daos
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def role_payload(children: int):
+    return {
+        "name": f"role-{uuid4().hex[:8]}",
+        "alias": "bench",
+        "description": "benchmark role",
+        "permissions": [
+            {"name": f"perm-{uuid4().hex[:8]}", "alias": "bench"}
+            for _ in range(children)
+        ],
+    }
+
+
+async def run(children: int, runs: int):
+    db_file = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file.name}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    counts = Counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def count_statement(*args):
+        counts["statements"] += 1
+
+    @event.listens_for(WriteSession, "after_commit")
+    def count_commit(session):
+        counts["commits"] += 1
+
+    @event.listens_for(WriteSession, "after_flush")
+    def count_flush(session, flush_context):
+        counts["flushes"] += 1
+
+    Session = async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        sync_session_class=WriteSession,
+    )
+
+    dao = RoleDAO()
+    totals = {"create": Counter(), "update": Counter()}
+
+    for _ in range(runs):
+        for operation in totals:
+            counts.clear()
+            start_time = time.perf_counter()
+
+            async with Session() as session:
+                if operation == "create":
+                    role = await dao.create(
+                        db_session=session, obj_in=role_payload(children)
+                    )
+                else:
+                    await dao.update(
+                        db_session=session,
+                        db_obj=await session.merge(role),
+                        obj_in={"permissions": role_payload(children)["permissions"]},
+                    )
+
+            counts["ms"] = (time.perf_counter() - start_time) * 1000
+            totals[operation].update(counts)
+
+    print(f"role with {children} permissions, mean of {runs} runs")
+    print(f"{'operation':<12}{'commits':>9}{'flushes':>9}{'stmts':>8}{'ms':>9}")
+    for operation, total in totals.items():
+        print(
+            f"{operation:<12}{total['commits'] / runs:>9.1f}"
+            f"{total['flushes'] / runs:>9.1f}{total['statements'] / runs:>8.1f}"
+            f"{total['ms'] / runs:>9.1f}"
+        )
+
+    event.remove(WriteSession, "after_commit", count_commit)
+    event.remove(WriteSession, "after_flush", count_flush)
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--children", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(children=args.children, runs=args.runs))
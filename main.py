@@ -4,10 +4,16 @@ from fastapi import FastAPI
 # local imports
 from app.core.config import settings
 from app.core.lifespan import lifespan
+from app.core.response import DAOJSONResponse
 from app.core.routes import configure_routes
 from app.core.middleware import configure_middleware
 
-app = FastAPI(title=settings.APP_NAME, description="", lifespan=lifespan)
+app = FastAPI(
+    title=settings.APP_NAME,
+    description="",
+    lifespan=lifespan,
+    default_response_class=DAOJSONResponse,
+)
 
 # configure middleware and routes
 configure_middleware(app)
@@ -0,0 +1,133 @@
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# settings are read at import time; the SQLite database (app.db) and the logs
+# are kept in a throwaway directory
+TEST_DIRECTORY = tempfile.mkdtemp(prefix="daycare-tests-")
+os.environ.update(
+    APP_NAME="daycare-tests",
+    APP_URL="127.0.0.1",
+    LOG_LEVEL="WARNING",
+    DB_USER="tests",
+    DB_PASSWORD="tests",
+    DB_HOST="localhost",
+    DB_PORT="5432",
+    DB_DATABASE="app.db",
+    DB_ENGINE="sqlite",
+    DB_DATABASE_DEFAULT="postgres",
+    GOOGLE_SIGNIN_CLIENT_ID="tests",
+    GOOGLE_SIGNIN_CLIENT_SECRET="tests",
+    GOOGLE_CALLBACK="http://localhost/callback",
+    CLOUDINARY_CLOUD_NAME="tests",
+    CLOUDINARY_API_KEY="tests",
+    CLOUDINARY_API_SECRET="tests",
+    JWT_ALGORITHM="HS256",
+    JWT_SECRET="tests",
+    PYTHON_VERSION="3.12",
+    EMAIL="tests@example.com",
+    EMAIL_PASSWORD="tests",
+    EMAIL_SERVER="localhost",
+    ENCRYPT_KEY="WGdRG0n4G7O4dV5BPczjJX39lOw42xdlq4Ci6ukb61Y=",
+    ACCESS_TOKEN_EXPIRE_MINUTES="30",
+    REFRESH_TOKEN_EXPIRE_MINUTES="60",
+    CACHE_PATH=TEST_DIRECTORY,
+    CACHE_HOST="localhost",
+    CACHE_PORT="6379",
+    CACHE_PASSWORD="tests",
+    CACHE_USER="tests",
+    CACHE_SSL="false",
+    REDIS_URL="redis://localhost",
+    WHATSAPP_KEY="tests",
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.logger import AppLogger  # noqa: E402
+
+AppLogger.LOG_DIRECTORY = os.path.join(TEST_DIRECTORY, "logs")
+
+import main  # noqa: E402
+from app.core.lifespan import cache_manager, db_manager  # noqa: E402
+from app.cache.cacheTier import model_cache  # noqa: E402
+from app.cache.cacheResponse import response_cache  # noqa: E402
+from app.cache.cacheCollection import collection_cache  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    # the SQLite engine opens app.db relative to the working directory
+    working_directory = os.getcwd()
+    os.chdir(TEST_DIRECTORY)
+
+    try:
+        with TestClient(main.app) as client:
+            # no Redis by default: the cache runs on its in-process tier only
+            client.portal.call(cache_manager.disconnect)
+            yield client
+    finally:
+        os.chdir(working_directory)
+
+
+@pytest.fixture
+def run(client):
+    """Run a coroutine function on the app's event loop."""
+    return client.portal.call
+
+
+@pytest.fixture
+def db(run):
+    """Session factories: db.write() on the primary, db.read() on a replica."""
+    db_module = db_manager.db_module
+
+    return SimpleNamespace(
+        write=db_module.Session,
+        read=lambda: db_module.ReadSession(bind=db_module.get_read_engine()),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clean_cache(client):
+    """Start every test with empty caches, closed breaker and no pinned reads."""
+    for cache in (model_cache, response_cache, collection_cache):
+        cache.stats.clear()
+    model_cache.local.clear()
+    model_cache._generations.clear()
+    cache_manager.breaker.record_success()
+    client.cookies.clear()
+
+    yield
+
+
+@pytest.fixture
+def redis(run, monkeypatch):
+    """A fake Redis shared by every cache call, as if all workers used it."""
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def connect():
+        return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+    fake = run(connect)
+    monkeypatch.setattr(cache_manager, "_cache_module", SimpleNamespace(redis=fake))
+
+    yield fake
+
+    run(fake.aclose)
+
+
+@pytest.fixture
+def queries():
+    """The SELECT statements run on any engine while the test runs."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", record)
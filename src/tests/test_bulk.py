@@ -0,0 +1,149 @@
+from datetime import datetime
+from uuid import uuid4
+
+from app.modules.auth.dao.attendance_dao import AttendanceLogDAO
+from app.modules.auth.dao.role_dao import RoleDAO
+from app.modules.auth.dao.user_dao import UserDAO
+from app.modules.auth.enums.user_enums import GenderEnum
+from app.modules.auth.models.user import User
+from app.modules.billing.dao.invoice_item_dao import InvoiceItemDAO
+
+
+def unique(prefix: str) -> str:
+    return f"{prefix}-{uuid4().hex[:8]}"
+
+
+def get_role(run, db, name: str):
+    async def load():
+        async with db.write() as session:
+            return await RoleDAO().query(session, filters={"name": name}, single=True)
+
+    return run(load)
+
+
+def test_bulk_create_inserts_every_row(client, run, db):
+    names = [unique("bulk") for _ in range(3)]
+
+    response = client.post("/roles/bulk", json=[{"name": name} for name in names])
+
+    assert response.status_code == 201
+    assert response.json()["meta"] == {"count": 3}
+    assert [role["name"] for role in response.json()["data"]] == names
+    assert all(get_role(run, db, name) for name in names)
+
+
+def test_invalid_rows_are_reported_and_nothing_is_written(client, run, db):
+    valid = unique("bulk")
+
+    response = client.post("/roles/bulk", json=[{"name": valid}, {"name": ["x"]}])
+
+    assert response.status_code == 400
+    assert [error["index"] for error in response.json()["meta"]["errors"]] == [1]
+    assert get_role(run, db, valid) is None
+
+
+def test_database_errors_roll_back_the_whole_chunk(client, run, db):
+    existing, new = unique("bulk"), unique("bulk")
+    client.post("/roles/bulk", json=[{"name": existing}])
+
+    # role names are unique
+    response = client.post("/roles/bulk", json=[{"name": new}, {"name": existing}])
+
+    assert response.status_code == 400
+    assert response.json()["meta"]["errors"][0]["count"] == 2
+    assert get_role(run, db, new) is None
+
+
+def test_bulk_create_runs_mapper_events(run, db):
+    # AttendanceLog parses its string dates in a before_insert listener
+    async def create():
+        async with db.write() as session:
+            return await AttendanceLogDAO().bulk_create(
+                session,
+                [{"user_id": uuid4(), "check_in_time": "2024-01-02T08:30:00"}],
+            )
+
+    (log,), errors = run(create)
+
+    assert errors == []
+    assert log.check_in_time.replace(tzinfo=None) == datetime(2024, 1, 2, 8, 30)
+
+
+def test_users_bulk_does_not_bypass_the_duplicate_email_check(client, run, db):
+    email = f"{unique('bulk')}@example.com"
+    row = {
+        "first_name": "Bulk",
+        "last_name": "User",
+        "email": email,
+        "phone_number": "000",
+        "identification_number": "000",
+        "photo_url": "",
+        "gender": GenderEnum.other,
+    }
+
+    async def create():
+        async with db.write() as session:
+            session.add(User(**row))
+            await session.commit()
+
+    def count(email: str) -> int:
+        async def query():
+            async with db.write() as session:
+                return len(await UserDAO().query(session, filters={"email": email}))
+
+        return run(query)
+
+    run(create)
+    new_email = f"{unique('bulk')}@example.com"
+
+    # UserDAO overrides create, so there is no bulk route to skip it
+    duplicate = client.post("/users/bulk", json=[{**row, "gender": "other"}])
+    new = client.post(
+        "/users/bulk", json=[{**row, "email": new_email, "gender": "other"}]
+    )
+
+    assert duplicate.status_code == new.status_code == 405
+    assert count(email) == 1
+    assert count(new_email) == 0
+
+
+def test_upsert_updates_existing_rows_on_the_natural_key(client, run, db):
+    name = unique("upsert")
+    created = client.post(
+        "/roles/bulk?upsert=true", json=[{"name": name, "description": "old"}]
+    )
+    assert created.status_code == 201
+    before = get_role(run, db, name)
+
+    updated = client.post(
+        "/roles/bulk?upsert=true", json=[{"name": name, "description": "new"}]
+    )
+    assert updated.status_code == 201
+    after = get_role(run, db, name)
+
+    assert after.role_id == before.role_id
+    assert after.description == "new"
+
+
+def test_upsert_bumps_updated_at(client, run, db):
+    name = unique("upsert")
+    client.post("/roles/bulk?upsert=true", json=[{"name": name, "description": "old"}])
+    before = get_role(run, db, name)
+
+    client.post("/roles/bulk?upsert=true", json=[{"name": name, "description": "new"}])
+    after = get_role(run, db, name)
+
+    assert after.updated_at > before.updated_at
+    assert after.created_at == before.created_at
+
+
+def test_create_or_update_runs_mapper_events(run, db):
+    # a native upsert would skip the before_insert listener computing total_price
+    async def create():
+        async with db.write() as session:
+            return await InvoiceItemDAO().create_or_update(
+                session,
+                {"invoice_number": unique("invoice"), "quantity": 2, "unit_price": 3},
+            )
+
+    assert run(create).total_price == 6
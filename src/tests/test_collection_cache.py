@@ -0,0 +1,93 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import selectinload
+
+from app.cache.cacheCollection import collection_cache
+from app.modules.auth.models.role import Role
+from app.modules.auth.models.permissions import Permissions
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def create(client, run, db, path: str, model) -> str:
+    """Create a role or permission through the API and return its id."""
+    name = f"collection-{uuid4().hex[:8]}"
+    response = client.post(path, json={"name": name})
+    assert response.status_code == 201
+
+    async def find():
+        async with db.write() as session:
+            return (
+                await session.execute(select(model).filter_by(name=name))
+            ).scalar_one()
+
+    return str(inspect(run(find)).identity[0])
+
+
+def grant(run, db, role_id: str, permission_id: str):
+    """Add a permission to a role the way a DAO write does."""
+
+    async def write():
+        async with db.write() as session:
+            dao = RoleDAO()
+            async with dao.unit_of_work(session):
+                role = await session.get(
+                    Role, UUID(role_id), options=[selectinload(Role.permissions)]
+                )
+                role.permissions.append(
+                    await session.get(Permissions, UUID(permission_id))
+                )
+                await dao.after_write(session, [role])
+
+    run(write)
+
+
+def permission_ids(client, role_id: str) -> list:
+    # read as a client outside its read-your-writes window, i.e. from the cache
+    client.cookies.clear()
+    response = client.get(f"/roles/{role_id}?include=permissions")
+    assert response.status_code == 200
+
+    permissions = response.json()["data"]["permissions"]
+    return sorted(permission["permission_id"] for permission in permissions)
+
+
+def test_detail_reads_fill_and_reuse_the_collection_cache(client, run, db):
+    role = create(client, run, db, "/roles/", Role)
+    permission = create(client, run, db, "/permissions/", Permissions)
+    grant(run, db, role, permission)
+
+    assert permission_ids(client, role) == [permission]
+    assert collection_cache.stats["misses"] == 1
+
+    # retires the cached role, not the cached collection
+    create(client, run, db, "/roles/", Role)
+
+    assert permission_ids(client, role) == [permission]
+    assert collection_cache.stats["hits"] == 1
+    assert collection_cache.stats["misses"] == 1
+
+
+def test_membership_changes_invalidate_the_collection(client, run, db):
+    role = create(client, run, db, "/roles/", Role)
+    first, second = (
+        create(client, run, db, "/permissions/", Permissions),
+        create(client, run, db, "/permissions/", Permissions),
+    )
+    grant(run, db, role, first)
+    assert permission_ids(client, role) == [first]
+
+    grant(run, db, role, second)
+
+    assert permission_ids(client, role) == sorted([first, second])
+    assert collection_cache.stats["invalidations"] >= 1
+    assert collection_cache.stats["hits"] == 0
+
+
+def test_nested_includes_are_loaded_by_the_query():
+    query_paths, collections = RoleDAO().split_collection_includes(
+        ["permissions", "users", "users.roles"]
+    )
+
+    assert query_paths == ["users", "users.roles"]
+    assert collections == ["permissions"]
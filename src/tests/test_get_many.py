@@ -0,0 +1,71 @@
+from uuid import uuid4
+
+from app.cache.cacheTier import model_cache
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def create_roles(client, run, db, count: int) -> list:
+    names = [f"many-{uuid4().hex[:8]}" for _ in range(count)]
+    response = client.post("/roles/bulk", json=[{"name": name} for name in names])
+    assert response.status_code == 201
+
+    async def find():
+        async with db.write() as session:
+            dao = RoleDAO()
+            return [
+                await dao.query(session, filters={"name": name}, single=True)
+                for name in names
+            ]
+
+    return [str(role.role_id) for role in run(find)]
+
+
+def get_many(run, db, ids: list) -> list:
+    async def load():
+        async with db.read() as session:
+            return await RoleDAO().get_many(session, ids)
+
+    return [None if role is None else str(role.role_id) for role in run(load)]
+
+
+def role_queries(queries) -> list:
+    return [statement for statement in queries if "\nFROM role \nWHERE" in statement]
+
+
+def test_misses_are_loaded_with_one_query(client, run, db, queries):
+    first, second, third = create_roles(client, run, db, 3)
+    missing = str(uuid4())
+    queries.clear()
+
+    ids = [first, missing, second, third, first]
+
+    assert get_many(run, db, ids) == [first, None, second, third, first]
+    assert len(role_queries(queries)) == 1
+
+
+def test_cached_ids_are_not_queried_again(client, run, db, queries):
+    first, second, third = create_roles(client, run, db, 3)
+    get_many(run, db, [first])
+    queries.clear()
+
+    assert get_many(run, db, [first, second, third]) == [first, second, third]
+    (statement,) = role_queries(queries)
+    assert statement.count("?") == 2
+
+    queries.clear()
+    assert get_many(run, db, [third, second, first]) == [third, second, first]
+    assert role_queries(queries) == []
+
+
+def test_entries_are_shared_with_get(client, run, db, queries):
+    (role_id,) = create_roles(client, run, db, 1)
+    get_many(run, db, [role_id])
+    queries.clear()
+
+    async def get():
+        async with db.read() as session:
+            return await RoleDAO().get(session, role_id)
+
+    assert str(run(get).role_id) == role_id
+    assert role_queries(queries) == []
+    assert model_cache.stats["local_hits"] >= 1
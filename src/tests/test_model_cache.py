@@ -0,0 +1,123 @@
+from uuid import uuid4
+
+from app.cache.cacheTier import model_cache
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def create_role(client, run, db):
+    """Create a role through the API and return it."""
+    name = f"cache-{uuid4().hex[:8]}"
+    assert client.post("/roles/", json={"name": name}).status_code == 201
+
+    async def find():
+        async with db.write() as session:
+            return await RoleDAO().query(session, filters={"name": name}, single=True)
+
+    return run(find)
+
+
+def read(run, session_factory, operation):
+    async def call():
+        async with session_factory() as session:
+            return await operation(RoleDAO(), session)
+
+    return run(call)
+
+
+def role_ids(result) -> list:
+    roles = result if isinstance(result, list) else [result]
+    return [str(role.role_id) for role in roles]
+
+
+def test_reads_are_served_from_the_local_tier(client, run, db, queries):
+    role = create_role(client, run, db)
+    role_id = str(role.role_id)
+    operations = [
+        lambda dao, session: dao.get(session, role_id),
+        lambda dao, session: dao.get_all(session, limit=5),
+        lambda dao, session: dao.query(session, filters={"name": role.name}),
+    ]
+
+    for operation in operations:
+        first = read(run, db.read, operation)
+        queries.clear()
+        second = read(run, db.read, operation)
+
+        assert queries == []
+        assert role_ids(first) == role_ids(second)
+
+    assert model_cache.stats["local_hits"] == 3
+
+
+def test_write_sessions_read_the_database(client, run, db, queries):
+    role_id = str(create_role(client, run, db).role_id)
+
+    read(run, db.write, lambda dao, session: dao.get(session, role_id))
+    queries.clear()
+    read(run, db.write, lambda dao, session: dao.get(session, role_id))
+
+    assert queries
+    assert model_cache.stats["local_hits"] == 0
+
+
+def test_redis_backfills_other_processes(client, run, db, queries, redis):
+    role_id = str(create_role(client, run, db).role_id)
+    read(run, db.read, lambda dao, session: dao.get(session, role_id))
+
+    # another process: empty local tier, same Redis
+    model_cache.local.clear()
+    queries.clear()
+    role = read(run, db.read, lambda dao, session: dao.get(session, role_id))
+
+    assert str(role.role_id) == role_id
+    assert queries == []
+    assert model_cache.stats["redis_hits"] == 1
+
+
+def get(role_id: str):
+    return lambda dao, session: dao.get(session, role_id)
+
+
+def get_all(dao, session):
+    return dao.get_all(session, limit=1000)
+
+
+def by_name(name: str):
+    return lambda dao, session: dao.query(session, filters={"name": name})
+
+
+def test_writes_retire_cached_lists_and_queries(client, run, db, queries):
+    role = create_role(client, run, db)
+    read(run, db.read, get_all)
+    read(run, db.read, by_name(role.name))
+
+    created = create_role(client, run, db)
+    queries.clear()
+
+    assert str(created.role_id) in role_ids(read(run, db.read, get_all))
+    assert role_ids(read(run, db.read, by_name(role.name))) == [str(role.role_id)]
+    assert len(queries) >= 2
+
+
+def test_writes_to_embedded_models_retire_cached_reads(client, run, db, queries):
+    role_id = str(create_role(client, run, db).role_id)
+    read(run, db.read, get(role_id))
+
+    # roles embed their permissions
+    name = f"cache-{uuid4().hex[:8]}"
+    assert client.post("/permissions/", json={"name": name}).status_code == 201
+    queries.clear()
+    read(run, db.read, get(role_id))
+
+    assert queries
+
+
+def test_unrelated_writes_keep_cached_reads(client, run, db, queries):
+    role_id = str(create_role(client, run, db).role_id)
+    read(run, db.read, get(role_id))
+
+    run(lambda: model_cache.invalidate(tags=["Questionnaire"]))
+    queries.clear()
+    read(run, db.read, get(role_id))
+
+    assert queries == []
@@ -0,0 +1,117 @@
+from uuid import uuid4
+
+import pytest
+
+from app.cache.cacheTier import model_cache
+from app.core.errors import RecordNotFoundException
+from app.modules.auth.models.user import User
+from app.modules.auth.enums.user_enums import GenderEnum
+from app.modules.auth.dao.user_dao import UserDAO
+
+
+def find_by_email(run, session_factory, email: str):
+    async def find():
+        async with session_factory() as session:
+            return await UserDAO().query(session, filters={"email": email}, single=True)
+
+    return run(find)
+
+
+def get_by_id(run, session_factory, user_id):
+    async def get():
+        async with session_factory() as session:
+            return await UserDAO().get(session, user_id)
+
+    return run(get)
+
+
+def create_user(run, db, email: str, user_id=None) -> User:
+    """Create a user the way the DAO's writes do (commit, then after_write)."""
+
+    async def write():
+        async with db.write() as session:
+            dao = UserDAO()
+            async with dao.unit_of_work(session):
+                user = User(
+                    user_id=user_id or uuid4(),
+                    first_name="Negative",
+                    last_name="Cache",
+                    email=email,
+                    phone_number="000",
+                    identification_number="000",
+                    photo_url="",
+                    gender=GenderEnum.other,
+                )
+                session.add(user)
+                await dao.after_write(session, [user])
+            return user
+
+    return run(write)
+
+
+def email() -> str:
+    return f"negative-{uuid4().hex[:8]}@example.com"
+
+
+def user_queries(queries) -> list:
+    return [statement for statement in queries if "\nFROM users \nWHERE" in statement]
+
+
+def test_missing_emails_are_remembered(run, db, queries):
+    address = email()
+
+    assert find_by_email(run, db.read, address) is None
+    queries.clear()
+    assert find_by_email(run, db.read, address) is None
+
+    assert user_queries(queries) == []
+    assert model_cache.stats["negative_stored"] == 1
+
+
+def test_missing_ids_are_remembered(run, db, queries):
+    user_id = str(uuid4())
+
+    with pytest.raises(RecordNotFoundException):
+        get_by_id(run, db.read, user_id)
+    queries.clear()
+    with pytest.raises(RecordNotFoundException):
+        get_by_id(run, db.read, user_id)
+
+    assert user_queries(queries) == []
+
+
+def test_creating_the_record_clears_its_negative_entries(run, db):
+    address, user_id = email(), uuid4()
+    assert find_by_email(run, db.read, address) is None
+    with pytest.raises(RecordNotFoundException):
+        get_by_id(run, db.read, str(user_id))
+
+    create_user(run, db, address, user_id)
+
+    assert find_by_email(run, db.read, address).user_id == user_id
+    assert get_by_id(run, db.read, str(user_id)).email == address
+
+
+def test_negative_entries_do_not_hide_rows_staged_in_a_unit_of_work(run, db):
+    address = email()
+    assert find_by_email(run, db.write, address) is None
+
+    async def create_and_find():
+        async with db.write() as session:
+            dao = UserDAO()
+            async with dao.unit_of_work(session):
+                session.add(
+                    User(
+                        first_name="Negative",
+                        last_name="Cache",
+                        email=address,
+                        phone_number="000",
+                        identification_number="000",
+                        photo_url="",
+                        gender=GenderEnum.other,
+                    )
+                )
+                await session.flush()
+                return await dao.query(session, filters={"email": address}, single=True)
+
+    assert run(create_and_find).email == address
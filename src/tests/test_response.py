@@ -0,0 +1,14 @@
+from uuid import uuid4
+
+
+def test_models_without_a_response_schema_are_encoded(client):
+    # Permissions has no PermissionsResponse schema
+    name = f"response-{uuid4().hex[:8]}"
+    assert client.post("/permissions/", json={"name": name}).status_code == 201
+
+    response = client.get("/permissions/?limit=1000")
+
+    assert response.status_code == 200
+    permission = next(p for p in response.json()["data"] if p["name"] == name)
+    assert permission["permission_id"]
+    assert not any(key.startswith("_sa") for key in permission)
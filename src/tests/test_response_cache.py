@@ -0,0 +1,104 @@
+import time
+from types import SimpleNamespace
+from uuid import uuid4
+
+import app.cache.cacheResponse as cache_response
+from app.core.config import settings
+from app.cache.cacheTier import model_cache
+from app.cache.cacheResponse import response_cache
+from app.modules.auth.dao.role_dao import RoleDAO
+from app.modules.forms.models.questionnaire import Questionnaire
+
+URL = "/permissions/?limit=1000"
+
+
+def create_permission(client) -> str:
+    name = f"response-{uuid4().hex[:8]}"
+    assert client.post("/permissions/", json={"name": name}).status_code == 201
+
+    # later reads come from a client outside its read-your-writes window
+    client.cookies.clear()
+    return name
+
+
+def names(response) -> set:
+    assert response.status_code == 200
+    return {permission["name"] for permission in response.json()["data"]}
+
+
+def generation(run, model: str) -> int:
+    async def get():
+        return (await model_cache.get_generations([model]))[0]
+
+    return run(get)
+
+
+def test_repeated_reads_are_served_from_the_cache(client):
+    create_permission(client)
+
+    first, second = client.get(URL), client.get(URL)
+
+    assert first.content == second.content
+    assert response_cache.stats["misses"] == 1
+    assert response_cache.stats["hits"] == 1
+
+
+def test_writes_retire_cached_responses(client):
+    create_permission(client)
+    client.get(URL)
+
+    name = create_permission(client)
+
+    assert name in names(client.get(URL))
+    assert response_cache.stats["hits"] == 0
+
+
+def test_expired_entries_are_misses(client, monkeypatch):
+    create_permission(client)
+    client.get(URL)
+
+    later = time.time() + settings.CACHE_RESPONSE_TTL + 1
+    monkeypatch.setattr(cache_response, "time", SimpleNamespace(time=lambda: later))
+    client.get(URL)
+
+    assert response_cache.stats["hits"] == 0
+    assert response_cache.stats["misses"] == 2
+
+
+def test_clients_reading_their_writes_bypass_the_cache(client):
+    create_permission(client)
+    client.get(URL)
+
+    # the write pins this client to the primary
+    name = f"response-{uuid4().hex[:8]}"
+    client.post("/permissions/", json={"name": name})
+    pinned = client.get(URL)
+
+    assert name in names(pinned)
+    assert response_cache.stats["bypassed"] == 1
+    assert response_cache.stats["hits"] == 0
+
+
+def test_responses_are_cached_per_authorization(client):
+    create_permission(client)
+
+    client.get(URL, headers={"Authorization": "Bearer one"})
+    client.get(URL, headers={"Authorization": "Bearer two"})
+    client.get(URL, headers={"Authorization": "Bearer one"})
+
+    assert response_cache.stats["misses"] == 2
+    assert response_cache.stats["hits"] == 1
+
+
+def test_models_written_outside_the_daos_are_retired_on_commit(run, db):
+    before = generation(run, "Questionnaire")
+
+    async def write():
+        async with db.write() as session:
+            dao = RoleDAO()
+            async with dao.unit_of_work(session):
+                Questionnaire.stage_cache_invalidation(session.sync_session)
+
+    run(write)
+
+    assert generation(run, "Questionnaire") > before
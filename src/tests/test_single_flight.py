@@ -0,0 +1,110 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.cache.cacheFlight import SingleFlight
+from app.cache.cacheTier import model_cache
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def create_role(client, run, db) -> str:
+    name = f"flight-{uuid4().hex[:8]}"
+    assert client.post("/roles/", json={"name": name}).status_code == 201
+
+    async def find():
+        async with db.write() as session:
+            return await RoleDAO().query(session, filters={"name": name}, single=True)
+
+    return str(run(find).role_id)
+
+
+def role_queries(queries) -> list:
+    return [statement for statement in queries if "\nFROM role \nWHERE" in statement]
+
+
+def test_concurrent_misses_load_once(client, run, db, queries):
+    role_id = create_role(client, run, db)
+    queries.clear()
+
+    async def get():
+        async with db.read() as session:
+            return await RoleDAO().get(session, role_id)
+
+    async def read_concurrently():
+        return await asyncio.gather(*(get() for _ in range(5)))
+
+    roles = run(read_concurrently)
+
+    assert {str(role.role_id) for role in roles} == {role_id}
+    assert len(role_queries(queries)) == 1
+
+
+def test_stale_entry_is_served_while_another_process_rebuilds(
+    client, run, db, queries, redis
+):
+    role_id = create_role(client, run, db)
+    dao = RoleDAO()
+
+    async def get():
+        async with db.read() as session:
+            return await dao.get(session, role_id)
+
+    async def expire_and_lock():
+        key = await dao.cache_key("get", role_id, 0, 100, None)
+        entry = await model_cache.get(key)
+        await model_cache.set(key, entry.value, ttl=-1)
+        assert await model_cache.acquire_lock(key)
+
+    run(get)
+    run(expire_and_lock)
+    queries.clear()
+
+    role = run(get)
+
+    assert str(role.role_id) == role_id
+    assert role_queries(queries) == []
+    assert model_cache.stats["stale_served"] == 1
+
+
+def test_waiters_retry_when_the_first_call_fails(run):
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise RuntimeError("load failed")
+        return "loaded"
+
+    async def call_concurrently():
+        return await asyncio.gather(
+            flight.do("key", load), flight.do("key", load), return_exceptions=True
+        )
+
+    first, second = run(call_concurrently)
+
+    assert isinstance(first, RuntimeError)
+    assert second == ("loaded", False)
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize("callers", [2, 10])
+def test_coalesced_callers_share_the_result(run, callers):
+    flight = SingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return object()
+
+    async def call_concurrently():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(callers)))
+
+    results = run(call_concurrently)
+
+    assert len(calls) == 1
+    assert len({id(result) for result, _ in results}) == 1
+    assert [shared for _, shared in results].count(False) == 1
@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.dbSlowQuery import SlowQueryLog
+
+
+class Cursor:
+    """DBAPI cursor failing every statement that starts with one of fail."""
+
+    def __init__(self, executed: list, fail: tuple = ()):
+        self.executed = executed
+        self.fail = fail
+
+    def execute(self, statement, parameters=None):
+        self.executed.append(statement)
+        if statement.startswith(self.fail):
+            raise RuntimeError(f"{statement} failed")
+
+    def fetchall(self):
+        return [("Seq Scan",)]
+
+    def close(self):
+        pass
+
+
+def postgres(executed: list, fail: tuple = ()):
+    return SimpleNamespace(
+        dialect=SimpleNamespace(name="postgresql"),
+        connection=SimpleNamespace(cursor=lambda: Cursor(executed, fail)),
+    )
+
+
+@pytest.mark.parametrize(
+    "fail", ["SAVEPOINT", "EXPLAIN", ("EXPLAIN", "ROLLBACK"), "RELEASE"]
+)
+def test_explain_never_raises(fail):
+    executed = []
+
+    plan = SlowQueryLog().explain(postgres(executed, fail), "SELECT 1", ())
+
+    assert isinstance(plan, list)
+    if "EXPLAIN" in fail:
+        assert executed[-1] == "ROLLBACK TO SAVEPOINT slow_query_explain"
+
+
+def test_analyze_is_off_by_default():
+    executed = []
+
+    SlowQueryLog().explain(postgres(executed), "SELECT 1", ())
+    SlowQueryLog(analyze=True).explain(postgres(executed), "SELECT 1", ())
+
+    assert "EXPLAIN SELECT 1" in executed
+    assert "EXPLAIN (ANALYZE, BUFFERS) SELECT 1" in executed
@@ -0,0 +1,88 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.core.config import settings
+from app.core.lifespan import db_manager
+from app.db.dbStartup import StartupCoordinator
+
+
+@pytest.fixture(autouse=True)
+def startup_id(monkeypatch):
+    # a fresh deploy per test
+    monkeypatch.setattr(settings, "STARTUP_ID", uuid4().hex)
+
+
+def coordinator(calls: list, delay: float = 0.0, fail: bool = False):
+    async def task():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError("task failed")
+
+    coordinator = StartupCoordinator(db_manager.db_module, poll_interval=0.01)
+    coordinator.add_leader_task("task", task)
+
+    return coordinator
+
+
+def test_one_worker_runs_the_tasks(run):
+    calls = []
+    workers = [coordinator(calls, delay=0.2) for _ in range(3)]
+
+    async def start():
+        await asyncio.gather(*(worker.run() for worker in workers))
+
+    run(start)
+
+    assert calls == [1]
+    assert [worker.is_leader for worker in workers].count(True) == 1
+    assert all(worker.ready for worker in workers)
+
+
+def test_lock_winner_rechecks_the_record(run, monkeypatch):
+    calls = []
+    run(coordinator(calls).run)
+
+    # read "not ready" just before the previous leader recorded its run
+    late = coordinator(calls)
+    checks = iter([False])
+    is_marked_ready = late.is_marked_ready
+
+    async def stale_first_check():
+        return next(checks, None) or await is_marked_ready()
+
+    monkeypatch.setattr(late, "is_marked_ready", stale_first_check)
+    run(late.run)
+
+    assert calls == [1]
+    assert not late.is_leader
+
+
+def test_restart_of_the_same_deploy_skips_the_tasks(run, monkeypatch):
+    calls = []
+    run(coordinator(calls).run)
+
+    restarted = coordinator(calls)
+    run(restarted.run)
+    assert calls == [1]
+    assert not restarted.is_leader
+
+    monkeypatch.setattr(settings, "STARTUP_ID", uuid4().hex)
+    redeployed = coordinator(calls)
+    run(redeployed.run)
+    assert calls == [1, 1]
+    assert redeployed.is_leader
+
+
+def test_failed_leader_is_replaced(run):
+    calls = []
+    with pytest.raises(RuntimeError):
+        run(coordinator(calls, fail=True).run)
+
+    replacement = coordinator(calls)
+    run(replacement.run)
+
+    assert calls == [1, 1]
+    assert replacement.is_leader
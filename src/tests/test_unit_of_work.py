@@ -0,0 +1,52 @@
+from uuid import uuid4
+
+import pytest
+
+from app.cache.cacheTier import model_cache
+from app.modules.auth.models.role import Role
+from app.modules.auth.dao.role_dao import RoleDAO
+
+
+def count_roles(run, db, name: str) -> int:
+    async def count():
+        async with db.write() as session:
+            return len(await RoleDAO().query(session, filters={"name": name}))
+
+    return run(count)
+
+
+def test_cache_failure_after_commit_does_not_fail_the_write(
+    client, run, db, monkeypatch
+):
+    async def broken_invalidate(*args, **kwargs):
+        raise RuntimeError("cache down")
+
+    monkeypatch.setattr(model_cache, "invalidate", broken_invalidate)
+    name = f"uow-{uuid4().hex[:8]}"
+
+    response = client.post("/roles/", json={"name": name, "alias": "a"})
+
+    assert response.status_code == 201
+    assert count_roles(run, db, name) == 1
+
+
+def test_error_inside_the_block_rolls_everything_back(run, db, monkeypatch):
+    dao = RoleDAO()
+    commits = []
+    monkeypatch.setattr(
+        dao, "after_commit", lambda db_session: commits.append(db_session)
+    )
+    name = f"uow-{uuid4().hex[:8]}"
+
+    async def write():
+        async with db.write() as session:
+            async with dao.unit_of_work(session):
+                session.add(Role(name=name))
+                await session.flush()
+                raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        run(write)
+
+    assert count_roles(run, db, name) == 0
+    assert commits == []